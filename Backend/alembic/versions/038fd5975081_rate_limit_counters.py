@@ -0,0 +1,38 @@
+"""rate limit counters
+
+Revision ID: 038fd5975081
+Revises: d248a62cbd13
+Create Date: 2026-10-17 15:12:09.418372
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '038fd5975081'
+down_revision: Union[str, Sequence[str], None] = 'd248a62cbd13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('rate_limit_counters',
+    sa.Column('key', sa.String(), nullable=False),
+    sa.Column('window_id', sa.BigInteger(), nullable=False, server_default='0'),
+    sa.Column('current_count', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('previous_count', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('expires_at', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('key'),
+    prefixes=['UNLOGGED']
+    )
+    op.create_index('ix_rate_limit_counters_expires_at', 'rate_limit_counters', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_rate_limit_counters_expires_at', table_name='rate_limit_counters')
+    op.drop_table('rate_limit_counters')
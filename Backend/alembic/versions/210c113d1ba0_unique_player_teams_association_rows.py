@@ -0,0 +1,46 @@
+"""unique player_teams_association rows
+
+Revision ID: 210c113d1ba0
+Revises: f6b9e8bf2183
+Create Date: 2026-10-17 10:12:41.381204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '210c113d1ba0'
+down_revision: Union[str, Sequence[str], None] = 'f6b9e8bf2183'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Remove duplicated associations so the unique constraint can be created
+    op.execute("""
+        DELETE FROM player_teams_association a
+        USING player_teams_association b
+        WHERE a.player_id = b.player_id
+          AND a.team_id = b.team_id
+          AND a.season = b.season
+          AND a.players_teams_id > b.players_teams_id
+    """)
+    # Needed by the bulk loader's INSERT ... ON CONFLICT (player_id, team_id, season)
+    op.create_unique_constraint(
+        'uq_player_teams_association_player_team_season',
+        'player_teams_association',
+        ['player_id', 'team_id', 'season']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        'uq_player_teams_association_player_team_season',
+        'player_teams_association',
+        type_='unique'
+    )
@@ -0,0 +1,44 @@
+"""player_teams_association covering indexes
+
+Revision ID: 2415f64956b2
+Revises: 84cea2d5c284
+Create Date: 2026-10-17 12:21:06.913482
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2415f64956b2'
+down_revision: Union[str, Sequence[str], None] = '84cea2d5c284'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Roster query: filter on (team_id, season), join on player_id -> index-only scan
+    op.create_index(
+        'ix_player_teams_association_team_season',
+        'player_teams_association',
+        ['team_id', 'season'],
+        unique=False,
+        postgresql_include=['player_id']
+    )
+    # Player career lookups: filter on player_id, read (season, team_id)
+    op.create_index(
+        'ix_player_teams_association_player_season',
+        'player_teams_association',
+        ['player_id', 'season'],
+        unique=False,
+        postgresql_include=['team_id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_player_teams_association_player_season', table_name='player_teams_association')
+    op.drop_index('ix_player_teams_association_team_season', table_name='player_teams_association')
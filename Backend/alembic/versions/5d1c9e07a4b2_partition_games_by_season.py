@@ -0,0 +1,125 @@
+"""partition games by season
+
+Revision ID: 5d1c9e07a4b2
+Revises: 61f0389e1886
+Create Date: 2026-10-17 18:02:13.208561
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1c9e07a4b2'
+down_revision: Union[str, Sequence[str], None] = '61f0389e1886'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partitions created up front; later seasons are created by the games ingestion
+FIRST_SEASON = 1980
+LAST_SEASON = 2026
+
+SEASON_FORMAT = '^[0-9]{4}-[0-9]{2}$'
+
+GAMES_COLUMNS = 'game_id, date, home_team_id, away_team_id, home_team_score, away_team_score, season'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("ALTER TABLE games RENAME TO games_unpartitioned")
+    op.execute("ALTER INDEX ix_games_game_id RENAME TO ix_games_unpartitioned_game_id")
+
+    op.create_table('games',
+    sa.Column('game_id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.DateTime(), nullable=False),
+    sa.Column('home_team_id', sa.Integer(), nullable=False),
+    sa.Column('away_team_id', sa.Integer(), nullable=False),
+    sa.Column('home_team_score', sa.Integer(), nullable=True),
+    sa.Column('away_team_score', sa.Integer(), nullable=True),
+    sa.Column('season', sa.String(), nullable=False),
+    sa.CheckConstraint(f"season ~ '{SEASON_FORMAT}'", name='ck_games_season_format'),
+    sa.ForeignKeyConstraint(['away_team_id'], ['teams.team_id'], ),
+    sa.ForeignKeyConstraint(['home_team_id'], ['teams.team_id'], ),
+    sa.PrimaryKeyConstraint('season', 'game_id', name='pk_games'),
+    postgresql_partition_by='LIST (season)'
+    )
+    # Created on the parent, so every partition gets its own copy
+    op.create_index(op.f('ix_games_game_id'), 'games', ['game_id'], unique=False)
+    op.create_index('ix_games_date_brin', 'games', ['date'], unique=False, postgresql_using='brin')
+
+    # One partition per season. Besides its list bound, each partition gets a
+    # CHECK on the season's date window (September to the end of October of
+    # the next year, wide enough for late playoffs such as 2020), so constraint
+    # exclusion also skips seasons for queries that only filter on date.
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION ensure_games_partition(p_season text) RETURNS text
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            partition_name text := 'games_' || replace(p_season, '-', '_');
+            start_year int;
+        BEGIN
+            IF p_season !~ '{SEASON_FORMAT}' THEN
+                RAISE EXCEPTION 'Invalid season: %', p_season;
+            END IF;
+            IF to_regclass(partition_name) IS NULL THEN
+                start_year := left(p_season, 4)::int;
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF games (CONSTRAINT %I CHECK (date >= %L AND date < %L)) FOR VALUES IN (%L)',
+                    partition_name, partition_name || '_date_window',
+                    make_date(start_year, 9, 1), make_date(start_year + 1, 11, 1), p_season
+                );
+            END IF;
+            RETURN partition_name;
+        END
+        $$
+    """)
+
+    op.execute(f"""
+        SELECT ensure_games_partition(year || '-' || right((year + 1)::text, 2))
+        FROM generate_series({FIRST_SEASON}, {LAST_SEASON}) AS year
+    """)
+    op.execute(f"""
+        SELECT ensure_games_partition(season)
+        FROM (SELECT DISTINCT season FROM games_unpartitioned WHERE season ~ '{SEASON_FORMAT}') AS seasons
+    """)
+
+    # Rows with a malformed season cannot be placed in a partition and are dropped
+    op.execute(f"""
+        INSERT INTO games ({GAMES_COLUMNS})
+        SELECT {GAMES_COLUMNS} FROM games_unpartitioned
+        WHERE season ~ '{SEASON_FORMAT}'
+        ORDER BY date, game_id
+    """)
+    op.drop_table('games_unpartitioned')
+    op.execute("ANALYZE games")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE games RENAME TO games_partitioned")
+    op.execute("ALTER INDEX ix_games_game_id RENAME TO ix_games_partitioned_game_id")
+
+    op.create_table('games',
+    sa.Column('game_id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.DateTime(), nullable=False),
+    sa.Column('home_team_id', sa.Integer(), nullable=False),
+    sa.Column('away_team_id', sa.Integer(), nullable=False),
+    sa.Column('home_team_score', sa.Integer(), nullable=True),
+    sa.Column('away_team_score', sa.Integer(), nullable=True),
+    sa.Column('season', sa.String(), nullable=False),
+    sa.ForeignKeyConstraint(['away_team_id'], ['teams.team_id'], ),
+    sa.ForeignKeyConstraint(['home_team_id'], ['teams.team_id'], ),
+    sa.PrimaryKeyConstraint('game_id')
+    )
+    op.create_index(op.f('ix_games_game_id'), 'games', ['game_id'], unique=False)
+
+    op.execute(f"""
+        INSERT INTO games ({GAMES_COLUMNS})
+        SELECT DISTINCT ON (game_id) {GAMES_COLUMNS} FROM games_partitioned
+        ORDER BY game_id
+    """)
+    # Drops every season partition with it
+    op.drop_table('games_partitioned')
+    op.execute("DROP FUNCTION IF EXISTS ensure_games_partition(text)")
@@ -0,0 +1,56 @@
+"""standings table
+
+Revision ID: 61f0389e1886
+Revises: 038fd5975081
+Create Date: 2026-10-17 16:20:41.582907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '61f0389e1886'
+down_revision: Union[str, Sequence[str], None] = '038fd5975081'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('standings',
+    sa.Column('season', sa.String(), nullable=False),
+    sa.Column('team_id', sa.Integer(), nullable=False),
+    sa.Column('conference', sa.String(), nullable=False),
+    sa.Column('wins', sa.Integer(), nullable=False),
+    sa.Column('losses', sa.Integer(), nullable=False),
+    sa.Column('win_pct', sa.Float(), nullable=False),
+    sa.Column('conference_rank', sa.Integer(), nullable=False),
+    sa.Column('league_rank', sa.Integer(), nullable=False),
+    sa.Column('record', sa.String(), nullable=True),
+    sa.Column('home', sa.String(), nullable=True),
+    sa.Column('road', sa.String(), nullable=True),
+    sa.Column('last_10', sa.String(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['team_id'], ['teams.team_id'], ),
+    sa.PrimaryKeyConstraint('season', 'team_id', name='pk_standings')
+    )
+    op.create_index('ix_standings_season_conference_rank', 'standings', ['season', 'conference', 'conference_rank'], unique=False)
+
+    # Version the table for ETags like the others (bump_table_version from d248a62cbd13)
+    op.execute("INSERT INTO table_versions (table_name, version) VALUES ('standings', 1)")
+    op.execute("""
+        CREATE TRIGGER standings_bump_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON standings
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS standings_bump_version ON standings")
+    op.execute("DELETE FROM table_versions WHERE table_name = 'standings'")
+    op.drop_index('ix_standings_season_conference_rank', table_name='standings')
+    op.drop_table('standings')
@@ -0,0 +1,43 @@
+"""players name trigram search index
+
+Revision ID: 84cea2d5c284
+Revises: 87a7937349c1
+Create Date: 2026-10-17 11:40:52.207913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '84cea2d5c284'
+down_revision: Union[str, Sequence[str], None] = '87a7937349c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+
+    # unaccent() is only STABLE, so wrap it in an IMMUTABLE function that can be indexed
+    op.execute("""
+        CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+    """)
+
+    # Serves both the substring (LIKE '%q%') and the word-similarity (<%) player search
+    op.execute("""
+        CREATE INDEX ix_players_player_name_trgm
+        ON players USING gin (f_unaccent(lower(player_name)) gin_trgm_ops)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_players_player_name_trgm")
+    op.execute("DROP FUNCTION IF EXISTS f_unaccent(text)")
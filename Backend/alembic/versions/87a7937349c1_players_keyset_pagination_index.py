@@ -0,0 +1,29 @@
+"""players keyset pagination index
+
+Revision ID: 87a7937349c1
+Revises: 210c113d1ba0
+Create Date: 2026-10-17 11:02:18.554310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '87a7937349c1'
+down_revision: Union[str, Sequence[str], None] = '210c113d1ba0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Lets /players/all?sort=player_name seek on (player_name, player_id) instead of sorting
+    op.create_index('ix_players_player_name_player_id', 'players', ['player_name', 'player_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_players_player_name_player_id', table_name='players')
@@ -0,0 +1,75 @@
+"""bump table versions only on changes
+
+Revision ID: a3e8f2c41b97
+Revises: 5d1c9e07a4b2
+Create Date: 2026-10-17 19:41:08.315274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3e8f2c41b97'
+down_revision: Union[str, Sequence[str], None] = '5d1c9e07a4b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ('teams', 'players', 'player_teams_association', 'standings')
+
+# Transition tables can only be declared on single-event triggers, so each
+# table gets one statement trigger per event (TRUNCATE has no transition table)
+TRANSITION_TRIGGERS = (
+    ('insert', 'INSERT', 'NEW'),
+    ('update', 'UPDATE', 'NEW'),
+    ('delete', 'DELETE', 'OLD'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A statement that wrote no rows (e.g. INSERT ... ON CONFLICT DO NOTHING
+    # on already loaded data) leaves the version, and so every ETag, unchanged
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_table_version_if_changed() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM changed_rows) THEN
+                INSERT INTO table_versions (table_name, version) VALUES (TG_TABLE_NAME, 1)
+                ON CONFLICT (table_name) DO UPDATE SET version = table_versions.version + 1;
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """)
+
+    for table in VERSIONED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_version ON {table}")
+        for suffix, event, transition in TRANSITION_TRIGGERS:
+            op.execute(f"""
+                CREATE TRIGGER {table}_bump_version_{suffix}
+                AFTER {event} ON {table}
+                REFERENCING {transition} TABLE AS changed_rows
+                FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version_if_changed()
+            """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_bump_version_truncate
+            AFTER TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in VERSIONED_TABLES:
+        for suffix, _, _ in TRANSITION_TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_version_{suffix} ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_version_truncate ON {table}")
+        op.execute(f"""
+            CREATE TRIGGER {table}_bump_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+        """)
+    op.execute("DROP FUNCTION IF EXISTS bump_table_version_if_changed()")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Script to backfill the games table.
+
+Loads every game of every season since 1980 with one league-wide game log
+call per season (~45 upstream calls), bulk loaded through COPY. Existing
+games are updated in place, so it is safe to re-run.
+
+Usage:
+    python backfill_games.py              # 1980-81 to the current season
+    python backfill_games.py 2015         # 2015-16 to the current season
+    python backfill_games.py 2015 2019    # 2015-16 to 2019-20
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the src directory to Python path
+current_dir = Path(__file__).parent
+src_dir = current_dir / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from db.games_data import FIRST_SEASON, backfill_games
+from nba_governor import governor
+
+
+async def main():
+    first_season = int(sys.argv[1]) if len(sys.argv) > 1 else FIRST_SEASON
+    last_season = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    print("🏀 NBA Games Backfill Tool")
+    print("=" * 50)
+    result = await backfill_games(first_season, last_season)
+
+    upstream = governor.snapshot()
+    print(f"   • Seasons loaded: {result['seasons_loaded']}")
+    print(f"   • Games loaded: {result['games_loaded']}")
+    print(f"   • Upstream requests: {upstream['requests']} ({upstream['throttled']} throttled)")
+    if not result["success"]:
+        print(f"❌ Failed seasons: {', '.join(result['failed_seasons'])}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Build content-hashed logo variants.
+
+For every team logo in src/logos this generates resized WebP variants (and
+AVIF ones when Pillow was built with AVIF support) next to the original,
+named <abbr>-<size>.<hash>.<ext>. The hash is taken from the encoded bytes of
+the size's variants (WebP and AVIF together, so both keep the same name for
+Accept negotiation), so any change to the logo, the encoder or its settings
+yields a new name and the files can be cached forever. The variants are listed in src/logos/manifest.json, which
+get_team_logo_path() reads.
+
+Usage:
+    python build_logos.py              # generate variants and manifest
+    python build_logos.py --update-db  # also point teams.logo at the hashed URLs
+"""
+
+import argparse
+import asyncio
+import hashlib
+import io
+import json
+import sys
+from pathlib import Path
+
+from PIL import Image, features
+
+# Add the src directory to Python path
+current_dir = Path(__file__).parent
+src_dir = current_dir / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+# Also add the Functions directory to handle imports
+functions_path = src_dir / "Functions"
+if str(functions_path) not in sys.path:
+    sys.path.insert(0, str(functions_path))
+
+from db.static_data import TEAM_LOGO_FILES, LOGOS_DIR, LOGO_MANIFEST_PATH, load_logo_manifest, update_team_logos
+
+LOGO_SIZES = (64, 128, 256)
+HASH_LENGTH = 10
+WEBP_QUALITY = 85
+AVIF_QUALITY = 60
+
+
+def content_hash(*encoded_variants: bytes) -> str:
+    """Hash of the encoded variant files that will be served under the hashed name."""
+    digest = hashlib.sha256()
+    for encoded in encoded_variants:
+        digest.update(hashlib.sha256(encoded).digest())
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def encode(image: Image.Image, image_format: str, **options) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, image_format, **options)
+    return buffer.getvalue()
+
+
+def resize_logo(image: Image.Image, size: int) -> Image.Image:
+    """Fit the logo inside size x size keeping its aspect ratio (never upscales)."""
+    resized = image.copy()
+    resized.thumbnail((size, size), Image.Resampling.LANCZOS)
+    return resized
+
+
+def remove_stale_variants(abbreviation: str, keep: set) -> int:
+    """Delete variants of this team left over from a previous version of the logo."""
+    removed = 0
+    for path in LOGOS_DIR.glob(f"{abbreviation}-*.*.*"):
+        if path.suffix in (".webp", ".avif") and path.name not in keep:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def build_team_logo(abbreviation: str, filename: str, with_avif: bool) -> dict:
+    original_path = LOGOS_DIR / filename
+    original_bytes = original_path.read_bytes()
+
+    with Image.open(original_path) as source:
+        # GIF logos are animated-capable; only the first frame is used
+        source.seek(0)
+        image = source.convert("RGBA")
+
+    variants = {}
+    written = set()
+    for size in LOGO_SIZES:
+        resized = resize_logo(image, size)
+        encoded = {"webp": encode(resized, "WEBP", quality=WEBP_QUALITY, method=6)}
+        if with_avif:
+            encoded["avif"] = encode(resized, "AVIF", quality=AVIF_QUALITY)
+
+        digest = content_hash(*encoded.values())
+        variant = {"width": resized.width, "height": resized.height}
+        for extension, data in encoded.items():
+            name = f"{abbreviation}-{size}.{digest}.{extension}"
+            (LOGOS_DIR / name).write_bytes(data)
+            variant[extension] = name
+            written.add(name)
+
+        variants[str(size)] = variant
+
+    remove_stale_variants(abbreviation, written)
+    return {
+        "abbreviation": abbreviation,
+        "original_bytes": len(original_bytes),
+        "variants": variants,
+    }
+
+
+def build_logos() -> dict:
+    with_avif = features.check("avif")
+    if not with_avif:
+        print("⚠️  Pillow was built without AVIF support, generating WebP only")
+
+    manifest = {}
+    for abbreviation, filename in sorted(TEAM_LOGO_FILES.items()):
+        if not (LOGOS_DIR / filename).exists():
+            print(f"❌ {abbreviation}: {filename} not found, skipping")
+            continue
+        entry = build_team_logo(abbreviation.lower(), filename, with_avif)
+        manifest[filename] = entry
+
+        default_variant = entry["variants"][str(LOGO_SIZES[-1])]
+        variant_bytes = (LOGOS_DIR / default_variant["webp"]).stat().st_size
+        print(f"✅ {abbreviation}: {entry['original_bytes'] / 1024:.1f} KB -> "
+              f"{variant_bytes / 1024:.1f} KB ({default_variant['webp']})")
+
+    with open(LOGO_MANIFEST_PATH, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+    # The manifest is memoized; make update_team_logos() see the new one
+    load_logo_manifest.cache_clear()
+    print(f"\n📝 Wrote {LOGO_MANIFEST_PATH} ({len(manifest)} logos)")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build content-hashed logo variants")
+    parser.add_argument("--update-db", action="store_true",
+                        help="Update teams.logo to the hashed variant URLs")
+    args = parser.parse_args()
+
+    print("🏀 NBA Logo Asset Builder")
+    print("=" * 50)
+    build_logos()
+
+    if args.update_db:
+        print("\n📥 Updating teams.logo...")
+        result = asyncio.run(update_team_logos())
+        if result["success"]:
+            print(f"✅ Logos updated: {result['logos_updated']}")
+        else:
+            print(f"❌ Error: {result['error']}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
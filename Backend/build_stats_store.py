@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Script to build the historical player stats store (Parquet, partitioned by season).
+
+Fetches every player's career totals (PlayerCareerStats) and merges them
+into the store; only season partitions whose content changed are rewritten.
+The same responses back get_player_teams(), so after a run of
+add_players_teams_association.py they are served from the nba_cache
+instead of stats.nba.com.
+
+Usage:
+    python build_stats_store.py              # every player in the database
+    python build_stats_store.py --active     # only players on a roster this season
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add the src directory (and its Functions) to Python path
+current_dir = Path(__file__).parent
+src_dir = current_dir / "src"
+functions_dir = src_dir / "Functions"
+for path in (src_dir, functions_dir):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import pandas as pd
+from sqlalchemy import select
+
+from db.database import async_session
+from db.models import Players, PlayerTeamsAssociation
+from helpfuncs import get_current_season
+from nba_governor import governor
+from players import player
+import stats_store
+
+DEFAULT_CONCURRENCY = 4
+# Players fetched between two merges into the store (bounds memory)
+WRITE_EVERY = 500
+
+
+async def get_player_ids(active_only: bool) -> list:
+    async with async_session() as session:
+        if active_only:
+            query = select(PlayerTeamsAssociation.player_id).where(
+                PlayerTeamsAssociation.season == get_current_season()
+            ).distinct()
+        else:
+            query = select(Players.player_id)
+        result = await session.execute(query.order_by(1))
+        return list(result.scalars().all())
+
+
+async def build_stats_store(active_only: bool, concurrency: int = DEFAULT_CONCURRENCY):
+    player_instance = player()
+    player_ids = await get_player_ids(active_only)
+    print(f"📋 Fetching career stats for {len(player_ids)} players with {concurrency} workers")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    errors = 0
+
+    async def fetch(player_id: int):
+        nonlocal errors
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(player_instance.get_alltime_player_stats, player_id)
+            except Exception as e:
+                print(f"   ❌ Error fetching career stats for player {player_id}: {e}")
+                errors += 1
+                return None
+
+    started = time.monotonic()
+    seasons_written = set()
+    for start in range(0, len(player_ids), WRITE_EVERY):
+        chunk = player_ids[start:start + WRITE_EVERY]
+        frames = [frame for frame in await asyncio.gather(*(fetch(player_id) for player_id in chunk))
+                  if frame is not None and not frame.empty]
+        if frames:
+            result = await asyncio.to_thread(stats_store.write_player_seasons, pd.concat(frames, ignore_index=True))
+            seasons_written.update(result["seasons_written"])
+        upstream = governor.snapshot()
+        print(f"⏱️  [{start + len(chunk)}/{len(player_ids)}] {len(seasons_written)} seasons rewritten · "
+              f"upstream {upstream['requests']} requests at {upstream['rate']:.2f} req/s")
+
+    elapsed = time.monotonic() - started
+    print(f"\n🎉 Stats store updated in {elapsed:.1f}s:")
+    print(f"   • Seasons rewritten: {len(seasons_written)} of {len(stats_store.stored_seasons())} stored")
+    print(f"   • Errors encountered: {errors}")
+    print(f"   • Location: {stats_store.STORE_DIR}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the Parquet store of per-player-season stats.")
+    parser.add_argument("--active", action="store_true",
+                        help="Only players on a roster this season (refreshes the current season)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="Number of upstream requests kept in flight")
+    args = parser.parse_args()
+
+    print("🏀 NBA Historical Stats Store Builder")
+    print("=" * 50)
+    asyncio.run(build_stats_store(args.active, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Show how blocking upstream calls affect the event loop.
+
+A monitor task asks to wake up every few milliseconds and records how late it
+actually runs (event loop lag) while 100 concurrent "requests" fetch the same
+roster. The upstream call is simulated with a blocking sleep so the check
+needs no network:
+
+    - inline:        the blocking call runs directly in the coroutine, as
+                     get_team_roster_by_abbrev used to do
+    - single_flight: the call runs in the upstream thread pool and identical
+                     requests share one fetch
+
+Usage:
+    python check_event_loop_lag.py [--requests 100] [--upstream-seconds 0.1]
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add the src directory to Python path
+src_dir = Path(__file__).parent / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from handler.upstream import SingleFlight
+
+MONITOR_INTERVAL = 0.005
+
+
+class FakeUpstream:
+    """Blocking stand-in for the roster fetch that counts how often it is called."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def fetch_roster(self, team_id: int, season: str) -> list:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.seconds)
+        return [{"team_id": team_id, "season": season}]
+
+
+async def monitor_lag(stop: asyncio.Event, lags: list):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(MONITOR_INTERVAL)
+        lags.append(time.perf_counter() - started - MONITOR_INTERVAL)
+
+
+async def run_scenario(name: str, requests: int, upstream_seconds: float, use_single_flight: bool):
+    upstream = FakeUpstream(upstream_seconds)
+    flight = SingleFlight()
+
+    async def handle_request():
+        if use_single_flight:
+            return await flight.do(("team_roster", 1610612747, "2024-25"), upstream.fetch_roster, 1610612747, "2024-25")
+        return upstream.fetch_roster(1610612747, "2024-25")
+
+    stop = asyncio.Event()
+    lags = []
+    monitor = asyncio.create_task(monitor_lag(stop, lags))
+    await asyncio.sleep(MONITOR_INTERVAL * 2)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*[handle_request() for _ in range(requests)])
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await monitor
+
+    max_lag_ms = max(lags) * 1000 if lags else 0.0
+    print(f"   • {name:<14} upstream calls: {upstream.calls:>3} · "
+          f"max loop lag: {max_lag_ms:8.1f} ms · total: {elapsed:.2f}s · "
+          f"{len(results)} responses")
+    return upstream.calls, max_lag_ms
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Measure event loop lag caused by upstream calls")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--upstream-seconds", type=float, default=0.1)
+    args = parser.parse_args()
+
+    print(f"⏱️  {args.requests} concurrent roster requests, upstream takes {args.upstream_seconds}s")
+    print("=" * 50)
+    await run_scenario("inline", args.requests, args.upstream_seconds, use_single_flight=False)
+    calls, max_lag_ms = await run_scenario("single_flight", args.requests, args.upstream_seconds, use_single_flight=True)
+
+    # The loop must stay responsive for the whole upstream wait and fetch only once
+    if calls == 1 and max_lag_ms < args.upstream_seconds * 1000 / 4:
+        print("✅ One upstream fetch, event loop stayed responsive")
+    else:
+        print("❌ Event loop blocked or requests not coalesced")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
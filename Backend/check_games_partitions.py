@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Script to check that game queries only touch the relevant season partitions.
+
+Runs EXPLAIN (ANALYZE, BUFFERS) for a season query, date-range queries
+inside one season and across a season boundary, and a game lookup, first
+with partition pruning and constraint exclusion enabled and then with both
+disabled (the cost of scanning every season). Exits with status 1 if a query
+scans more partitions than expected.
+
+Run backfill_games.py first so every season partition holds data.
+
+Usage:
+    python check_games_partitions.py [--season 2023-24]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add the src directory to Python path
+src_dir = Path(__file__).parent / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from sqlalchemy.sql import text
+from db.database import async_session
+
+
+def iter_plan_nodes(node: dict):
+    yield node
+    for child in node.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+def build_queries(season: str, game_id: int) -> dict:
+    """(query, max partitions it should touch) per case. Literals, so pruning happens at plan time."""
+    start_year = int(season[:4])
+    return {
+        "season": (
+            f"SELECT * FROM games WHERE season = '{season}' ORDER BY date", 1
+        ),
+        "one month (date range)": (
+            f"SELECT * FROM games WHERE date >= '{start_year + 1}-01-01' AND date < '{start_year + 1}-02-01'", 1
+        ),
+        "across seasons (date range)": (
+            f"SELECT * FROM games WHERE date >= '{start_year + 1}-05-01' AND date < '{start_year + 1}-12-01'", 2
+        ),
+        "game by season and id": (
+            f"SELECT * FROM games WHERE season = '{season}' AND game_id = {game_id}", 1
+        ),
+    }
+
+
+async def explain(session, query: str) -> dict:
+    result = await session.execute(text("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + query))
+    plan_json = result.scalar_one()
+    if isinstance(plan_json, str):
+        plan_json = json.loads(plan_json)
+    plan = plan_json[0]
+    root = plan["Plan"]
+    partitions = {
+        node["Relation Name"] for node in iter_plan_nodes(root)
+        if node.get("Relation Name", "").startswith("games_")
+    }
+    return {
+        "time": plan["Execution Time"],
+        "buffers": root.get("Shared Hit Blocks", 0) + root.get("Shared Read Blocks", 0),
+        "partitions": partitions,
+        "nodes": sorted({node["Node Type"] for node in iter_plan_nodes(root)}),
+    }
+
+
+async def check_games_partitions(season: str) -> bool:
+    print("🔍 Checking partition pruning on the games table...")
+    failures = []
+
+    async with async_session() as session:
+        total_partitions = (await session.execute(text(
+            "SELECT count(*) FROM pg_inherits WHERE inhparent = 'games'::regclass"
+        ))).scalar_one()
+        total_games = (await session.execute(text("SELECT count(*) FROM games"))).scalar_one()
+        game_id = (await session.execute(text(
+            "SELECT min(game_id) FROM games WHERE season = :season"
+        ), {"season": season})).scalar_one() or 0
+        print(f"   • {total_games} games in {total_partitions} season partitions")
+
+        for name, (query, max_partitions) in build_queries(season, game_id).items():
+            pruned = await explain(session, query)
+
+            await session.execute(text("SET LOCAL enable_partition_pruning = off"))
+            await session.execute(text("SET LOCAL constraint_exclusion = off"))
+            unpruned = await explain(session, query)
+            await session.execute(text("SET LOCAL enable_partition_pruning = on"))
+            await session.execute(text("SET LOCAL constraint_exclusion = partition"))
+
+            ok = len(pruned["partitions"]) <= max_partitions
+            status = "✅" if ok else "❌"
+            print(f"\n{status} {name}")
+            print(f"   • Partitions: {len(pruned['partitions'])} of {total_partitions} "
+                  f"({', '.join(sorted(pruned['partitions'])) or 'none'})")
+            print(f"   • Execution time: {pruned['time']:.2f} ms (all partitions: {unpruned['time']:.2f} ms)")
+            print(f"   • Buffers: {pruned['buffers']} (all partitions: {unpruned['buffers']})")
+            print(f"   • Nodes: {', '.join(pruned['nodes'])}")
+            if not ok:
+                failures.append(name)
+
+        await session.rollback()
+
+    if failures:
+        print(f"\n❌ {len(failures)} query(ies) scan more partitions than expected: {', '.join(failures)}")
+        return False
+
+    print("\n✅ Every query touches only the relevant season partitions")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail if a games query scans irrelevant season partitions.")
+    parser.add_argument("--season", default="2023-24", help="Season to query, in 'YYYY-YY' format")
+    args = parser.parse_args()
+
+    ok = asyncio.run(check_games_partitions(args.season))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
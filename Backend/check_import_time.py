@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Script to check the import time of the API and the Functions modules.
+
+Each module is imported in a fresh interpreter with `python -X importtime`
+and the script exits with status 1 if its cumulative import time exceeds the
+budget. The heaviest imports are listed to help find regressions, e.g. an
+eager matplotlib or nba_api.stats.endpoints import.
+
+Usage:
+    python check_import_time.py [--repeat 3]
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+src_dir = Path(__file__).parent / "src"
+
+# Cumulative import-time budgets in milliseconds: (module, working directory)
+IMPORT_BUDGETS_MS = {
+    "main": (1500, src_dir),
+    "players": (800, src_dir / "Functions"),
+    "teams": (800, src_dir / "Functions"),
+    "games": (800, src_dir / "Functions"),
+}
+
+
+def measure_import(module: str, cwd: Path) -> tuple:
+    """Return (cumulative ms of `module`, [(cumulative ms, name)] of every import)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(cwd), capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    imports = []
+    total_ms = None
+    for line in result.stderr.splitlines():
+        # Format: "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        cumulative_ms = int(cumulative) / 1000
+        imports.append((cumulative_ms, name.rstrip()))
+        if name.strip() == module:
+            total_ms = cumulative_ms
+
+    return total_ms, imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail if a module's import time exceeds its budget.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per module; the fastest one is kept")
+    parser.add_argument("--top", type=int, default=8, help="Number of heaviest imports to show")
+    args = parser.parse_args()
+
+    print("⏱️  Checking import time budgets...")
+    failures = []
+
+    for module, (budget_ms, cwd) in IMPORT_BUDGETS_MS.items():
+        runs = [measure_import(module, cwd) for _ in range(args.repeat)]
+        total_ms, imports = min(runs, key=lambda run: run[0])
+
+        status = "✅" if total_ms <= budget_ms else "❌"
+        print(f"\n{status} import {module}: {total_ms:.0f} ms (budget {budget_ms} ms)")
+        for cumulative_ms, name in sorted(imports, reverse=True)[1:args.top + 1]:
+            print(f"   • {cumulative_ms:7.1f} ms {name.strip()}")
+
+        if total_ms > budget_ms:
+            failures.append(module)
+
+    if failures:
+        print(f"\n❌ Over budget: {', '.join(failures)}")
+        sys.exit(1)
+    print("\n✅ All modules within their import budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark the precomputed leaderboards.
+
+Builds every board (all counting stats per game and in total, and all rate
+stats) for a season, then measures:
+    - a top-k read on every board
+    - a simulated game night (players on --games games get one more game of
+      stats) applied incrementally, against rebuilding every board
+and checks that the incrementally updated boards match a full rebuild.
+
+The league is synthetic (--players players) unless --season is given, in
+which case the season is fetched from stats.nba.com with one call.
+
+Usage:
+    python check_leaderboards.py [--players 550] [--games 15] [--k 10] [--season 2024-25]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add the src directory (and its Functions) to Python path
+src_dir = Path(__file__).parent / "src"
+functions_dir = src_dir / "Functions"
+for path in (src_dir, functions_dir):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import league_stats
+from handler.leaders.leaderboards import SeasonLeaders
+from handler.players.season_stats import SeasonStats
+
+TEAMS = [
+    'ATL', 'BOS', 'BKN', 'CHA', 'CHI', 'CLE', 'DET', 'IND', 'MIA', 'MIL', 'NYK', 'ORL', 'PHI', 'TOR', 'WAS',
+    'DAL', 'DEN', 'GSW', 'HOU', 'LAC', 'LAL', 'MEM', 'MIN', 'NOP', 'OKC', 'PHX', 'POR', 'SAC', 'SAS', 'UTA'
+]
+
+# Rough per-game means for synthetic box scores
+PER_GAME_MEANS = {
+    'MIN': 22.0, 'FGA': 8.5, 'FG3A': 3.2, 'FTA': 2.2, 'OREB': 1.0, 'DREB': 3.2,
+    'AST': 2.4, 'TOV': 1.3, 'STL': 0.7, 'BLK': 0.5, 'PF': 1.8,
+}
+
+
+def synthetic_game(rng, players: int) -> pd.DataFrame:
+    """One game of box score stats for `players` players."""
+    game = {name: rng.poisson(mean, players) for name, mean in PER_GAME_MEANS.items()}
+    game['MIN'] = game['MIN'].astype(np.float32)
+    game['FGM'] = rng.binomial(game['FGA'], 0.47)
+    game['FG3A'] = np.minimum(game['FG3A'], game['FGA'])
+    game['FG3M'] = np.minimum(rng.binomial(game['FG3A'], 0.36), game['FGM'])
+    game['FTM'] = rng.binomial(game['FTA'], 0.78)
+    game['REB'] = game['OREB'] + game['DREB']
+    game['PTS'] = 2 * game['FGM'] + game['FG3M'] + game['FTM']
+    game['PLUS_MINUS'] = rng.integers(-15, 16, players)
+    game['GP'] = np.ones(players, dtype=np.int64)
+    return pd.DataFrame(game)
+
+
+def synthetic_totals(rng, players: int, games: int) -> pd.DataFrame:
+    totals = sum(synthetic_game(rng, players) * (rng.random(players) < 0.85)[:, None] for _ in range(games))
+    totals['PLAYER_ID'] = np.arange(players) + 1_600_000
+    totals['PLAYER_NAME'] = [f"Player {index}" for index in range(players)]
+    totals['TEAM_ID'] = 0
+    totals['TEAM_ABBREVIATION'] = [TEAMS[index % len(TEAMS)] for index in range(players)]
+    totals['AGE'] = rng.integers(19, 40, players).astype(np.float32)
+    return totals[list(league_stats.TOTALS_DTYPES)].astype(league_stats.TOTALS_DTYPES)
+
+
+def play_game_night(rng, totals: pd.DataFrame, games: int) -> pd.DataFrame:
+    """Totals after `games` more games, each adding a box score for 2 x 10 players."""
+    played = rng.choice(len(totals), size=min(games * 20, len(totals)), replace=False)
+    box_scores = synthetic_game(rng, len(played))
+    updated = totals.copy()
+    for name in box_scores.columns:
+        column = updated.columns.get_loc(name)
+        updated.iloc[played, column] = (updated[name].to_numpy()[played] + box_scores[name].to_numpy()).astype(
+            league_stats.TOTALS_DTYPES[name]
+        )
+    return updated
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark leaderboard reads and incremental updates.")
+    parser.add_argument("--players", type=int, default=550, help="Players in the synthetic league")
+    parser.add_argument("--games", type=int, default=15, help="Games in the simulated game night")
+    parser.add_argument("--k", type=int, default=10, help="Leaders read per board")
+    parser.add_argument("--season", help="Use this season's real stats ('YYYY-YY') instead of a synthetic league")
+    args = parser.parse_args()
+    rng = np.random.default_rng(7)
+
+    print("🏀 Leaderboards benchmark")
+    print("=" * 50)
+    if args.season:
+        totals = league_stats.get_league_player_totals(args.season)
+        season = args.season
+    else:
+        totals = synthetic_totals(rng, args.players, games=40)
+        season = "2024-25"
+
+    stats = SeasonStats(season, league_stats.compute_league_stats(totals))
+    leaders, build_seconds = timed(SeasonLeaders, stats)
+    print(f"   • {stats.size} players, {len(leaders.boards)} boards built in {build_seconds * 1000:.1f} ms")
+
+    print(f"\n📊 Top-{args.k} read per board (median of 200 reads):")
+    for (stat, mode), board in leaders.boards.items():
+        samples = []
+        for _ in range(200):
+            started = time.perf_counter_ns()
+            board.top_json(args.k)
+            samples.append(time.perf_counter_ns() - started)
+        print(f"   • {stat:<8} {mode:<9} {statistics.median(samples) / 1000:6.2f} µs  ({len(board)} qualified)")
+
+    night_totals = play_game_night(rng, totals, args.games)
+    night_stats = SeasonStats(season, league_stats.compute_league_stats(night_totals))
+    result, apply_seconds = timed(leaders.apply, night_stats)
+    rebuilt, rebuild_seconds = timed(SeasonLeaders, night_stats)
+
+    print(f"\n🌙 Game night ({args.games} games):")
+    print(f"   • Incremental update: {apply_seconds * 1000:.2f} ms, {result['entries_moved']} entries moved, "
+          f"{result['boards_rendered']} boards re-rendered")
+    print(f"   • Full rebuild: {rebuild_seconds * 1000:.2f} ms")
+
+    mismatches = [
+        key for key, board in leaders.boards.items()
+        if board.top_json(len(board)) != rebuilt.boards[key].top_json(len(board))
+    ]
+    if mismatches:
+        print(f"\n❌ Incremental boards differ from a rebuild: {mismatches}")
+        sys.exit(1)
+    print("\n✅ Incremental boards match a full rebuild")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Script to check the query plans of the hot API queries.
+
+Runs EXPLAIN (ANALYZE, BUFFERS) for each query built in handler/*/service.py
+and exits with status 1 if any of them does a sequential scan on a large table.
+
+By default a table is "large" when the planner statistics estimate at least
+--min-rows rows. With --strict, sequential scans are disabled for the session
+and every table counts as large, which checks that an index path exists even
+on a small development database.
+
+Usage:
+    python check_query_plans.py [--min-rows 1000] [--strict]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add the src directory to Python path
+src_dir = Path(__file__).parent / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import text
+from db.database import async_session
+from handler.players import service as players_service
+from handler.teams import service as teams_service
+
+
+def compile_query(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def iter_plan_nodes(node: dict):
+    yield node
+    for child in node.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+async def build_hot_queries(session) -> dict:
+    """Build the service queries with realistic parameters taken from the database."""
+    player_row = (await session.execute(text(
+        "SELECT player_id, player_name FROM players ORDER BY player_id LIMIT 1"
+    ))).first()
+    association_row = (await session.execute(text(
+        "SELECT team_id, season FROM player_teams_association LIMIT 1"
+    ))).first()
+
+    player_id, player_name = player_row if player_row else (0, "jokic")
+    team_id, season = association_row if association_row else (1610612747, "2024-25")
+    search = players_service.normalize_search_text(player_name)[:4]
+
+    return {
+        "players page (player_id)": players_service.players_page_query("player_id", {"id": player_id}, 101),
+        "players page (player_name)": players_service.players_page_query(
+            "player_name", {"id": player_id, "v": player_name}, 101
+        ),
+        "player by id": players_service.player_by_id_query(player_id),
+        "players by ids": players_service.players_by_ids_query([player_id, player_id + 1, player_id + 2]),
+        "player search": players_service.player_search_query(search, 10),
+        "team roster": teams_service.team_roster_query(team_id, season),
+    }
+
+
+async def check_query_plans(min_rows: int, strict: bool) -> bool:
+    print("🔍 Checking query plans of the hot API queries...")
+    failures = []
+
+    async with async_session() as session:
+        if strict:
+            await session.execute(text("SET LOCAL enable_seqscan = off"))
+
+        row_estimates = dict((await session.execute(text(
+            "SELECT relname, reltuples::bigint FROM pg_class "
+            "WHERE relkind IN ('r', 'p') AND relnamespace = 'public'::regnamespace"
+        ))).all())
+        large_tables = {
+            name for name, rows in row_estimates.items() if strict or rows >= min_rows
+        }
+
+        for name, query in (await build_hot_queries(session)).items():
+            result = await session.execute(text(
+                "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + compile_query(query)
+            ))
+            plan_json = result.scalar_one()
+            if isinstance(plan_json, str):
+                plan_json = json.loads(plan_json)
+            plan = plan_json[0]
+            root = plan["Plan"]
+
+            seq_scans = [
+                node["Relation Name"] for node in iter_plan_nodes(root)
+                if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in large_tables
+            ]
+            node_types = sorted({node["Node Type"] for node in iter_plan_nodes(root)})
+
+            status = "❌" if seq_scans else "✅"
+            print(f"\n{status} {name}")
+            print(f"   • Execution time: {plan['Execution Time']:.2f} ms")
+            print(f"   • Buffers: {root.get('Shared Hit Blocks', 0)} hit, {root.get('Shared Read Blocks', 0)} read")
+            print(f"   • Nodes: {', '.join(node_types)}")
+            if seq_scans:
+                print(f"   • Sequential scan on: {', '.join(seq_scans)}")
+                failures.append(name)
+
+        await session.rollback()
+
+    if failures:
+        print(f"\n❌ {len(failures)} query plan(s) scan large tables sequentially: {', '.join(failures)}")
+        return False
+
+    print("\n✅ No sequential scans on large tables")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail if a hot API query sequentially scans a large table.")
+    parser.add_argument("--min-rows", type=int, default=1000,
+                        help="Estimated row count from which a table counts as large")
+    parser.add_argument("--strict", action="store_true",
+                        help="Disable sequential scans and treat every table as large")
+    args = parser.parse_args()
+
+    ok = asyncio.run(check_query_plans(args.min_rows, args.strict))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
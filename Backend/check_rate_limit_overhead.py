@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Measure the per-request overhead of the rate limiter.
+
+Builds three minimal FastAPI apps with the same trivial route: one without
+rate limiting, one with the CostLimiter charge used by the API, and (if
+slowapi is installed) one with SlowAPIMiddleware plus @limiter.limit as the
+API used before. Each app is called directly through ASGI, so the numbers
+leave out networking and only show what the limiter adds. All limiters use
+in-memory storage with a budget high enough never to reject.
+
+Usage:
+    python check_rate_limit_overhead.py [--requests 20000]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from fastapi import FastAPI, Request, Response
+
+# Add the src directory to Python path
+src_dir = Path(__file__).parent / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from handler.rate_limiter import COST_LOOKUP, CostLimiter
+
+UNLIMITED = "100000000/minute"
+
+
+def build_baseline_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/item")
+    async def item(request: Request):
+        return Response(b"ok")
+
+    return app
+
+
+def build_cost_limiter_app() -> FastAPI:
+    app = FastAPI()
+    limiter = CostLimiter(budget=UNLIMITED, storage_uri="memory://")
+
+    @app.get("/item")
+    @limiter.cost(COST_LOOKUP)
+    async def item(request: Request):
+        await limiter.charge(request)
+        return Response(b"ok")
+
+    return app
+
+
+def build_slowapi_app():
+    try:
+        from slowapi import Limiter
+        from slowapi.middleware import SlowAPIMiddleware
+        from slowapi.util import get_remote_address
+    except ImportError:
+        return None
+
+    app = FastAPI()
+    limiter = Limiter(key_func=get_remote_address, strategy="sliding-window-counter")
+    app.state.limiter = limiter
+    app.add_middleware(SlowAPIMiddleware)
+
+    @app.get("/item")
+    @limiter.limit(UNLIMITED)
+    async def item(request: Request):
+        return Response(b"ok")
+
+    return app
+
+
+async def call(app, scope: dict):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def time_app(app, requests: int) -> float:
+    """Average microseconds per request."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/item",
+        "raw_path": b"/item",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost")],
+        "client": ("10.0.0.1", 50000),
+        "server": ("localhost", 8000),
+    }
+    # Warm up (builds the middleware stack, fills caches)
+    for _ in range(200):
+        await call(app, dict(scope))
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await call(app, dict(scope))
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Measure rate limiter overhead per request")
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    print("⏱️  Rate limiter overhead")
+    print("=" * 50)
+
+    baseline = await time_app(build_baseline_app(), args.requests)
+    print(f"   • No limiter:            {baseline:8.1f} µs/request")
+
+    cost_limiter = await time_app(build_cost_limiter_app(), args.requests)
+    print(f"   • CostLimiter:           {cost_limiter:8.1f} µs/request (+{cost_limiter - baseline:.1f} µs)")
+
+    slowapi_app = build_slowapi_app()
+    if slowapi_app is None:
+        print("   • slowapi not installed, skipping comparison")
+        return
+    slowapi = await time_app(slowapi_app, args.requests)
+    print(f"   • slowapi (middleware):  {slowapi:8.1f} µs/request (+{slowapi - baseline:.1f} µs)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Check that a rate limit storage enforces one global limit across processes.
+
+Starts several worker processes that all hit the same limit key as fast as
+they can, the way separate uvicorn workers would for one client, and checks
+that the total number of accepted hits equals the limit. With memory:// every
+process counts on its own and the check fails by a factor of --workers.
+
+Usage:
+    python check_rate_limits.py --storage redis://localhost:6379
+    python check_rate_limits.py --storage postgresql://
+    python check_rate_limits.py --storage memory://   # shows the per-process problem
+"""
+
+import argparse
+import multiprocessing
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add the src directory to Python path
+src_dir = Path(__file__).parent / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+
+def run_worker(storage_uri: str, key: str, limit: int, attempts: int, start_at: float, results):
+    from limits import RateLimitItemPerHour
+    from limits.storage import storage_from_string
+    from limits.strategies import SlidingWindowCounterRateLimiter
+
+    # Registers the postgresql:// scheme
+    import handler.rate_limit_storage  # noqa: F401
+
+    rate_limiter = SlidingWindowCounterRateLimiter(storage_from_string(storage_uri))
+    # An hour-long window so the run never straddles a window boundary
+    item = RateLimitItemPerHour(limit)
+
+    # Start all workers together so their hits interleave
+    time.sleep(max(0.0, start_at - time.time()))
+    accepted = sum(1 for _ in range(attempts) if rate_limiter.hit(item, key))
+    results.put(accepted)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check global rate limits across worker processes")
+    parser.add_argument("--storage", default="memory://", help="Rate limit storage URI")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--attempts", type=int, default=200, help="Hits per worker")
+    args = parser.parse_args()
+
+    print(f"🔍 {args.workers} workers x {args.attempts} hits against a limit of {args.limit} ({args.storage})")
+
+    key = f"check-{uuid.uuid4().hex[:8]}"
+    results = multiprocessing.Queue()
+    start_at = time.time() + 1.0
+    workers = [
+        multiprocessing.Process(
+            target=run_worker,
+            args=(args.storage, key, args.limit, args.attempts, start_at, results)
+        )
+        for _ in range(args.workers)
+    ]
+    for worker in workers:
+        worker.start()
+    accepted = [results.get(timeout=120) for _ in workers]
+    for worker in workers:
+        worker.join()
+
+    total = sum(accepted)
+    print(f"   • Accepted per worker: {accepted}")
+    print(f"   • Accepted total: {total} (limit {args.limit})")
+    if total == args.limit:
+        print("✅ Limit enforced globally")
+    else:
+        print("❌ Limit not enforced globally")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
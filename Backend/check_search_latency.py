@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark the fuzzy player search as the players table grows.
+
+Inserts synthetic players (first and last names drawn from lists that include
+accented spellings) in steps up to each size in --sizes, runs ANALYZE, and
+times the /players/search query (service.player_search_query) for a set of
+exact, partial, misspelled and unaccented queries. Everything runs in one
+transaction that is rolled back, so the database is left unchanged.
+
+Exits with status 1 if the p99 latency at the largest size is more than
+--max-growth times the p99 at the smallest size, i.e. if search latency does
+not stay flat as the table grows.
+
+Usage:
+    python check_search_latency.py [--sizes 1000,10000,100000] [--repeat 50] [--max-growth 3]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the src directory to Python path
+src_dir = Path(__file__).parent / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from sqlalchemy.sql import text
+from db.database import async_session
+from handler.players import service as players_service
+
+# Synthetic player ids start far above real NBA ids
+SYNTHETIC_ID_START = 900_000_000
+
+FIRST_NAMES = [
+    "Nikola", "Luka", "Giannis", "Joel", "Jayson", "Stephen", "Kevin", "LeBron", "Anthony", "Jimmy",
+    "Dario", "Bogdan", "Jusuf", "Goran", "Tomáš", "José", "Álex", "Nicolás", "Dāvis", "Jonas",
+]
+LAST_NAMES = [
+    "Jokić", "Dončić", "Antetokounmpo", "Embiid", "Tatum", "Curry", "Durant", "James", "Davis", "Butler",
+    "Šarić", "Bogdanović", "Nurkić", "Dragić", "Satoranský", "Calderón", "Abrines", "Laprovíttola",
+    "Bertāns", "Valančiūnas", "Smith", "Johnson", "Williams", "Brown", "Jones",
+]
+
+SEARCH_QUERIES = ["jokic", "doncic", "antetok", "curry", "bogdanovic", "valanciunas", "embid", "smith"]
+
+INSERT_SYNTHETIC_PLAYERS = text("""
+    WITH names AS (
+        SELECT CAST(:first_names AS text[]) AS first_names, CAST(:last_names AS text[]) AS last_names
+    )
+    INSERT INTO players (player_id, player_name, birth_date, rookie_season)
+    SELECT
+        CAST(:id_start AS integer) + i,
+        first_names[1 + (i * 7919) % cardinality(first_names)] || ' '
+            || last_names[1 + (i * 104729) % cardinality(last_names)]
+            || CASE WHEN i % 3 = 0 THEN '' ELSE ' ' || (i % 997)::text END,
+        DATE '1980-01-01' + (i % 9000),
+        2000 + i % 25
+    FROM names, generate_series(CAST(:first AS integer), CAST(:last AS integer)) AS i
+""")
+
+
+def percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+async def time_searches(session, repeat: int, limit: int) -> list:
+    """Milliseconds per search query, `repeat` rounds over SEARCH_QUERIES."""
+    samples = []
+    for _ in range(repeat):
+        for query in SEARCH_QUERIES:
+            started = time.perf_counter()
+            result = await session.execute(players_service.player_search_query(query, limit))
+            result.scalars().all()
+            samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+async def check_search_latency(sizes: list, repeat: int, limit: int, max_growth: float) -> bool:
+    print("🔍 Benchmarking player search latency by table size...")
+    results = []
+
+    async with async_session() as session:
+        try:
+            inserted = 0
+            for size in sizes:
+                await session.execute(INSERT_SYNTHETIC_PLAYERS, {
+                    "id_start": SYNTHETIC_ID_START,
+                    "first_names": FIRST_NAMES,
+                    "last_names": LAST_NAMES,
+                    "first": inserted + 1,
+                    "last": size,
+                })
+                inserted = size
+                await session.execute(text("ANALYZE players"))
+                total = (await session.execute(text("SELECT count(*) FROM players"))).scalar_one()
+
+                # Warm up the plan and the index pages before timing
+                await time_searches(session, 1, limit)
+                samples = await time_searches(session, repeat, limit)
+                p50, p99 = statistics.median(samples), percentile(samples, 0.99)
+                results.append((size, p99))
+                print(f"   • {size:>7} synthetic rows ({total} total): p50 {p50:6.2f} ms · p99 {p99:6.2f} ms")
+        finally:
+            await session.rollback()
+
+    smallest, largest = results[0][1], results[-1][1]
+    growth = largest / smallest if smallest else 0.0
+    print(f"\n📈 p99 growth from {results[0][0]} to {results[-1][0]} rows: {growth:.2f}x")
+    if growth > max_growth:
+        print(f"❌ Search p99 grew more than {max_growth}x")
+        return False
+    print("✅ Search latency stays flat as the table grows")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark player search latency at growing table sizes.")
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="Comma-separated synthetic row counts, increasing")
+    parser.add_argument("--repeat", type=int, default=50, help="Rounds over the search queries per size")
+    parser.add_argument("--limit", type=int, default=10, help="Search result limit")
+    parser.add_argument("--max-growth", type=float, default=3.0,
+                        help="Maximum allowed p99 ratio between the largest and smallest size")
+    args = parser.parse_args()
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+
+    print("🏀 Player search latency benchmark")
+    print("=" * 50)
+    ok = asyncio.run(check_search_latency(sizes, args.repeat, args.limit, args.max_growth))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
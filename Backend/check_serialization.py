@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of list response serialization.
+
+Serializes synthetic player rows (ORM-like objects with the Players columns)
+to JSON bytes the ways the API has done it:
+    - fastapi default: model_validate per row, then jsonable_encoder and
+      json.dumps (what FastAPI does for a response_model without a Response)
+    - double pass: validate_list in the service, then validated again by
+      dump_list_json in the route
+    - single pass: dump_list_json straight from the ORM rows (list_response)
+    - pre-validated: dump_models_json of instances a service already
+      validated (models_response); the validation is not timed again
+
+and reports the time per row at each size in --sizes. No database needed.
+
+Usage:
+    python check_serialization.py [--sizes 1000,10000] [--repeat 20]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+from fastapi.encoders import jsonable_encoder
+
+# Add the src directory to Python path
+src_dir = Path(__file__).parent / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from db.schemas import PlayerResponse
+from handler.serialization import dump_list_json, dump_models_json, validate_list
+
+
+def synthetic_rows(count: int) -> list:
+    return [
+        SimpleNamespace(
+            player_id=1_600_000 + index,
+            player_name=f"Player {index}",
+            position="Guard" if index % 2 else None,
+            height="6-6",
+            weight="215",
+            birth_date=datetime(1990, 1, 1) + timedelta(days=index % 5000),
+            school="Somewhere University" if index % 3 else None,
+            rookie_season=2000 + index % 25,
+        )
+        for index in range(count)
+    ]
+
+
+def fastapi_default(rows: list) -> bytes:
+    models = [PlayerResponse.model_validate(row) for row in rows]
+    return json.dumps(jsonable_encoder(models)).encode("utf-8")
+
+
+def double_pass(rows: list) -> bytes:
+    return dump_list_json(PlayerResponse, validate_list(PlayerResponse, rows))
+
+
+def single_pass(rows: list) -> bytes:
+    return dump_list_json(PlayerResponse, rows)
+
+
+def median_seconds(fn, arg, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(arg)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark list response serialization per row.")
+    parser.add_argument("--sizes", default="1000,10000", help="Comma-separated row counts")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per case (median reported)")
+    args = parser.parse_args()
+
+    print("🏀 List serialization benchmark")
+    print("=" * 50)
+    for size in (int(size) for size in args.sizes.split(",")):
+        rows = synthetic_rows(size)
+        validated = validate_list(PlayerResponse, rows)
+        outputs = [fastapi_default(rows), double_pass(rows), single_pass(rows), dump_models_json(PlayerResponse, validated)]
+        if any(json.loads(output) != json.loads(outputs[0]) for output in outputs[1:]):
+            print(f"❌ Serializers disagree at {size} rows")
+            sys.exit(1)
+
+        cases = {
+            "fastapi default": (fastapi_default, rows),
+            "double pass": (double_pass, rows),
+            "single pass (ORM rows)": (single_pass, rows),
+            "pre-validated": (lambda items: dump_models_json(PlayerResponse, items), validated),
+        }
+        print(f"\n📊 {size} rows (median of {args.repeat} runs):")
+        baseline = None
+        for name, (fn, arg) in cases.items():
+            seconds = median_seconds(fn, arg, args.repeat)
+            baseline = baseline or seconds
+            print(f"   • {name:<24} {seconds * 1e6 / size:6.2f} µs/row  ({baseline / seconds:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
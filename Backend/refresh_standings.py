@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Script to refresh the standings table.
+
+Fetches the standings of all 30 teams in one upstream call and upserts them.
+Meant to be run on a schedule (cron, or the API's background scheduler).
+
+Usage:
+    python refresh_standings.py          # current season
+    python refresh_standings.py 2023     # 2023-24 season
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the src directory to Python path
+current_dir = Path(__file__).parent
+src_dir = current_dir / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from db.standings_data import refresh_standings
+
+
+async def main():
+    season = sys.argv[1] if len(sys.argv) > 1 else None
+
+    print("🏀 NBA Standings Refresh Tool")
+    print("=" * 50)
+    result = await refresh_standings(season)
+
+    if result["success"]:
+        print(f"✅ Standings refreshed for {result['season']}")
+        print(f"   • Teams updated: {result['teams_updated']}")
+    else:
+        print("❌ Standings refresh failed!")
+        print(f"   • Error: {result['error']}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
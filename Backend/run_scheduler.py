@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Background refresh worker.
+
+Runs the refresh scheduler (standings, games, rosters) in its own process instead
+of inside the API (SCHEDULER_ENABLED=1). Any number of workers and API
+replicas can run it; a Postgres advisory lock elects a single leader.
+
+Usage:
+    python run_scheduler.py
+"""
+
+import asyncio
+import signal
+import sys
+from pathlib import Path
+
+# Add the src directory to Python path
+current_dir = Path(__file__).parent
+src_dir = current_dir / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from jobs.refresh_jobs import scheduler
+
+
+async def main():
+    print("🏀 NBA Refresh Scheduler")
+    print("=" * 50)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await scheduler.start()
+    try:
+        await stop.wait()
+    finally:
+        print("🛑 Stopping scheduler...")
+        await scheduler.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
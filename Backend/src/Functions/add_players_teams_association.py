@@ -17,124 +17,207 @@ if str(backend_src_dir) not in sys.path:
     sys.path.insert(0, str(backend_src_dir))
 
 from db.database import async_session
+from db.bulk_load import bulk_load, DEFAULT_BATCH_SIZE
 from db.models import Players, Teams, PlayerTeamsAssociation
 from db.schemas import PlayerTeamAssociationCreate
 from players import player
+from nba_governor import INITIAL_RATE, governor
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
 
-async def populate_player_teams_associations():
+# Ingestion tuning: number of upstream requests kept in flight. The request
+# rate itself is set (and adapted) by the process-wide nba_governor.
+DEFAULT_CONCURRENCY = 4
+DEFAULT_COMMIT_EVERY = 50
+PROGRESS_EVERY = 25
+
+ASSOCIATION_COLUMNS = ('player_id', 'team_id', 'season')
+
+
+async def _fetch_worker(player_instance, players_queue: asyncio.Queue, results_queue: asyncio.Queue):
+    """
+    Pull players from players_queue, fetch their team history off the event loop
+    and push (player, dataframe | None, error | None) to results_queue.
+    Upstream calls are paced by the outbound governor.
+    """
+    while True:
+        player_obj = await players_queue.get()
+        try:
+            if player_obj is None:
+                return
+            try:
+                player_teams_df = await asyncio.to_thread(player_instance.get_player_teams, player_obj.player_id)
+                await results_queue.put((player_obj, player_teams_df, None))
+            except Exception as e:
+                await results_queue.put((player_obj, None, e))
+        finally:
+            players_queue.task_done()
+
+
+async def _flush_associations(session, records: list, batch_size: int, stats: dict):
+    """
+    Bulk load buffered (player_id, team_id, season) records and commit.
+    Associations that already exist are skipped by ON CONFLICT DO NOTHING.
+    """
+    if not records:
+        return
+    load_result = await bulk_load(
+        session,
+        PlayerTeamsAssociation.__tablename__,
+        ASSOCIATION_COLUMNS,
+        records,
+        conflict_columns=ASSOCIATION_COLUMNS,
+        batch_size=batch_size
+    )
+    await session.commit()
+    stats["associations_added"] += load_result["rows_written"]
+    stats["associations_skipped"] += load_result["rows_skipped"]
+    records.clear()
+
+
+async def _write_associations(session, results_queue: asyncio.Queue, total_players: int, commit_every: int, batch_size: int, stats: dict):
+    """
+    Single DB writer: consume fetched team histories and bulk load the associations
+    every commit_every players, reporting progress/throughput.
+    """
+    started = time.monotonic()
+    processed = 0
+    records = []
+
+    while True:
+        item = await results_queue.get()
+        if item is None:
+            break
+
+        player_obj, player_teams_df, error = item
+        processed += 1
+
+        if error is not None:
+            print(f"   ❌ Error processing player {player_obj.player_name}: {error}")
+            stats["errors"] += 1
+        elif player_teams_df.empty:
+            print(f"   ⚠️  No team history found for {player_obj.player_name}")
+        else:
+            for _, row in player_teams_df.iterrows():
+                try:
+                    player_id = int(row['PLAYER_ID'])
+                    team_id = int(row['TEAM_ID'])
+                    season = str(row['SEASON_ID'])
+
+                    # Skip invalid team IDs (NBA API sometimes returns 0 for special cases)
+                    if team_id == 0:
+                        continue
+
+                    records.append((player_id, team_id, season))
+
+                except Exception as e:
+                    print(f"   ❌ Error processing association for season {row.get('SEASON_ID', 'Unknown')}: {e}")
+                    stats["errors"] += 1
+
+        # Load in batches to avoid memory issues
+        if processed % commit_every == 0:
+            await _flush_associations(session, records, batch_size, stats)
+
+        if processed % PROGRESS_EVERY == 0 or processed == total_players:
+            elapsed = time.monotonic() - started
+            rate = processed / elapsed if elapsed > 0 else 0.0
+            remaining = (total_players - processed) / rate if rate > 0 else 0.0
+            upstream = governor.snapshot()
+            print(f"⏱️  [{processed}/{total_players}] {rate:.2f} players/sec · "
+                  f"{stats['associations_added']} added · ~{remaining:.0f}s remaining · "
+                  f"upstream {upstream['rate']:.2f} req/s, {upstream['queue_depth']} queued")
+
+    await _flush_associations(session, records, batch_size, stats)
+    stats["elapsed_seconds"] = time.monotonic() - started
+    stats["players_processed"] = processed
+
+
+async def populate_player_teams_associations(
+    concurrency: int = DEFAULT_CONCURRENCY,
+    requests_per_second: float = INITIAL_RATE,
+    commit_every: int = DEFAULT_COMMIT_EVERY,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+):
     """
     Populate the player_teams_association table with all player-team relationships.
-    
+
+    Team histories are fetched by a pool of `concurrency` workers paced by the
+    outbound governor; a single writer persists the results.
+
+    Args:
+        concurrency: Number of upstream requests kept in flight
+        requests_per_second: Upstream request rate to start from (NBA_API_RATE by
+            default); the governor then adapts it to what stats.nba.com tolerates
+        commit_every: Number of players processed between bulk loads
+        batch_size: Number of rows copied and merged per round trip
+
     Returns:
         Dictionary with operation results
     """
+    governor.set_rate(requests_per_second)
     try:
         player_instance = player()
-        associations_added = 0
-        associations_skipped = 0
-        errors = 0
-        
+        stats = {"associations_added": 0, "associations_skipped": 0, "errors": 0}
+
         async with async_session() as session:
             # Get all players from database
             players_result = await session.execute(select(Players))
             all_players = players_result.scalars().all()
-            
+
             print(f"📋 Found {len(all_players)} players in database")
-            
-            # Get existing associations to avoid duplicates
-            existing_associations_result = await session.execute(
-                select(PlayerTeamsAssociation.player_id, 
-                       PlayerTeamsAssociation.team_id, 
-                       PlayerTeamsAssociation.season)
+            print(f"🚀 Fetching with {concurrency} workers, starting at {governor.rate:.2f} requests/sec "
+                  f"(adapts up to {governor.max_rate:.2f})")
+
+            # Bounded queues keep memory flat and apply back-pressure to the fetchers
+            players_queue = asyncio.Queue(maxsize=concurrency * 2)
+            results_queue = asyncio.Queue(maxsize=concurrency * 4)
+
+            writer = asyncio.create_task(
+                _write_associations(session, results_queue, len(all_players), commit_every, batch_size, stats)
             )
-            existing_associations = {
-                (row[0], row[1], row[2]) for row in existing_associations_result.fetchall()
-            }
-            
-            print(f"📊 Found {len(existing_associations)} existing associations")
-            
-            # Process each player
-            for idx, player_obj in enumerate(all_players, 1):
-                try:
-                    print(f"\n👤 [{idx}/{len(all_players)}] Processing: {player_obj.player_name} (ID: {player_obj.player_id})")
-                    
-                    # Get player's team history
-                    player_teams_df = player_instance.get_player_teams(player_obj.player_id)
-                    
-                    if player_teams_df.empty:
-                        print(f"   ⚠️  No team history found for {player_obj.player_name}")
-                        continue
-                    
-                    print(f"   📅 Found {len(player_teams_df)} season(s)")
-                    
-                    # Process each team association
-                    for _, row in player_teams_df.iterrows():
-                        try:
-                            player_id = int(row['PLAYER_ID'])
-                            team_id = int(row['TEAM_ID'])
-                            season = str(row['SEASON_ID'])
-                            
-                            # Skip invalid team IDs (NBA API sometimes returns 0 for special cases)
-                            if team_id == 0:
-                                print(f"   ⚠️  Skipped invalid team ID: {season} - Team ID {team_id}")
-                                continue
-                            
-                            # Check if association already exists
-                            if (player_id, team_id, season) in existing_associations:
-                                associations_skipped += 1
-                                continue
-                            
-                            # Create new association record
-                            new_association = PlayerTeamsAssociation(
-                                player_id=player_id,
-                                team_id=team_id,
-                                season=season
-                            )
-                            
-                            session.add(new_association)
-                            existing_associations.add((player_id, team_id, season))  # Track to avoid duplicates in same run
-                            associations_added += 1
-                            
-                            print(f"   ✅ Added: {season} - Team ID {team_id}")
-                            
-                        except Exception as e:
-                            print(f"   ❌ Error processing association for season {row.get('SEASON_ID', 'Unknown')}: {e}")
-                            errors += 1
-                            continue
-                    
-                    # Add delay between players to respect API rate limits
-                    time.sleep(0.8)
-                    
-                    # Commit in batches to avoid memory issues
-                    if idx % 50 == 0:
-                        await session.commit()
-                        print(f"\n💾 Batch commit completed for {idx} players")
-                    
-                except Exception as e:
-                    print(f"   ❌ Error processing player {player_obj.player_name}: {e}")
-                    errors += 1
-                    continue
-            
-            # Final commit
-            await session.commit()
-            
+            workers = [
+                asyncio.create_task(_fetch_worker(player_instance, players_queue, results_queue))
+                for _ in range(concurrency)
+            ]
+
+            async def feed_players():
+                for player_obj in all_players:
+                    await players_queue.put(player_obj)
+                for _ in workers:
+                    await players_queue.put(None)
+                await asyncio.gather(*workers)
+                await results_queue.put(None)
+
+            producer = asyncio.create_task(feed_players())
+            try:
+                # Fails fast if either side raises (e.g. a commit error in the writer)
+                await asyncio.gather(producer, writer)
+            except BaseException:
+                for task in workers + [producer, writer]:
+                    task.cancel()
+                raise
+
+            elapsed = stats["elapsed_seconds"]
+            throughput = stats["players_processed"] / elapsed if elapsed > 0 else 0.0
+
             print(f"\n🎉 Player-Team associations population completed:")
-            print(f"   • Associations added: {associations_added}")
-            print(f"   • Associations skipped (already exist): {associations_skipped}")
-            print(f"   • Errors encountered: {errors}")
-            print(f"   • Players processed: {len(all_players)}")
-            
+            print(f"   • Associations added: {stats['associations_added']}")
+            print(f"   • Associations skipped (already exist): {stats['associations_skipped']}")
+            print(f"   • Errors encountered: {stats['errors']}")
+            print(f"   • Players processed: {stats['players_processed']}")
+            print(f"   • Throughput: {throughput:.2f} players/sec (upstream rate {governor.rate:.2f}/sec) in {elapsed:.1f}s")
+
             return {
                 "success": True,
-                "associations_added": associations_added,
-                "associations_skipped": associations_skipped,
-                "errors": errors,
-                "players_processed": len(all_players)
+                "associations_added": stats["associations_added"],
+                "associations_skipped": stats["associations_skipped"],
+                "errors": stats["errors"],
+                "players_processed": stats["players_processed"],
+                "elapsed_seconds": round(elapsed, 2),
+                "players_per_second": round(throughput, 3)
             }
-            
+
     except Exception as e:
         print(f"❌ Error populating associations table: {e}")
         return {
@@ -268,7 +351,7 @@ async def main():
     # Populate associations table
     print("\n📥 Fetching player-team associations from NBA API...")
     print("⚠️  This will take a significant amount of time due to API rate limits...")
-    print("    (Approximately 1 second per player + processing time)")
+    print(f"    (Starting at {governor.rate:.2f} requests/sec, raised while stats.nba.com keeps up)")
     
     result = await populate_player_teams_associations()
     
@@ -10,7 +10,6 @@ import asyncio
 import sys
 from pathlib import Path
 from datetime import datetime
-import time
 
 # Add the Backend/src directory to Python path
 backend_src_dir = Path(__file__).parent.parent
@@ -18,9 +17,12 @@ if str(backend_src_dir) not in sys.path:
     sys.path.insert(0, str(backend_src_dir))
 
 from db.database import async_session
-from db.models import Players
+from db.bulk_load import bulk_load, DEFAULT_BATCH_SIZE
+from db.models import Players, PlayerTeamsAssociation
 from db.schemas import PlayerCreate
 from players import player
+from helpfuncs import get_current_season
+from nba_api.stats.static import teams as nba_teams
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
@@ -78,97 +80,100 @@ def parse_rookie_season(rookie_season_str: str) -> int:
         return datetime.now().year
 
 
-async def populate_players_table():
+PLAYER_COLUMNS = (
+    'player_id', 'player_name', 'position', 'height', 'weight',
+    'birth_date', 'school', 'rookie_season'
+)
+
+
+ASSOCIATION_COLUMNS = ('player_id', 'team_id', 'season')
+
+
+def build_player_record(player_id, row) -> tuple:
+    """Players row (in PLAYER_COLUMNS order) from a get_team_roster_per_season() row."""
+    return (
+        int(player_id),
+        row['PLAYER'],
+        row.get('POSITION'),
+        row.get('HEIGHT'),
+        row.get('WEIGHT'),
+        parse_birth_date(row['BIRTH_DATE']),
+        row.get('SCHOOL'),
+        parse_rookie_season(row['ROOKIE_SEASON'])
+    )
+
+
+async def populate_players_table(batch_size: int = DEFAULT_BATCH_SIZE):
     """
     Populate the players table with all current NBA players.
     
+    Args:
+        batch_size: Number of rows copied and merged per round trip
+
     Returns:
         Dictionary with operation results
     """
     try:
         player_instance = player()
-        players_added = 0
-        players_skipped = 0
+        player_records = []
         errors = 0
+
+        # Rookie seasons for the whole league in a single upstream call, shared by every roster
+        rookie_seasons_by_id = player_instance.get_rookie_seasons()
         
-        async with async_session() as session:
-            # Get existing player IDs to avoid duplicates
-            existing_players_result = await session.execute(select(Players.player_id))
-            existing_player_ids = {row[0] for row in existing_players_result.fetchall()}
-            
-            print(f"Found {len(existing_player_ids)} existing players in database")
+        # Process each team
+        for team_abbr in teams_list:
+            print(f"\n📋 Processing team: {team_abbr}")
             
-            # Process each team
-            for team_abbr in teams_list:
-                print(f"\n📋 Processing team: {team_abbr}")
+            try:
+                # Get team roster
+                roster_df = player_instance.get_team_roster_per_season(team_abbr, rookie_seasons_by_id=rookie_seasons_by_id)
                 
-                try:
-                    # Get team roster
-                    roster_df = player_instance.get_team_roster_per_season(team_abbr)
-                    
-                    print(f"   Found {len(roster_df)} players on roster")
-                    
-                    # Process each player in the roster
-                    for player_id, row in roster_df.iterrows():
-                        try:
-                            # Skip if player already exists
-                            if player_id in existing_player_ids:
-                                players_skipped += 1
-                                continue
-                            
-                            # Parse birth date
-                            birth_date = parse_birth_date(row['BIRTH_DATE'])
-                            
-                            # Parse rookie season
-                            rookie_season = parse_rookie_season(row['ROOKIE_SEASON'])
-                            
-                            # Create new player record
-                            new_player = Players(
-                                player_id=player_id,
-                                player_name=row['PLAYER'],
-                                position=row.get('POSITION'),
-                                height=row.get('HEIGHT'),
-                                weight=row.get('WEIGHT'),
-                                birth_date=birth_date,
-                                school=row.get('SCHOOL'),
-                                rookie_season=rookie_season
-                            )
-                            
-                            session.add(new_player)
-                            existing_player_ids.add(player_id)  # Track to avoid duplicates in same run
-                            players_added += 1
-                            
-                            print(f"   ✅ Added: {row['PLAYER']} (ID: {player_id})")
-                            
-                        except Exception as e:
-                            print(f"   ❌ Error processing player {row.get('PLAYER', 'Unknown')}: {e}")
-                            errors += 1
-                            continue
-                    
-                    # Add delay between teams to respect API rate limits
-                    time.sleep(2)
-                    
-                except Exception as e:
-                    print(f"   ❌ Error processing team {team_abbr}: {e}")
-                    errors += 1
-                    continue
-            
-            # Commit all changes
+                print(f"   Found {len(roster_df)} players on roster")
+                
+                # Process each player in the roster
+                for player_id, row in roster_df.iterrows():
+                    try:
+                        player_records.append(build_player_record(player_id, row))
+                    except Exception as e:
+                        print(f"   ❌ Error processing player {row.get('PLAYER', 'Unknown')}: {e}")
+                        errors += 1
+                        continue
+                
+            except Exception as e:
+                print(f"   ❌ Error processing team {team_abbr}: {e}")
+                errors += 1
+                continue
+
+        async with async_session() as session:
+            # Existing players are skipped by ON CONFLICT (player_id) DO NOTHING
+            load_result = await bulk_load(
+                session,
+                Players.__tablename__,
+                PLAYER_COLUMNS,
+                player_records,
+                conflict_columns=('player_id',),
+                batch_size=batch_size
+            )
             await session.commit()
-            
-            print(f"\n🎉 Players population completed:")
-            print(f"   • Players added: {players_added}")
-            print(f"   • Players skipped (already exist): {players_skipped}")
-            print(f"   • Errors encountered: {errors}")
-            print(f"   • Total teams processed: {len(teams_list)}")
-            
-            return {
-                "success": True,
-                "players_added": players_added,
-                "players_skipped": players_skipped,
-                "errors": errors,
-                "teams_processed": len(teams_list)
-            }
+
+        players_added = load_result["rows_written"]
+        players_skipped = load_result["rows_skipped"]
+        
+        print(f"\n🎉 Players population completed:")
+        print(f"   • Players added: {players_added}")
+        print(f"   • Players skipped (already exist): {players_skipped}")
+        print(f"   • Errors encountered: {errors}")
+        print(f"   • Total teams processed: {len(teams_list)}")
+        
+        return {
+            "success": True,
+            "players_added": players_added,
+            "players_skipped": players_skipped,
+            "errors": errors,
+            "teams_processed": len(teams_list),
+            "rows_per_second": load_result["rows_per_second"]
+        }
             
     except Exception as e:
         print(f"❌ Error populating players table: {e}")
@@ -178,6 +183,99 @@ async def populate_players_table():
         }
 
 
+def fetch_league_rosters(season: str) -> tuple:
+    """
+    Blocking upstream fetch (requests + pandas) of every team's roster for a season:
+    one CommonAllPlayers call for rookie seasons plus one CommonTeamRoster call per team.
+
+    Returns:
+        (player_records, association_records, errors)
+    """
+    player_instance = player()
+    rookie_seasons_by_id = player_instance.get_rookie_seasons(season)
+    player_records = []
+    association_records = []
+    errors = 0
+
+    for team in nba_teams.get_teams():
+        try:
+            roster_df = player_instance.get_team_roster_per_season(
+                team['abbreviation'], season=season, rookie_seasons_by_id=rookie_seasons_by_id
+            )
+        except Exception as e:
+            print(f"Error fetching roster for {team['abbreviation']} ({season}): {e}")
+            errors += 1
+            continue
+
+        for player_id, row in roster_df.iterrows():
+            try:
+                player_records.append(build_player_record(player_id, row))
+                association_records.append((int(player_id), team['id'], season))
+            except Exception as e:
+                print(f"Error processing player {row.get('PLAYER', 'Unknown')}: {e}")
+                errors += 1
+
+    return player_records, association_records, errors
+
+
+async def refresh_league_rosters(season: str = None, batch_size: int = DEFAULT_BATCH_SIZE):
+    """
+    Incremental roster refresh for a season (the current one by default).
+
+    Only what changed is written: new players are inserted and new
+    (player, team, season) associations record signings and trades. Existing
+    rows are skipped by ON CONFLICT DO NOTHING, so it is safe to run on a schedule.
+
+    Args:
+        season: Season in 'YYYY-YY' format
+        batch_size: Number of rows copied and merged per round trip
+
+    Returns:
+        Dictionary with operation results
+    """
+    season = season or get_current_season()
+    try:
+        # Kept off the event loop when called from the scheduler
+        player_records, association_records, errors = await asyncio.to_thread(fetch_league_rosters, season)
+
+        async with async_session() as session:
+            # Players first: associations reference them
+            players_result = await bulk_load(
+                session,
+                Players.__tablename__,
+                PLAYER_COLUMNS,
+                player_records,
+                conflict_columns=('player_id',),
+                batch_size=batch_size
+            )
+            associations_result = await bulk_load(
+                session,
+                PlayerTeamsAssociation.__tablename__,
+                ASSOCIATION_COLUMNS,
+                association_records,
+                conflict_columns=ASSOCIATION_COLUMNS,
+                batch_size=batch_size
+            )
+            await session.commit()
+
+        print(f"Refreshed rosters for {season}: {players_result['rows_written']} new players, "
+              f"{associations_result['rows_written']} new associations, {errors} errors")
+        return {
+            "success": True,
+            "season": season,
+            "players_added": players_result["rows_written"],
+            "associations_added": associations_result["rows_written"],
+            "errors": errors
+        }
+
+    except Exception as e:
+        print(f"Error refreshing rosters for season {season}: {e}")
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
 async def get_players_from_db():
     """
     Retrieve all players from the database.
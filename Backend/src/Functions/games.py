@@ -1,11 +1,6 @@
 from nba_api.stats.static import teams
-from nba_api.stats.endpoints import commonteamroster
-from nba_api.stats.endpoints import teamgamelog
-from nba_api.stats.endpoints import commonteamroster
-from nba_api.stats.endpoints import leaguestandingsv3
 from datetime import datetime, timezone, timedelta
 from dateutil import parser
-from nba_api.live.nba.endpoints import scoreboard
 
 # Import get_current_season with error handling for different import contexts
 try:
@@ -30,6 +25,18 @@ except ImportError:
             
             season_end = str(season_start + 1)[-2:]  # Get last 2 digits
             return f"{season_start}-{season_end}"
+try:
+    from .nba_cache import fetch_data_frames
+    from .helpfuncs import lazy_module
+except ImportError:
+    from nba_cache import fetch_data_frames
+    from helpfuncs import lazy_module
+
+# nba_api endpoint modules are imported on first use (see helpfuncs.LazyModule)
+teamgamelog = lazy_module("nba_api.stats.endpoints.teamgamelog")
+leaguestandingsv3 = lazy_module("nba_api.stats.endpoints.leaguestandingsv3")
+leaguegamelog = lazy_module("nba_api.stats.endpoints.leaguegamelog")
+scoreboard = lazy_module("nba_api.live.nba.endpoints.scoreboard")
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Tuple, Union, Optional
@@ -50,10 +57,59 @@ def check_valid_season(season: Optional[str] = None) -> str:
     return season
 
 def get_team_game_log( team_id: int, season: str) -> pd.DataFrame:
-    game_log = teamgamelog.TeamGameLog(team_id=team_id, season=season)
-    game_log = game_log.get_data_frames()[0]
+    game_log = fetch_data_frames(teamgamelog.TeamGameLog, team_id=team_id, season=season)[0]
     return game_log
 
+def get_league_game_log(season: str, season_type: str = 'Regular Season') -> pd.DataFrame:
+    """
+    Get every team's game log for a season in a single LeagueGameLog call
+    (two rows per game, one per team), instead of one TeamGameLog call per team.
+
+    Args:
+        season: Season in 'YYYY-YY' format (see check_valid_season)
+        season_type: 'Regular Season' or 'Playoffs'
+
+    Returns:
+        DataFrame with one row per team per game (GAME_ID, GAME_DATE, TEAM_ID, MATCHUP, PTS, ...)
+    """
+    game_log = fetch_data_frames(
+        leaguegamelog.LeagueGameLog,
+        league_id='00',  # NBA
+        season=season,
+        season_type_all_star=season_type,
+        player_or_team_abbreviation='T'
+    )[0]
+    return game_log
+
+def pair_game_rows(game_log: pd.DataFrame) -> pd.DataFrame:
+    """
+    Collapse a league game log into one row per game.
+
+    The home team's row has 'vs.' in MATCHUP ('BOS vs. NYK') and the away
+    team's has '@' ('NYK @ BOS'); the two are joined on GAME_ID. Games without
+    exactly one row per side are dropped.
+
+    Returns:
+        DataFrame with GAME_ID, GAME_DATE, HOME_TEAM_ID, AWAY_TEAM_ID, HOME_PTS, AWAY_PTS,
+        in date order
+    """
+    game_log = game_log[['GAME_ID', 'GAME_DATE', 'TEAM_ID', 'MATCHUP', 'PTS']]
+    is_home = game_log['MATCHUP'].str.contains(' vs. ', regex=False)
+    home = game_log[is_home].drop_duplicates('GAME_ID')
+    away = game_log[~is_home].drop_duplicates('GAME_ID')
+
+    games = home.merge(away, on='GAME_ID', suffixes=('_HOME', '_AWAY'))
+    games = games.rename(columns={
+        'GAME_DATE_HOME': 'GAME_DATE',
+        'TEAM_ID_HOME': 'HOME_TEAM_ID',
+        'TEAM_ID_AWAY': 'AWAY_TEAM_ID',
+        'PTS_HOME': 'HOME_PTS',
+        'PTS_AWAY': 'AWAY_PTS',
+    })
+    # Date order keeps the BRIN index on games.date tight
+    games = games.sort_values(['GAME_DATE', 'GAME_ID'])
+    return games[['GAME_ID', 'GAME_DATE', 'HOME_TEAM_ID', 'AWAY_TEAM_ID', 'HOME_PTS', 'AWAY_PTS']]
+
 def get_todays_games()-> None:
     f = "{gameId}: {awayTeam} @ {homeTeam} : {gameTimeLTZ}" 
     board = scoreboard.ScoreBoard()
@@ -63,6 +119,30 @@ def get_todays_games()-> None:
         gameTimeLTZ = parser.parse(game["gameTimeUTC"]).replace(tzinfo=timezone.utc).astimezone(tz=None)
         print(f.format(gameId=game['gameId'], awayTeam=game['awayTeam']['teamName'], homeTeam=game['homeTeam']['teamName'], gameTimeLTZ=gameTimeLTZ))
 
+# Columns kept from LeagueStandingsV3
+STANDINGS_COLUMNS = [
+    'TeamID', 'TeamCity', 'TeamName', 'Conference', 'WINS', 'LOSSES', 'WinPCT', 'PlayoffRank',
+    'Record', 'HOME', 'ROAD', 'L10'
+]
+
+def get_league_standings(season: str) -> pd.DataFrame:
+    """
+    Get the standings of every team for a season in a single LeagueStandingsV3 call.
+
+    Args:
+        season: Season in 'YYYY-YY' format (see check_valid_season)
+
+    Returns:
+        DataFrame with STANDINGS_COLUMNS, one row per team
+    """
+    standings_df = fetch_data_frames(
+        leaguestandingsv3.LeagueStandingsV3,
+        league_id='00',  # NBA
+        season=season,
+        season_type='Regular Season'
+    )[0]
+    return standings_df[STANDINGS_COLUMNS]
+
 def get_current_standings(season: str = None, conference:str = 'Overall') -> pd.DataFrame:
     """Get current NBA standings for all teams"""
     conference_types = ['Overall','West','East']
@@ -70,21 +150,13 @@ def get_current_standings(season: str = None, conference:str = 'Overall') -> pd.
         if conference in conference_types:
             season = check_valid_season(season)
             
-            standings = leaguestandingsv3.LeagueStandingsV3(
-                league_id='00',  # NBA
-                season=season,
-                season_type='Regular Season'
-            )
-            
-            standings_df = standings.get_data_frames()[0]
-            
             # Select relevant columns
             columns_to_keep = [
                 'TeamID', 'TeamCity', 'TeamName', 'Conference','WINS', 'LOSSES', 'PlayoffRank', 
                 'Record', "HOME","ROAD", "L10"
             ]
             
-            standings_df = standings_df[columns_to_keep]
+            standings_df = get_league_standings(season)[columns_to_keep]
 
             if conference != 'Overall':
                 return standings_df[standings_df['Conference'] == conference]
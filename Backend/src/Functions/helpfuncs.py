@@ -1,3 +1,4 @@
+import importlib
 from datetime import datetime
 
 
@@ -15,4 +16,27 @@ def get_current_season():
         season_start = year
     
     season_end = str(season_start + 1)[-2:]  # Get last 2 digits
-    return f"{season_start}-{season_end}"
\ No newline at end of file
+    return f"{season_start}-{season_end}"
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is only imported on first attribute access.
+
+    Importing any nba_api.stats.endpoints module executes the package __init__,
+    which imports every endpoint; deferring it keeps `import players` cheap.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+def lazy_module(name: str) -> LazyModule:
+    """Return a LazyModule for `name`, e.g. lazy_module("nba_api.stats.endpoints.teamgamelog")."""
+    return LazyModule(name)
@@ -0,0 +1,129 @@
+"""
+League-wide season stats.
+
+The totals of every player in a season come from one LeagueDashPlayerStats
+call (instead of a PlayerDashboardByYearOverYear call per player). Per-game
+averages and shooting rates are then derived for the whole league at once
+with NumPy column operations on compact dtypes.
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .nba_cache import fetch_data_frames
+    from .helpfuncs import lazy_module
+except ImportError:
+    from nba_cache import fetch_data_frames
+    from helpfuncs import lazy_module
+
+# nba_api endpoint modules are imported on first use (see helpfuncs.LazyModule)
+leaguedashplayerstats = lazy_module("nba_api.stats.endpoints.leaguedashplayerstats")
+
+# Season totals kept from LeagueDashPlayerStats, with compact dtypes
+TOTALS_DTYPES = {
+    'PLAYER_ID': 'int32',
+    'PLAYER_NAME': 'string',
+    'TEAM_ID': 'int32',
+    'TEAM_ABBREVIATION': 'string',
+    'AGE': 'float32',
+    'GP': 'int16',
+    'MIN': 'float32',
+    'FGM': 'int16',
+    'FGA': 'int16',
+    'FG3M': 'int16',
+    'FG3A': 'int16',
+    'FTM': 'int16',
+    'FTA': 'int16',
+    'OREB': 'int16',
+    'DREB': 'int16',
+    'REB': 'int16',
+    'AST': 'int16',
+    'TOV': 'int16',
+    'STL': 'int16',
+    'BLK': 'int16',
+    'PF': 'int16',
+    'PTS': 'int16',
+    'PLUS_MINUS': 'int16',
+}
+
+# Per-game average -> season total it is derived from
+PER_GAME_STATS = {
+    'MPG': 'MIN',
+    'PPG': 'PTS',
+    'RPG': 'REB',
+    'ORPG': 'OREB',
+    'DRPG': 'DREB',
+    'APG': 'AST',
+    'SPG': 'STL',
+    'BPG': 'BLK',
+    'TOPG': 'TOV',
+    'FGMPG': 'FGM',
+    'FGAPG': 'FGA',
+    'FG3MPG': 'FG3M',
+    'FTMPG': 'FTM',
+}
+
+RATE_STATS = ('FG_PCT', 'FG3_PCT', 'FT_PCT', 'EFG_PCT', 'TS_PCT', 'AST_TO')
+
+STAT_COLUMNS = [column for column in TOTALS_DTYPES if column not in ('PLAYER_ID', 'PLAYER_NAME', 'TEAM_ID', 'TEAM_ABBREVIATION')]
+STAT_COLUMNS += list(PER_GAME_STATS) + list(RATE_STATS)
+
+
+def get_league_player_totals(season: str) -> pd.DataFrame:
+    """
+    Get the regular season totals of every player in a season in a single call.
+
+    Args:
+        season: Season in 'YYYY-YY' format
+
+    Returns:
+        DataFrame with TOTALS_DTYPES columns, one row per player
+    """
+    totals = fetch_data_frames(
+        leaguedashplayerstats.LeagueDashPlayerStats,
+        season=season,
+        season_type_all_star='Regular Season',
+        per_mode_detailed='Totals',
+        measure_type_detailed_defense='Base',
+    )[0]
+    return totals[list(TOTALS_DTYPES)].astype(TOTALS_DTYPES)
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray, decimals: int) -> np.ndarray:
+    """numerator / denominator as float32, 0 where the denominator is 0."""
+    numerator = numerator.astype(np.float32)
+    denominator = denominator.astype(np.float32)
+    out = np.zeros_like(numerator)
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return np.round(out, decimals)
+
+
+def compute_league_stats(totals: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add per-game averages and shooting rates to league totals, one column operation each.
+
+    Returns:
+        New DataFrame with the totals plus PER_GAME_STATS and RATE_STATS columns (float32)
+    """
+    columns = {name: totals[name].to_numpy() for name in TOTALS_DTYPES}
+    games = columns['GP']
+
+    derived = {
+        average: _ratio(columns[total], games, 1)
+        for average, total in PER_GAME_STATS.items()
+    }
+    derived['FG_PCT'] = _ratio(columns['FGM'], columns['FGA'], 3)
+    derived['FG3_PCT'] = _ratio(columns['FG3M'], columns['FG3A'], 3)
+    derived['FT_PCT'] = _ratio(columns['FTM'], columns['FTA'], 3)
+    # Effective FG% weights threes by 1.5; true shooting counts free throw trips as 0.44 shots
+    derived['EFG_PCT'] = _ratio(columns['FGM'] + np.float32(0.5) * columns['FG3M'], columns['FGA'], 3)
+    derived['TS_PCT'] = _ratio(columns['PTS'], 2 * (columns['FGA'] + np.float32(0.44) * columns['FTA']), 3)
+    derived['AST_TO'] = _ratio(columns['AST'], columns['TOV'], 2)
+
+    return pd.concat([totals.reset_index(drop=True), pd.DataFrame(derived)], axis=1)
+
+
+def fetch_league_stats(season: str) -> pd.DataFrame:
+    """Blocking upstream fetch (requests + pandas) of a season's league-wide stats."""
+    return compute_league_stats(get_league_player_totals(season))
@@ -0,0 +1,211 @@
+"""
+Persistent on-disk cache for nba_api stats endpoint responses.
+
+Responses are stored in a SQLite database keyed by a hash of the endpoint
+name and its parameters, so repeated lookups (and re-runs of the ingestion
+scripts) are served locally instead of going to stats.nba.com.
+
+Expiration depends on the season the request is about:
+    - completed seasons never expire
+    - the current season expires after NBA_CACHE_CURRENT_TTL seconds
+    - requests without a season (career totals, rosters, ...) expire after
+      NBA_CACHE_DEFAULT_TTL seconds
+
+The database is bounded to NBA_CACHE_MAX_BYTES; least recently used entries
+are evicted first.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+try:
+    from .helpfuncs import get_current_season
+    from .nba_governor import check_status, governor
+except ImportError:
+    from helpfuncs import get_current_season
+    from nba_governor import check_status, governor
+
+
+CACHE_DIR = Path(os.getenv("NBA_CACHE_DIR", Path(__file__).resolve().parents[2] / ".cache"))
+CACHE_MAX_BYTES = int(os.getenv("NBA_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+CURRENT_SEASON_TTL = int(os.getenv("NBA_CACHE_CURRENT_TTL", 15 * 60))
+DEFAULT_TTL = int(os.getenv("NBA_CACHE_DEFAULT_TTL", 12 * 60 * 60))
+CACHE_ENABLED = os.getenv("NBA_CACHE_ENABLED", "1") != "0"
+
+# Parameter names nba_api endpoints use for the season being requested
+SEASON_PARAMS = ("season", "season_nullable", "season_year", "season_year_nullable")
+
+
+class ResponseCache:
+    """SQLite-backed, size-bounded LRU cache of endpoint data frames."""
+
+    def __init__(self, path: Path, max_bytes: int = CACHE_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        # Running total of payload bytes, so writes don't SUM() the whole table
+        self._total_bytes = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_responses_last_access ON responses (last_access)")
+            conn.commit()
+            self._total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict) -> str:
+        canonical = json.dumps({"endpoint": endpoint, "params": params}, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[List[pd.DataFrame]]:
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT payload, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            payload, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                conn.commit()
+                self._total_bytes -= len(payload)
+                self.misses += 1
+                return None
+            conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            conn.commit()
+            self.hits += 1
+        return pickle.loads(payload)
+
+    def set(self, key: str, endpoint: str, params: dict, data_frames: List[pd.DataFrame], ttl: Optional[int]):
+        payload = pickle.dumps(data_frames, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock:
+            conn = self._connection()
+            replaced = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, endpoint, params, payload, size, created_at, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, endpoint, json.dumps(params, sort_keys=True, default=str), payload, len(payload), now, expires_at, now),
+            )
+            self._total_bytes += len(payload) - (replaced[0] if replaced else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection):
+        """
+        Drop expired entries, then least recently used ones until under max_bytes.
+        Only runs once the running total is over budget; the total is recounted
+        here since other processes (ingestion scripts) share the database.
+        """
+        conn.execute("DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total > self.max_bytes:
+            for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_access").fetchall():
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                total -= size
+                if total <= self.max_bytes:
+                    break
+        self._total_bytes = total
+
+    def clear(self):
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+            self._total_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            conn = self._connection()
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {"entries": entries, "bytes": size, "hits": self.hits, "misses": self.misses}
+
+
+response_cache = ResponseCache(CACHE_DIR / "nba_api.sqlite3")
+
+
+def ttl_for_params(params: dict) -> Optional[int]:
+    """Return the TTL in seconds for a request, or None if it never expires."""
+    season = next((params[name] for name in SEASON_PARAMS if params.get(name)), None)
+    if season is None:
+        return DEFAULT_TTL
+    if str(season) < get_current_season():
+        return None
+    return CURRENT_SEASON_TTL
+
+
+def _request_data_frames(endpoint_cls, params: dict) -> List[pd.DataFrame]:
+    endpoint = endpoint_cls(**params)
+    check_status(getattr(endpoint.nba_response, "_status_code", None))
+    return endpoint.get_data_frames()
+
+
+def fetch_data_frames(endpoint_cls, **params) -> List[pd.DataFrame]:
+    """
+    Return endpoint_cls(**params).get_data_frames(), served from the on-disk cache when possible.
+    Cache misses go upstream through the outbound governor.
+
+    Args:
+        endpoint_cls: nba_api stats endpoint class (e.g. playercareerstats.PlayerCareerStats)
+        **params: Keyword arguments passed to the endpoint
+
+    Returns:
+        List of DataFrames, one per result set of the endpoint
+    """
+    if not CACHE_ENABLED:
+        return governor.call(_request_data_frames, endpoint_cls, params)
+
+    endpoint = f"{endpoint_cls.__module__}.{endpoint_cls.__name__}"
+    key = ResponseCache.make_key(endpoint, params)
+
+    try:
+        cached = response_cache.get(key)
+    except sqlite3.Error as e:
+        print(f"Warning: NBA API cache read failed for {endpoint}: {e}")
+        cached = None
+    if cached is not None:
+        return cached
+
+    data_frames = governor.call(_request_data_frames, endpoint_cls, params)
+
+    try:
+        response_cache.set(key, endpoint, params, data_frames, ttl_for_params(params))
+    except sqlite3.Error as e:
+        print(f"Warning: NBA API cache write failed for {endpoint}: {e}")
+    return data_frames
@@ -0,0 +1,177 @@
+"""
+Process-wide governor for outbound stats.nba.com requests.
+
+Every nba_api stats call goes through `governor` (fetch_data_frames does this
+for all endpoint calls), so the whole process shares one request budget
+instead of each script sleeping on its own.
+
+The budget is a token bucket whose rate adapts to what upstream tolerates:
+    - every successful request raises the rate by NBA_API_RATE_STEP, up to NBA_API_MAX_RATE
+    - a 429/503 response, a timeout or a dropped connection halves the rate
+      (down to NBA_API_MIN_RATE) and pauses all callers for a growing cooldown,
+      after which the request is retried (NBA_API_MAX_RETRIES times)
+
+Callers are threads (coroutines run their upstream work through
+asyncio.to_thread or the API's upstream pool) and all wait for the same
+bucket. snapshot() reports the current rate and how many callers are queued.
+"""
+
+import os
+import threading
+import time
+
+INITIAL_RATE = float(os.getenv("NBA_API_RATE", 1.25))
+MIN_RATE = float(os.getenv("NBA_API_MIN_RATE", 0.2))
+MAX_RATE = float(os.getenv("NBA_API_MAX_RATE", 5.0))
+RATE_STEP = float(os.getenv("NBA_API_RATE_STEP", 0.05))
+BURST = float(os.getenv("NBA_API_BURST", 2))
+MAX_RETRIES = int(os.getenv("NBA_API_MAX_RETRIES", 3))
+BASE_COOLDOWN = 2.0
+MAX_COOLDOWN = 60.0
+
+# HTTP statuses stats.nba.com uses when it wants us to slow down
+THROTTLE_STATUSES = (429, 503)
+
+
+class UpstreamThrottled(Exception):
+    """stats.nba.com answered with a throttling status (nba_api itself does not raise on these)."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"stats.nba.com responded with HTTP {status_code}")
+        self.status_code = status_code
+
+
+def check_status(status_code):
+    """Raise UpstreamThrottled if an nba_api response status means we are being throttled."""
+    if status_code in THROTTLE_STATUSES:
+        raise UpstreamThrottled(status_code)
+
+
+def is_throttle_error(error: Exception) -> bool:
+    """True if `error` means upstream is throttling us (429/503, timeout or dropped connection)."""
+    if isinstance(error, UpstreamThrottled):
+        return True
+
+    # requests is only imported once a call has failed
+    import requests
+
+    if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        return True
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) in THROTTLE_STATUSES
+
+
+class OutboundGovernor:
+    def __init__(self, rate: float = INITIAL_RATE, min_rate: float = MIN_RATE, max_rate: float = MAX_RATE,
+                 rate_step: float = RATE_STEP, burst: float = BURST, max_retries: int = MAX_RETRIES):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate_step = rate_step
+        self.burst = burst
+        self.max_retries = max_retries
+
+        self._lock = threading.Lock()
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._consecutive_throttles = 0
+
+        self.queue_depth = 0
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self.failed = 0
+
+    def _reserve(self) -> float:
+        """Take one token (possibly going into debt) and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.queue_depth += 1
+            return max(delay, self._paused_until - now)
+
+    def _dequeue(self, started: bool):
+        with self._lock:
+            self.queue_depth -= 1
+            if started:
+                self.in_flight += 1
+
+    def _record_success(self):
+        with self._lock:
+            self.requests += 1
+            self._consecutive_throttles = 0
+            self.rate = min(self.max_rate, self.rate + self.rate_step)
+
+    def _record_failure(self, error: Exception) -> bool:
+        """Record a failed request; returns True if it was throttling (and worth retrying)."""
+        throttled = is_throttle_error(error)
+        with self._lock:
+            self.requests += 1
+            if not throttled:
+                self.failed += 1
+                return False
+            self.throttled += 1
+            self._consecutive_throttles += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            cooldown = min(MAX_COOLDOWN, BASE_COOLDOWN * 2 ** (self._consecutive_throttles - 1))
+            self._paused_until = max(self._paused_until, time.monotonic() + cooldown)
+            # Drop any burst allowance so callers resume at the new rate
+            self._tokens = min(self._tokens, 0.0)
+        print(f"⚠️  stats.nba.com throttling ({type(error).__name__}), "
+              f"rate now {self.rate:.2f} req/s, pausing {cooldown:.1f}s")
+        return True
+
+    def _finish(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def _wait(self):
+        started = False
+        try:
+            time.sleep(self._reserve())
+            started = True
+        finally:
+            self._dequeue(started)
+
+    def call(self, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) when the budget allows, retrying on throttling."""
+        for attempt in range(self.max_retries + 1):
+            self._wait()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if not self._record_failure(e) or attempt == self.max_retries:
+                    raise
+                continue
+            finally:
+                self._finish()
+            self._record_success()
+            return result
+
+    def set_rate(self, rate: float):
+        """Restart the adaptive rate from `rate` requests/sec (clamped to min_rate..max_rate)."""
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        with self._lock:
+            self.rate = min(self.max_rate, max(self.min_rate, rate))
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "rate": round(self.rate, 3),
+                "min_rate": self.min_rate,
+                "max_rate": self.max_rate,
+                "queue_depth": self.queue_depth,
+                "in_flight": self.in_flight,
+                "paused_for": round(max(0.0, self._paused_until - time.monotonic()), 2),
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "failed": self.failed,
+            }
+
+
+governor = OutboundGovernor()
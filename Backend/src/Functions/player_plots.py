@@ -0,0 +1,29 @@
+"""
+Optional plotting helpers for player stats.
+
+Kept out of players.py so matplotlib and seaborn are only imported by code
+that actually plots (notebooks, local analysis), not by the API or the
+ingestion scripts.
+"""
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import seaborn as sns
+from nba_api.stats.static import players
+
+
+def plot_stat_over_career(career_df: pd.DataFrame, player_id: int, stat: str):
+    """Plot `stat` per season from a PlayerCareerStats data frame."""
+    player_name = players.find_player_by_id(player_id)
+    if stat not in career_df.columns:
+        raise ValueError(f"Stat '{stat}' not found in career data.")
+    
+    print(player_name)
+    plt.figure(figsize=(10, 6))
+    sns.lineplot(data=career_df, x='SEASON_ID', y=stat, marker='o')
+    plt.title(f"{player_name['full_name']}'s {stat} Over Career")
+    plt.xlabel('Season')
+    plt.ylabel(stat)
+    plt.xticks(rotation=45)
+    plt.grid() 
+    plt.show()
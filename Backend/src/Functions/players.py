@@ -1,23 +1,17 @@
-from nba_api.stats.endpoints import playercareerstats
-import matplotlib.pyplot as plt
-from nba_api.stats.static import players
-import seaborn as sns
 import pandas as pd
 from json import loads, dumps
-from nba_api.stats.static import players
-from nba_api.stats.endpoints import commonplayerinfo, playercareerstats
-import time
-
+from nba_api.stats.static import teams
 
-pd.set_option("display.max_columns", None)
+from helpfuncs import get_current_season, lazy_module
+from nba_cache import fetch_data_frames
 
-from nba_api.stats.static import teams
-from nba_api.stats.endpoints import commonteamroster
-from nba_api.stats.endpoints import commonteamroster
-from nba_api.live.nba.endpoints import scoreboard
-from nba_api.stats.endpoints import playerdashboardbyyearoveryear
-from nba_api.stats.endpoints import playergamelog
-from helpfuncs import get_current_season
+# nba_api endpoint modules are imported on first use (see helpfuncs.LazyModule)
+commonplayerinfo = lazy_module("nba_api.stats.endpoints.commonplayerinfo")
+playercareerstats = lazy_module("nba_api.stats.endpoints.playercareerstats")
+commonteamroster = lazy_module("nba_api.stats.endpoints.commonteamroster")
+playerdashboardbyyearoveryear = lazy_module("nba_api.stats.endpoints.playerdashboardbyyearoveryear")
+playergamelog = lazy_module("nba_api.stats.endpoints.playergamelog")
+commonallplayers = lazy_module("nba_api.stats.endpoints.commonallplayers")
 
 eastern_conference = {
     'ATL', 'BOS', 'BKN', 'CHA', 'CHI', 'CLE', 'DET', 'IND',
@@ -33,85 +27,94 @@ teams_list = list(eastern_conference.union(western_conference))
 
 class player():
     def get_player_info(self, player_id:int) -> pd.DataFrame:
-        player_info = commonplayerinfo.CommonPlayerInfo(player_id=player_id)
-        info_df = player_info.get_data_frames()[0]
+        info_df = fetch_data_frames(commonplayerinfo.CommonPlayerInfo, player_id=player_id)[0]
         return info_df
     
     def get_player_latest_performance(self, player_id:int) -> pd.Series | str:
-        game_log = playergamelog.PlayerGameLog(
+        df = fetch_data_frames(
+            playergamelog.PlayerGameLog,
             player_id=player_id,
             season=get_current_season()
-        )
-        df = game_log.get_data_frames()[0]
+        )[0]
 
         if df.empty:
             return "Player is not active this season or has not played any games."
         return df.iloc[0]
 
     def get_alltime_player_stats(self, player_id:int) -> pd.DataFrame:
-        career = playercareerstats.PlayerCareerStats(player_id=player_id)
-        career_df = career.get_data_frames()[0]
+        career_df = fetch_data_frames(playercareerstats.PlayerCareerStats, player_id=player_id)[0]
 
         return career_df
 
     def get_current_season_stats(self, player_id:int) -> pd.DataFrame:
-        player_dashboard = playerdashboardbyyearoveryear.PlayerDashboardByYearOverYear(
+        current_stats = fetch_data_frames(
+            playerdashboardbyyearoveryear.PlayerDashboardByYearOverYear,
             player_id=player_id,
             season=get_current_season()
-        )
-
-        current_stats = player_dashboard.get_data_frames()[0]
+        )[0]
         current_stats = current_stats[["GP", "MIN", "FG_PCT", "FG3_PCT", "FT_PCT", "REB", 
                                     "AST", "PTS", "BLK", "PLUS_MINUS"]]
-        current_stats["PPG"] = round(current_stats["PTS"] / current_stats["GP"], 2)
-        current_stats["APG"] = round(current_stats["AST"] / current_stats["GP"], 2)
-        current_stats["RPG"] = round(current_stats["REB"] / current_stats["GP"], 2)
-        current_stats["BPG"] = round(current_stats["BLK"] / current_stats["GP"], 2)
-        current_stats["MPG"] = round(current_stats["MIN"] / current_stats["GP"], 2) 
-        current_stats
-        return current_stats
+        # Built in one assign() on a new frame instead of assigning into a slice.
+        # For the whole league in one call, see league_stats.fetch_league_stats().
+        games = current_stats["GP"]
+        return current_stats.assign(
+            PPG=(current_stats["PTS"] / games).round(2),
+            APG=(current_stats["AST"] / games).round(2),
+            RPG=(current_stats["REB"] / games).round(2),
+            BPG=(current_stats["BLK"] / games).round(2),
+            MPG=(current_stats["MIN"] / games).round(2),
+        )
 
 
     def plot_stat_over_career(self, player_id, stat):
-        player_name = players.find_player_by_id(player_id)
-        career_df = self.get_alltime_player_stats(player_id=player_id)
-        if stat not in career_df.columns:
-            raise ValueError(f"Stat '{stat}' not found in career data.")
-        
-        print(player_name)
-        plt.figure(figsize=(10, 6))
-        sns.lineplot(data=career_df, x='SEASON_ID', y=stat, marker='o')
-        plt.title(f"{player_name['full_name']}'s {stat} Over Career")
-        plt.xlabel('Season')
-        plt.ylabel(stat)
-        plt.xticks(rotation=45)
-        plt.grid() 
-        plt.show()
+        # matplotlib/seaborn live in the optional player_plots module, loaded only when plotting
+        from player_plots import plot_stat_over_career
+        plot_stat_over_career(self.get_alltime_player_stats(player_id=player_id), player_id, stat)
 
 
     def get_rookie_season(self, player_id:int) -> str:
-        career = playercareerstats.PlayerCareerStats(player_id=player_id)
-        career_df = career.get_data_frames()[0]
+        career_df = fetch_data_frames(playercareerstats.PlayerCareerStats, player_id=player_id)[0]
         if career_df.empty:
             return get_current_season()
         rookie_season = career_df.iloc[0]['SEASON_ID']
         return rookie_season
 
-    def get_team_roster_per_season(self, teamAbbreviation:str, season:str = get_current_season()) -> pd.DataFrame:
+    def get_rookie_seasons(self, season:str = get_current_season()) -> dict:
+        """
+        Map every player in the league index to their rookie season ('YYYY-YY').
+        One CommonAllPlayers call covers all players, instead of one PlayerCareerStats call each.
+        """
+        all_players = fetch_data_frames(
+            commonallplayers.CommonAllPlayers,
+            is_only_current_season=0,
+            league_id='00',
+            season=season
+        )[0]
+        from_years = all_players[['PERSON_ID', 'FROM_YEAR']].dropna()
+        return {
+            int(person_id): f"{int(from_year)}-{str(int(from_year) + 1)[-2:]}"
+            for person_id, from_year in zip(from_years['PERSON_ID'], from_years['FROM_YEAR'])
+            if str(from_year).isdigit()
+        }
+
+    def get_team_roster_per_season(self, teamAbbreviation:str, season:str = get_current_season(), rookie_seasons_by_id:dict = None) -> pd.DataFrame:
         team_details = teams.find_team_by_abbreviation(teamAbbreviation)
         team_id = team_details["id"]
-        roster = commonteamroster.CommonTeamRoster(team_id=team_id, season=season)
-        roster_data = roster.get_data_frames()[0]
+        roster_data = fetch_data_frames(commonteamroster.CommonTeamRoster, team_id=team_id, season=season)[0]
         current_season = get_current_season()
+        if rookie_seasons_by_id is None:
+            rookie_seasons_by_id = self.get_rookie_seasons(season)
         
         rookie_seasons = []
         for _, row in roster_data.iterrows():
             if row['EXP'] == 'R':
                 rookie_season = current_season
             else: 
-                rookie_season = self.get_rookie_season(row['PLAYER_ID'])
+                rookie_season = rookie_seasons_by_id.get(int(row['PLAYER_ID']))
+                if rookie_season is None:
+                    # Not in the league index (rare): fall back to the player's career stats
+                    rookie_season = self.get_rookie_season(row['PLAYER_ID'])
             rookie_seasons.append(rookie_season)
-            time.sleep(0.6)  # To avoid hitting rate limits
 
         roster_data['ROOKIE_SEASON'] = rookie_seasons
 
@@ -120,7 +123,6 @@ class player():
         return roster_data
     
     def get_player_teams(self, player_id:int) -> pd.DataFrame:
-        career = playercareerstats.PlayerCareerStats(player_id=player_id)
-        career_df = career.get_data_frames()[0]
+        career_df = fetch_data_frames(playercareerstats.PlayerCareerStats, player_id=player_id)[0]
         teams_played_for = career_df[['TEAM_ID', 'PLAYER_ID', 'SEASON_ID']].drop_duplicates().reset_index(drop=True)
         return teams_played_for
\ No newline at end of file
@@ -0,0 +1,200 @@
+"""
+Columnar store of historical per-player-season stats.
+
+Career totals (PlayerCareerStats, one row per player, season and team) are
+kept in a Parquet dataset partitioned by season:
+
+    STATS_STORE_DIR/season=2023-24/part-0.parquet
+
+Writes are incremental: incoming rows are merged into their season
+partitions (replacing the rows of the players being written) and a
+partition file is only rewritten when its content changed, atomically via
+a temporary file. Readers go through pyarrow.dataset, so a query reads just
+the season directories its filter selects and the columns it asks for;
+files are sorted by player and carry row group statistics for the rest.
+
+"All players' PTS by season since 1990" is then a few MB of local reads
+instead of thousands of upstream calls or database round trips.
+"""
+
+import os
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import pandas as pd
+
+try:
+    from .helpfuncs import lazy_module
+except ImportError:
+    from helpfuncs import lazy_module
+
+# pyarrow is only imported when the store is used
+pa = lazy_module("pyarrow")
+ds = lazy_module("pyarrow.dataset")
+pq = lazy_module("pyarrow.parquet")
+
+
+STORE_DIR = Path(os.getenv("STATS_STORE_DIR", Path(__file__).resolve().parents[2] / ".cache" / "player_season_stats"))
+ROW_GROUP_SIZE = int(os.getenv("STATS_STORE_ROW_GROUP_SIZE", 256))
+PARTITION_FILE = "part-0.parquet"
+
+# Totals columns of PlayerCareerStats' SeasonTotalsRegularSeason, with compact nullable dtypes:
+# counting stats are Int16 (<NA> where not tracked), only MIN, PLAYER_AGE and *_PCT are float32
+KEY_COLUMNS = ['PLAYER_ID', 'TEAM_ID']
+STAT_DTYPES = {
+    'PLAYER_ID': 'Int32',
+    'TEAM_ID': 'Int32',
+    'TEAM_ABBREVIATION': 'string',
+    'PLAYER_AGE': 'float32',
+    'GP': 'Int16',
+    'GS': 'Int16',
+    'MIN': 'float32',
+    'FGM': 'Int16',
+    'FGA': 'Int16',
+    'FG_PCT': 'float32',
+    'FG3M': 'Int16',
+    'FG3A': 'Int16',
+    'FG3_PCT': 'float32',
+    'FTM': 'Int16',
+    'FTA': 'Int16',
+    'FT_PCT': 'float32',
+    'OREB': 'Int16',
+    'DREB': 'Int16',
+    'REB': 'Int16',
+    'AST': 'Int16',
+    'STL': 'Int16',
+    'BLK': 'Int16',
+    'TOV': 'Int16',
+    'PF': 'Int16',
+    'PTS': 'Int16',
+}
+STAT_COLUMNS = list(STAT_DTYPES)
+
+
+def _partition_path(season: str) -> Path:
+    return STORE_DIR / f"season={season}" / PARTITION_FILE
+
+
+def _normalize(stats_df: pd.DataFrame) -> pd.DataFrame:
+    """STAT_COLUMNS only, compact dtypes, one row per (player, team), sorted by player."""
+    # Counting stats not tracked in early seasons (e.g. 3PT before 1979, STL/BLK before 1973) stay <NA>
+    frame = stats_df.reindex(columns=STAT_COLUMNS).astype(STAT_DTYPES)
+    frame = frame.drop_duplicates(KEY_COLUMNS, keep='last')
+    return frame.sort_values(KEY_COLUMNS, ignore_index=True)
+
+
+def read_partition(season: str) -> pd.DataFrame:
+    """One season's rows, or an empty frame if the season is not stored yet."""
+    path = _partition_path(season)
+    if not path.exists():
+        return _normalize(pd.DataFrame(columns=STAT_COLUMNS))
+    return pq.read_table(path).to_pandas().astype(STAT_DTYPES)
+
+
+def _write_partition(season: str, frame: pd.DataFrame):
+    path = _partition_path(season)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    # Dot files are ignored by dataset discovery, so readers never see a partial write
+    tmp_path = path.parent / f".{PARTITION_FILE}.tmp"
+    pq.write_table(table, tmp_path, compression="zstd", row_group_size=ROW_GROUP_SIZE)
+    os.replace(tmp_path, path)
+
+
+def write_player_seasons(career_df: pd.DataFrame) -> dict:
+    """
+    Merge per-player-season rows (e.g. from player.get_alltime_player_stats) into the store.
+
+    For every season in career_df, the stored rows of the players present in
+    career_df are replaced by the new ones; other players' rows are kept.
+    Seasons whose merged content is unchanged are not rewritten.
+
+    Args:
+        career_df: Rows with SEASON_ID and STAT_COLUMNS, for one or many players
+
+    Returns:
+        Dictionary with the seasons rewritten and left unchanged
+    """
+    written, unchanged = [], []
+    if career_df.empty:
+        return {"seasons_written": written, "seasons_unchanged": unchanged}
+
+    for season, season_df in career_df.groupby('SEASON_ID', sort=True):
+        incoming = _normalize(season_df)
+        stored = read_partition(season)
+        kept = stored[~stored['PLAYER_ID'].isin(incoming['PLAYER_ID'].unique())]
+        merged = _normalize(pd.concat([kept, incoming], ignore_index=True))
+
+        if merged.equals(stored):
+            unchanged.append(season)
+            continue
+        _write_partition(season, merged)
+        written.append(season)
+
+    return {"seasons_written": written, "seasons_unchanged": unchanged}
+
+
+def stored_seasons() -> List[str]:
+    """Seasons present in the store, oldest first."""
+    if not STORE_DIR.exists():
+        return []
+    return sorted(
+        path.parent.name.split("=", 1)[1]
+        for path in STORE_DIR.glob(f"season=*/{PARTITION_FILE}")
+    )
+
+
+def read_stats(
+    columns: Optional[Iterable[str]] = None,
+    first_season: Optional[str] = None,
+    last_season: Optional[str] = None,
+    player_ids: Optional[Iterable[int]] = None,
+) -> pd.DataFrame:
+    """
+    Read stats from the store, pruning by season partition, row group and column.
+
+    Args:
+        columns: Stat columns to read (PLAYER_ID, TEAM_ID and season are always included)
+        first_season: First season to read ('YYYY-YY'), inclusive
+        last_season: Last season to read ('YYYY-YY'), inclusive
+        player_ids: Only these players (row groups whose PLAYER_ID range misses them are skipped)
+
+    Returns:
+        DataFrame with one row per player, season and team
+    """
+    if not stored_seasons():
+        return pd.DataFrame(columns=['season', *KEY_COLUMNS, *(columns or STAT_COLUMNS[2:])])
+
+    dataset = ds.dataset(
+        STORE_DIR,
+        format="parquet",
+        partitioning=ds.partitioning(pa.schema([("season", pa.string())]), flavor="hive"),
+    )
+    # 'YYYY-YY' strings sort chronologically, so season bounds are string comparisons
+    conditions = []
+    if first_season:
+        conditions.append(ds.field("season") >= first_season)
+    if last_season:
+        conditions.append(ds.field("season") <= last_season)
+    if player_ids is not None:
+        conditions.append(ds.field("PLAYER_ID").isin([int(player_id) for player_id in player_ids]))
+
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+
+    selected = ['season', *KEY_COLUMNS]
+    selected += [column for column in (columns or STAT_COLUMNS) if column not in selected]
+    return dataset.to_table(columns=selected, filter=expression).to_pandas()
+
+
+def player_season_totals(columns: Iterable[str], first_season: Optional[str] = None,
+                         last_season: Optional[str] = None) -> pd.DataFrame:
+    """
+    One row per player and season. Players traded mid-season have a row per
+    team plus a combined row (TEAM_ID 0, 'TOT'); only the combined one is kept.
+    """
+    stats = read_stats(columns, first_season, last_season)
+    rows_per_season = stats.groupby(['PLAYER_ID', 'season'])['TEAM_ID'].transform('size')
+    totals = stats[(stats['TEAM_ID'] == 0) | (rows_per_season == 1)]
+    return totals.drop(columns='TEAM_ID').sort_values(['season', 'PLAYER_ID'], ignore_index=True)
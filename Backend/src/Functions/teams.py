@@ -1,28 +1,19 @@
 from nba_api.stats.static import teams
-from nba_api.stats.endpoints import commonteamroster
-from nba_api.stats.endpoints import teamgamelog
-from nba_api.stats.endpoints import commonteamroster
 from datetime import datetime, timezone, timedelta
 from dateutil import parser
-from nba_api.live.nba.endpoints import scoreboard
 import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
-import numpy as np
 from typing import List, Dict, Tuple, Union, Optional
 
-# Import get_current_standings with error handling for different import contexts
 try:
-    from .games import get_current_standings
+    from .nba_cache import fetch_data_frames
+    from .helpfuncs import lazy_module
 except ImportError:
-    # Fallback for when imported from outside package context
-    try:
-        from games import get_current_standings
-    except ImportError:
-        # Define a minimal version if games module is not available
-        def get_current_standings(season=None, conference='Overall'):
-            print("Warning: get_current_standings not available. Using placeholder.")
-            return pd.DataFrame()
+    from nba_cache import fetch_data_frames
+    from helpfuncs import lazy_module
+
+# nba_api endpoint modules are imported on first use (see helpfuncs.LazyModule)
+commonteamroster = lazy_module("nba_api.stats.endpoints.commonteamroster")
+teamgamelog = lazy_module("nba_api.stats.endpoints.teamgamelog")
 
 eastern_conference = {
     'ATL', 'BOS', 'BKN', 'CHA', 'CHI', 'CLE', 'DET', 'IND',
@@ -104,8 +95,7 @@ def get_team_roster_per_season(team_id:int = 1610612747, season:str = None) -> p
         season = check_valid_season(season)
 
         team_id = get_team_details_by_id(team_id)["id"]
-        roster = commonteamroster.CommonTeamRoster(team_id=team_id, season=season)
-        roster_data = roster.get_data_frames()[0]
+        roster_data = fetch_data_frames(commonteamroster.CommonTeamRoster, team_id=team_id, season=season)[0]
         roster_data = roster_data[["PLAYER", "NUM", "POSITION", "HEIGHT", "WEIGHT", "BIRTH_DATE", "AGE", "EXP", "SCHOOL"]]
         return roster_data.to_json(orient='records')
     except Exception as e:
@@ -116,21 +106,11 @@ def get_team_last_n_games_played(team_id:int = 1610612747, season:str = None, la
     season = check_valid_season(season)
     team_details = get_team_details_by_id(team_id)
     team_id = team_details["id"]
-    game_log = teamgamelog.TeamGameLog(team_id=team_id, season=season)
-    game_log = game_log.get_data_frames()[0]
+    game_log = fetch_data_frames(teamgamelog.TeamGameLog, team_id=team_id, season=season)[0]
 
     game_log = game_log[['Game_ID', 'GAME_DATE', 'MATCHUP', 'WL']]
     return game_log[:last_n_games]
 
-def get_team_league_standing(team_id:int = 1610612747, season:str = None) -> pd.DataFrame:
-    season = check_valid_season(season)
-    team_details = get_team_details_by_id(team_id)
-    standings = get_current_standings(conference=team_details['conference']).reset_index()
-    index = int(standings[standings['TeamName'] == team_details['nickname']].index[0]) + 1
-
-    return index
-
-
 def get_team_full_info( season:str = None):
     pass
 
@@ -0,0 +1,131 @@
+"""
+Bulk loading helpers for the populate scripts.
+
+Rows are streamed into a temporary staging table with asyncpg's binary COPY
+(copy_records_to_table) and then merged into the target table with a single
+INSERT ... SELECT ... ON CONFLICT statement per batch. This replaces building
+one ORM object per row and pre-loading every existing key to skip duplicates.
+"""
+
+import os
+import time
+import uuid
+from itertools import islice
+from typing import Iterable, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DEFAULT_BATCH_SIZE = int(os.getenv("BULK_LOAD_BATCH_SIZE", 5000))
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _batches(records: Iterable[Sequence], batch_size: int):
+    iterator = iter(records)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+async def _get_asyncpg_connection(session: AsyncSession):
+    """Return the asyncpg connection behind the session's current transaction."""
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    return raw_connection.driver_connection
+
+
+def _build_merge_sql(table: str, staging: str, columns: Sequence[str],
+                     conflict_columns: Sequence[str], update_columns: Optional[Sequence[str]]) -> str:
+    column_list = ", ".join(_quote(c) for c in columns)
+    conflict_list = ", ".join(_quote(c) for c in conflict_columns)
+
+    if update_columns:
+        assignments = ", ".join(f"{_quote(c)} = EXCLUDED.{_quote(c)}" for c in update_columns)
+        conflict_action = f"DO UPDATE SET {assignments}"
+        # Rows whose loaded values are unchanged are not rewritten, so a refresh
+        # of identical data writes nothing (and does not bump table_versions)
+        compared = [c for c in update_columns if c in columns]
+        if compared:
+            target = ", ".join(f"{_quote(table)}.{_quote(c)}" for c in compared)
+            excluded = ", ".join(f"EXCLUDED.{_quote(c)}" for c in compared)
+            conflict_action += f" WHERE ({target}) IS DISTINCT FROM ({excluded})"
+    else:
+        conflict_action = "DO NOTHING"
+
+    # DISTINCT ON keeps one row per conflict key; ON CONFLICT DO UPDATE cannot
+    # touch the same target row twice within one statement.
+    return (
+        f"INSERT INTO {_quote(table)} ({column_list}) "
+        f"SELECT DISTINCT ON ({conflict_list}) {column_list} FROM {_quote(staging)} "
+        f"ON CONFLICT ({conflict_list}) {conflict_action}"
+    )
+
+
+async def bulk_load(
+    session: AsyncSession,
+    table: str,
+    columns: Sequence[str],
+    records: Iterable[Sequence],
+    conflict_columns: Sequence[str],
+    update_columns: Optional[Sequence[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> dict:
+    """
+    Load records into table through a COPY-filled staging table.
+
+    Existing rows (matched on conflict_columns) are left untouched, or updated
+    with the new values of update_columns when given and any loaded column
+    among them changed. The caller owns the
+    transaction and is responsible for committing the session.
+
+    Args:
+        session: Open async session bound to a Postgres (asyncpg) engine
+        table: Target table name
+        columns: Column names, in the same order as each record
+        records: Iterable of tuples to load
+        conflict_columns: Columns of a unique constraint on the target table
+        update_columns: Columns to overwrite on conflict (None = DO NOTHING)
+        batch_size: Number of records copied and merged per round trip
+
+    Returns:
+        Dictionary with rows received, rows written, elapsed time and rows/sec
+    """
+    started = time.monotonic()
+    conn = await _get_asyncpg_connection(session)
+    staging = f"_stage_{table}_{uuid.uuid4().hex[:8]}"
+
+    # Staging table with only the loaded columns: same types, no constraints or defaults
+    await conn.execute(
+        f"CREATE TEMP TABLE {_quote(staging)} ON COMMIT DROP AS "
+        f"SELECT {', '.join(_quote(c) for c in columns)} FROM {_quote(table)} WITH NO DATA"
+    )
+    merge_sql = _build_merge_sql(table, staging, columns, conflict_columns, update_columns)
+
+    rows_received = 0
+    rows_written = 0
+    for batch in _batches(records, batch_size):
+        await conn.copy_records_to_table(staging, records=batch, columns=list(columns))
+        status = await conn.execute(merge_sql)
+        await conn.execute(f"TRUNCATE {_quote(staging)}")
+        rows_received += len(batch)
+        # Status looks like "INSERT 0 <rows>"
+        rows_written += int(status.split()[-1])
+    # On failure the rollback discards the staging table along with everything else
+    await conn.execute(f"DROP TABLE {_quote(staging)}")
+
+    elapsed = time.monotonic() - started
+    rows_per_second = rows_received / elapsed if elapsed > 0 else 0.0
+    print(f"📦 Bulk loaded {table}: {rows_written}/{rows_received} rows written "
+          f"in {elapsed:.2f}s ({rows_per_second:,.0f} rows/sec)")
+
+    return {
+        "rows_received": rows_received,
+        "rows_written": rows_written,
+        "rows_skipped": rows_received - rows_written,
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(rows_per_second, 1),
+    }
@@ -0,0 +1,41 @@
+"""
+Per-table data versions.
+
+The table_versions table is bumped by statement-level triggers on every
+write to the versioned tables that changes at least one row (see migrations
+d248a62cbd13 and a3e8f2c41b97). Versions are read with one small primary-key
+query and kept in memory for DATA_VERSION_TTL seconds, so conditional
+requests can be answered without running the route's own query.
+"""
+
+import os
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import TableVersions
+
+DATA_VERSION_TTL = float(os.getenv("DATA_VERSION_TTL", 1.0))
+
+
+class DataVersions:
+    def __init__(self, ttl: float = DATA_VERSION_TTL):
+        self.ttl = ttl
+        self._versions: Dict[str, int] = {}
+        self._loaded_at: Optional[float] = None
+
+    async def get(self, db: AsyncSession, *tables: str) -> tuple:
+        """Return the current version of each table, in the given order (0 if unknown)."""
+        if self._loaded_at is None or time.monotonic() - self._loaded_at >= self.ttl:
+            result = await db.execute(select(TableVersions.table_name, TableVersions.version))
+            self._versions = dict(result.all())
+            self._loaded_at = time.monotonic()
+        return tuple(self._versions.get(table, 0) for table in tables)
+
+    def invalidate(self):
+        self._loaded_at = None
+
+
+data_versions = DataVersions()
@@ -1,15 +1,11 @@
-from typing import Annotated
-from datetime import datetime
-from fastapi import FastAPI, HTTPException, Query, Response
-from typing import Any
-from random import randint
-from fastapi import Request
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 from dotenv import load_dotenv
 import os
 from pathlib import Path
 
+from .pool_metrics import InstrumentedQueuePool
+
 # Get the project root directory (2 levels up from database.py)
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 
@@ -24,13 +20,69 @@ DB_HOST = os.getenv("DB_HOST")
 DB_PORT = os.getenv("DB_PORT")
 DB_NAME = os.getenv("DB_NAME")
 
-app = FastAPI(root_path="/api/v1")
+# Perfiles del motor: dev loguea SQL, prod y bench ajustan el pool
+ENGINE_PROFILES = {
+    "dev": {
+        "echo": True,
+        "pool_size": 5,
+        "max_overflow": 5,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+        "prepared_statement_cache_size": 100,
+    },
+    "prod": {
+        "echo": False,
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_timeout": 10,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+        "prepared_statement_cache_size": 500,
+    },
+    "bench": {
+        "echo": False,
+        "pool_size": 50,
+        "max_overflow": 0,
+        "pool_timeout": 5,
+        "pool_recycle": -1,
+        "pool_pre_ping": False,
+        "prepared_statement_cache_size": 1000,
+    },
+}
+
+ENVIRONMENT_PROFILES = {"development": "dev", "production": "prod"}
+
+
+def get_engine_profile() -> tuple:
+    """
+    Select the engine profile from DB_PROFILE (dev/prod/bench), falling back to ENVIRONMENT.
+    DB_POOL_SIZE and DB_MAX_OVERFLOW override the profile's pool sizing.
+    """
+    environment = os.getenv("ENVIRONMENT", "development").lower()
+    name = os.getenv("DB_PROFILE", ENVIRONMENT_PROFILES.get(environment, environment)).lower()
+    if name not in ENGINE_PROFILES:
+        raise ValueError(f"Invalid DB_PROFILE: {name}. Expected one of {list(ENGINE_PROFILES)}.")
+
+    profile = dict(ENGINE_PROFILES[name])
+    if os.getenv("DB_POOL_SIZE"):
+        profile["pool_size"] = int(os.getenv("DB_POOL_SIZE"))
+    if os.getenv("DB_MAX_OVERFLOW"):
+        profile["max_overflow"] = int(os.getenv("DB_MAX_OVERFLOW"))
+    return name, profile
+
+
+ENGINE_PROFILE, _profile = get_engine_profile()
 
 # Construir DATABASE_URL desde variables de entorno
-DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+# (prepared_statement_cache_size configura la caché de sentencias preparadas de asyncpg)
+DATABASE_URL = (
+    f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    f"?prepared_statement_cache_size={_profile.pop('prepared_statement_cache_size')}"
+)
 
 # Crea el motor
-engine = create_async_engine(DATABASE_URL, echo=True)
+engine = create_async_engine(DATABASE_URL, poolclass=InstrumentedQueuePool, **_profile)
 
 # Crea una fábrica de sesiones
 async_session = sessionmaker(
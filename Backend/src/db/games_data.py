@@ -0,0 +1,180 @@
+"""
+Games ingestion.
+
+A season's games come from a single league-wide LeagueGameLog call (two rows
+per game, one per team), are paired into one row per game (home/away) and
+bulk loaded into the games table through COPY. A full backfill since 1980
+is one upstream call per season (~45) instead of one TeamGameLog call per
+team per season (~1,350).
+"""
+
+import asyncio
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import text
+
+from .bulk_load import bulk_load
+from .database import async_session
+from .models import Games
+
+# Upstream helpers live in Backend/src/Functions
+functions_path = Path(__file__).resolve().parent.parent / "Functions"
+if str(functions_path) not in sys.path:
+    sys.path.insert(0, str(functions_path))
+
+from helpfuncs import lazy_module
+
+# Imported on first fetch (pulls in pandas and nba_api)
+games = lazy_module("games")
+
+FIRST_SEASON = 1980
+
+GAMES_COLUMNS = (
+    'game_id', 'date', 'home_team_id', 'away_team_id',
+    'home_team_score', 'away_team_score', 'season'
+)
+
+
+def build_game_records(games_df, season: str) -> list:
+    """Games rows (in GAMES_COLUMNS order) from a pair_game_rows() DataFrame."""
+    return [
+        (
+            int(game_id),
+            datetime.strptime(game_date, '%Y-%m-%d'),
+            int(home_team_id),
+            int(away_team_id),
+            int(home_pts),
+            int(away_pts),
+            season
+        )
+        for game_id, game_date, home_team_id, away_team_id, home_pts, away_pts in zip(
+            games_df['GAME_ID'], games_df['GAME_DATE'], games_df['HOME_TEAM_ID'],
+            games_df['AWAY_TEAM_ID'], games_df['HOME_PTS'], games_df['AWAY_PTS']
+        )
+    ]
+
+
+def fetch_season_games(season: Optional[str] = None) -> tuple:
+    """Blocking upstream fetch (requests + pandas); returns ('YYYY-YY' season, game records)."""
+    season = games.check_valid_season(season)
+    games_df = games.pair_game_rows(games.get_league_game_log(season))
+    return season, build_game_records(games_df, season)
+
+
+async def _load_games(season: str, records: list) -> dict:
+    async with async_session() as session:
+        # games is partitioned by season; a new season needs its partition first
+        await session.execute(text("SELECT ensure_games_partition(:season)"), {"season": season})
+        load_result = await bulk_load(
+            session,
+            Games.__tablename__,
+            GAMES_COLUMNS,
+            records,
+            conflict_columns=('season', 'game_id'),
+            # Late or corrected scores overwrite the stored ones
+            update_columns=('home_team_score', 'away_team_score')
+        )
+        await session.commit()
+    return load_result
+
+
+async def refresh_games(season: Optional[str] = None):
+    """
+    Fetch every game of a season and upsert them.
+
+    Args:
+        season: Season start year ('YYYY'); defaults to the current season
+
+    Returns:
+        Dictionary with operation result
+    """
+    try:
+        # Kept off the event loop, including the first import of the games module
+        season, records = await asyncio.to_thread(fetch_season_games, season)
+        load_result = await _load_games(season, records)
+
+        print(f"Refreshed games for {season}: {load_result['rows_written']} games")
+        return {
+            "success": True,
+            "season": season,
+            "games_loaded": load_result["rows_written"]
+        }
+
+    except Exception as e:
+        print(f"Error refreshing games for season {season}: {e}")
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+async def _load_season(season: str, records: list, failed_seasons: list) -> int:
+    try:
+        load_result = await _load_games(season, records)
+        print(f"   ✅ {season}: {load_result['rows_written']} games")
+        return load_result["rows_written"]
+    except Exception as e:
+        print(f"   ❌ Error loading games for {season}: {e}")
+        failed_seasons.append(season[:4])
+        return 0
+
+
+async def backfill_games(first_season: int = FIRST_SEASON, last_season: Optional[int] = None):
+    """
+    Load every season from first_season to last_season (default: current), one
+    upstream call per season. The next season is fetched while the previous
+    one is being copied into the database.
+
+    Args:
+        first_season: First season start year
+        last_season: Last season start year
+
+    Returns:
+        Dictionary with operation results
+    """
+    if last_season is None:
+        last_season = int(games.get_current_season()[:4])
+    seasons = [str(year) for year in range(first_season, last_season + 1)]
+
+    started = time.monotonic()
+    games_loaded = 0
+    failed_seasons = []
+    pending_load = None
+
+    for year in seasons:
+        try:
+            season, records = await asyncio.to_thread(fetch_season_games, year)
+        except Exception as e:
+            print(f"   ❌ Error fetching games for {year}: {e}")
+            failed_seasons.append(year)
+            continue
+
+        if pending_load is not None:
+            games_loaded += await pending_load
+        pending_load = asyncio.ensure_future(_load_season(season, records, failed_seasons))
+
+    if pending_load is not None:
+        games_loaded += await pending_load
+
+    elapsed = time.monotonic() - started
+    print(f"\n🎉 Games backfill completed: {games_loaded} games from {len(seasons) - len(failed_seasons)} "
+          f"seasons in {elapsed:.1f}s")
+    return {
+        "success": not failed_seasons,
+        "seasons_loaded": len(seasons) - len(failed_seasons),
+        "failed_seasons": failed_seasons,
+        "games_loaded": games_loaded,
+        "elapsed_seconds": elapsed
+    }
+
+
+def run_backfill_games(first_season: int = FIRST_SEASON, last_season: Optional[int] = None):
+    """
+    Synchronous wrapper to run backfill_games().
+    Use this function if you want to backfill games from a regular Python script.
+    """
+    return asyncio.run(backfill_games(first_season, last_season))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Float, ForeignKey, Integer, String, PrimaryKeyConstraint, DateTime, func
+from sqlalchemy import BigInteger, CheckConstraint, Column, Float, ForeignKey, Integer, String, PrimaryKeyConstraint, UniqueConstraint, Index, DateTime, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import ENUM as PGEnum
 from .database import Base
@@ -32,7 +32,10 @@ class Players(Base):
     birth_date = Column(DateTime, nullable=False)
     school = Column(String, nullable=True)
     rookie_season = Column(Integer, nullable=False)
-    
+
+    __table_args__ = (
+        Index('ix_players_player_name_player_id', 'player_name', 'player_id'),
+    )
 
 
     def __repr__(self):
@@ -40,6 +43,12 @@ class Players(Base):
     
 class PlayerTeamsAssociation(Base):
     __tablename__ = 'player_teams_association'
+    __table_args__ = (
+        UniqueConstraint('player_id', 'team_id', 'season', name='uq_player_teams_association_player_team_season'),
+        # Covering indexes: roster lookups by (team_id, season) and career lookups by (player_id, season)
+        Index('ix_player_teams_association_team_season', 'team_id', 'season', postgresql_include=['player_id']),
+        Index('ix_player_teams_association_player_season', 'player_id', 'season', postgresql_include=['team_id']),
+    )
 
     players_teams_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     player_id = Column(Integer, ForeignKey('players.player_id'))
@@ -49,8 +58,17 @@ class PlayerTeamsAssociation(Base):
 
 class Games(Base):
     __tablename__ = 'games'
+    __table_args__ = (
+        # The partition key has to be part of the primary key
+        PrimaryKeyConstraint('season', 'game_id', name='pk_games'),
+        CheckConstraint("season ~ '^[0-9]{4}-[0-9]{2}$'", name='ck_games_season_format'),
+        # Games are loaded in date order, so block ranges summarize tight date ranges
+        Index('ix_games_date_brin', 'date', postgresql_using='brin'),
+        # One partition per season, created by ensure_games_partition() (migration 5d1c9e07a4b2)
+        {'postgresql_partition_by': 'LIST (season)'},
+    )
 
-    game_id = Column(Integer, primary_key=True, index=True)
+    game_id = Column(Integer, nullable=False, index=True)
     date = Column(DateTime, nullable=False)
     home_team_id = Column(Integer, ForeignKey('teams.team_id'), nullable=False)
     away_team_id = Column(Integer, ForeignKey('teams.team_id'), nullable=False)
@@ -62,4 +80,54 @@ class Games(Base):
     away_team = relationship("Teams", foreign_keys=[away_team_id])
 
     def __repr__(self):
-        return f"<Game(id={self.id}, date={self.date}, home_team_id={self.home_team_id}, away_team_id={self.away_team_id}, home_team_score={self.home_team_score}, away_team_score={self.away_team_score}, season='{self.season}')>"
\ No newline at end of file
+        return f"<Game(id={self.id}, date={self.date}, home_team_id={self.home_team_id}, away_team_id={self.away_team_id}, home_team_score={self.home_team_score}, away_team_score={self.away_team_score}, season='{self.season}')>"
+
+
+class TableVersions(Base):
+    """Per-table data version, bumped by statement-level triggers on every write (used for ETags)."""
+    __tablename__ = 'table_versions'
+
+    table_name = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+
+class RateLimitCounters(Base):
+    """
+    Shared rate limit counters (see handler/rate_limit_storage.py).
+    One row per limit key holding the current and previous window counts, so
+    memory per key is fixed. Unlogged: losing counters on a crash is harmless.
+    """
+    __tablename__ = 'rate_limit_counters'
+    __table_args__ = (
+        Index('ix_rate_limit_counters_expires_at', 'expires_at'),
+        {'prefixes': ['UNLOGGED']},
+    )
+
+    key = Column(String, primary_key=True)
+    window_id = Column(BigInteger, nullable=False, default=0)
+    current_count = Column(Integer, nullable=False, default=0)
+    previous_count = Column(Integer, nullable=False, default=0)
+    expires_at = Column(Float, nullable=False)
+
+
+class Standings(Base):
+    """Regular season standings, one row per team and season, refreshed in bulk from LeagueStandingsV3."""
+    __tablename__ = 'standings'
+    __table_args__ = (
+        PrimaryKeyConstraint('season', 'team_id', name='pk_standings'),
+        Index('ix_standings_season_conference_rank', 'season', 'conference', 'conference_rank'),
+    )
+
+    season = Column(String, nullable=False)
+    team_id = Column(Integer, ForeignKey('teams.team_id'), nullable=False)
+    conference = Column(String, nullable=False)
+    wins = Column(Integer, nullable=False)
+    losses = Column(Integer, nullable=False)
+    win_pct = Column(Float, nullable=False)
+    conference_rank = Column(Integer, nullable=False)
+    league_rank = Column(Integer, nullable=False)
+    record = Column(String, nullable=True)
+    home = Column(String, nullable=True)
+    road = Column(String, nullable=True)
+    last_10 = Column(String, nullable=True)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now())
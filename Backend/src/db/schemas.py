@@ -1,5 +1,6 @@
-from pydantic import BaseModel
-from typing import Optional
+import os
+from pydantic import BaseModel, conint, conlist
+from typing import List, Optional
 from datetime import datetime
 
 # ------------------ Team Schemas ------------------ #
@@ -44,12 +45,111 @@ class PlayerResponse(PlayerBase):
     class Config:
         from_attributes = True
 
+class PlayerPage(BaseModel):
+    items: List[PlayerResponse]
+    next_cursor: Optional[str] = None
+    approximate_total: Optional[int] = None
+    limit: int
+
+# Batch lookups: ids per request, and the largest id the players.player_id column (int4) holds
+PLAYERS_BATCH_MAX = int(os.getenv("PLAYERS_BATCH_MAX", 500))
+PLAYER_ID_MAX = 2**31 - 1
+
+class PlayerBatchRequest(BaseModel):
+    ids: conlist(conint(ge=1, le=PLAYER_ID_MAX), min_length=1, max_length=PLAYERS_BATCH_MAX)
+
+class PlayerBatchResponse(BaseModel):
+    items: List[PlayerResponse]
+    missing: List[int]
+
 class PlayerCreate(PlayerBase):
     player_id: int
 
 class PlayerUpdate(PlayerBase):
     pass
 
+# ------------------ Player Season Stats Schemas ------------------ #
+class PlayerSeasonStatsResponse(BaseModel):
+    player_id: int
+    player_name: str
+    team_id: int
+    team_abbreviation: str
+    age: Optional[float] = None
+    # Season totals
+    gp: int
+    min: float
+    fgm: int
+    fga: int
+    fg3m: int
+    fg3a: int
+    ftm: int
+    fta: int
+    oreb: int
+    dreb: int
+    reb: int
+    ast: int
+    tov: int
+    stl: int
+    blk: int
+    pf: int
+    pts: int
+    plus_minus: int
+    # Per-game averages
+    mpg: float
+    ppg: float
+    rpg: float
+    orpg: float
+    drpg: float
+    apg: float
+    spg: float
+    bpg: float
+    topg: float
+    fgmpg: float
+    fgapg: float
+    fg3mpg: float
+    ftmpg: float
+    # Shooting and rates
+    fg_pct: float
+    fg3_pct: float
+    ft_pct: float
+    efg_pct: float
+    ts_pct: float
+    ast_to: float
+
+# ------------------ Leaders Schemas ------------------ #
+class LeaderEntry(BaseModel):
+    rank: int
+    player_id: int
+    player_name: str
+    team_abbreviation: str
+    gp: int
+    value: float
+
+class LeadersResponse(BaseModel):
+    season: str
+    stat: str
+    mode: str
+    leaders: List[LeaderEntry]
+
+# ------------------ Standings Schemas ------------------ #
+class StandingResponse(BaseModel):
+    season: str
+    team_id: int
+    conference: str
+    wins: int
+    losses: int
+    win_pct: float
+    conference_rank: int
+    league_rank: int
+    record: Optional[str] = None
+    home: Optional[str] = None
+    road: Optional[str] = None
+    last_10: Optional[str] = None
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
 # ------------------ Player-Team Association Schemas ------------------ #
 class PlayerTeamAssociationBase(BaseModel):
     player_id: int
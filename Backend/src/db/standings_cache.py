@@ -0,0 +1,81 @@
+"""
+In-process cache of the standings table.
+
+Each season's 30 rows are loaded with one primary-key range query, validated
+into StandingResponse objects and indexed by team id and conference, so a
+team's rank is a dict lookup and the league and conference tables are served
+as pre-serialized JSON.
+
+A season is reloaded whenever the standings table version changes (see
+data_versions.py), so a refresh from another process or replica is picked up
+within DATA_VERSION_TTL.
+"""
+
+import asyncio
+from typing import Dict, List
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .data_versions import data_versions
+from .models import Standings
+from .schemas import StandingResponse
+
+_standings_adapter = TypeAdapter(List[StandingResponse])
+
+
+class SeasonStandings:
+    def __init__(self, season: str, version: int, standings: List[StandingResponse]):
+        self.season = season
+        self.version = version
+        # Whole league ordered by league rank
+        self.league = sorted(standings, key=lambda standing: standing.league_rank)
+        self.league_json = _standings_adapter.dump_json(self.league)
+        self.by_team: Dict[int, StandingResponse] = {standing.team_id: standing for standing in standings}
+
+        by_conference: Dict[str, List[StandingResponse]] = {}
+        for standing in sorted(standings, key=lambda standing: standing.conference_rank):
+            by_conference.setdefault(standing.conference, []).append(standing)
+        self.by_conference = by_conference
+        self.conference_json: Dict[str, bytes] = {
+            conference: _standings_adapter.dump_json(rows) for conference, rows in by_conference.items()
+        }
+
+
+class StandingsCache:
+    def __init__(self):
+        self._seasons: Dict[str, SeasonStandings] = {}
+        self._lock = asyncio.Lock()
+
+    def invalidate(self):
+        """Drop every cached season; the next read reloads from the database."""
+        self._seasons = {}
+        data_versions.invalidate()
+
+    async def _load(self, db: AsyncSession, season: str, version: int) -> SeasonStandings:
+        result = await db.execute(select(Standings).where(Standings.season == season))
+        standings = _standings_adapter.validate_python(result.scalars().all(), from_attributes=True)
+        return SeasonStandings(season, version, standings)
+
+    async def get(self, db: AsyncSession, season: str) -> SeasonStandings:
+        """Standings for `season`, reloaded if the standings table changed since it was cached."""
+        (version,) = await data_versions.get(db, "standings")
+        cached = self._seasons.get(season)
+        if cached is not None and cached.version == version:
+            return cached
+
+        async with self._lock:
+            # Another request may have reloaded while we waited for the lock
+            cached = self._seasons.get(season)
+            if cached is None or cached.version != version:
+                cached = await self._load(db, season, version)
+                # Seasons without rows are not kept, so unknown seasons can't grow the cache
+                if cached.league:
+                    self._seasons[season] = cached
+                else:
+                    self._seasons.pop(season, None)
+        return cached
+
+
+standings_cache = StandingsCache()
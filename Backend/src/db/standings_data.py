@@ -0,0 +1,115 @@
+"""
+Standings refresh.
+
+All 30 teams' standings for a season come from a single LeagueStandingsV3
+call and are bulk loaded into the standings table, overwriting the previous
+values for that season. Run it on a schedule (or by hand with
+refresh_standings.py) rather than per request.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import Optional
+
+from .bulk_load import bulk_load
+from .database import async_session
+from .models import Standings
+from .standings_cache import standings_cache
+
+# Upstream helpers live in Backend/src/Functions
+functions_path = Path(__file__).resolve().parent.parent / "Functions"
+if str(functions_path) not in sys.path:
+    sys.path.insert(0, str(functions_path))
+
+from helpfuncs import lazy_module
+
+# Imported on first refresh (pulls in pandas and nba_api)
+games = lazy_module("games")
+
+STANDINGS_COLUMNS = (
+    'season', 'team_id', 'conference', 'wins', 'losses', 'win_pct',
+    'conference_rank', 'league_rank', 'record', 'home', 'road', 'last_10'
+)
+
+
+def build_standings_records(standings_df, season: str) -> list:
+    """
+    Build one standings record per team. league_rank orders the whole league
+    by win percentage, then wins.
+    """
+    ordered = standings_df.sort_values(['WinPCT', 'WINS'], ascending=False)
+    records = []
+    for league_rank, row in enumerate(ordered.to_dict('records'), start=1):
+        records.append((
+            season,
+            int(row['TeamID']),
+            row['Conference'],
+            int(row['WINS']),
+            int(row['LOSSES']),
+            float(row['WinPCT']),
+            int(row['PlayoffRank']),
+            league_rank,
+            row.get('Record'),
+            row.get('HOME'),
+            row.get('ROAD'),
+            row.get('L10')
+        ))
+    return records
+
+
+def fetch_league_standings(season: Optional[str] = None) -> tuple:
+    """Blocking upstream fetch (requests + pandas); returns ('YYYY-YY' season, standings DataFrame)."""
+    season = games.check_valid_season(season)
+    return season, games.get_league_standings(season)
+
+
+async def refresh_standings(season: Optional[str] = None):
+    """
+    Fetch the standings of every team for a season and upsert them.
+
+    Args:
+        season: Season start year ('YYYY'); defaults to the current season
+
+    Returns:
+        Dictionary with operation result
+    """
+    try:
+        # Kept off the event loop, including the first import of the games module
+        season, standings_df = await asyncio.to_thread(fetch_league_standings, season)
+        records = build_standings_records(standings_df, season)
+
+        async with async_session() as session:
+            load_result = await bulk_load(
+                session,
+                Standings.__tablename__,
+                STANDINGS_COLUMNS,
+                records,
+                conflict_columns=('season', 'team_id'),
+                # updated_at takes its server default (now()) through EXCLUDED, only for teams whose standing changed
+                update_columns=STANDINGS_COLUMNS[2:] + ('updated_at',)
+            )
+            await session.commit()
+        standings_cache.invalidate()
+
+        print(f"Refreshed standings for {season}: {load_result['rows_written']} teams")
+        return {
+            "success": True,
+            "season": season,
+            "teams_updated": load_result["rows_written"]
+        }
+
+    except Exception as e:
+        print(f"Error refreshing standings for season {season}: {e}")
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def run_refresh_standings(season: Optional[str] = None):
+    """
+    Synchronous wrapper to run refresh_standings().
+    Use this function if you want to refresh standings from a regular Python script.
+    """
+    return asyncio.run(refresh_standings(season))
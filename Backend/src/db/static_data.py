@@ -1,9 +1,12 @@
 import json
 import asyncio
+from functools import lru_cache
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from .database import async_session
 from .models import Teams
+from .bulk_load import bulk_load, DEFAULT_BATCH_SIZE
+from .teams_cache import teams_cache
 import sys
 import os
 from pathlib import Path
@@ -26,66 +29,121 @@ except ImportError as e:
 
 
 
-def get_team_logo_path(team_abbreviation: str) -> str:
+# Mapping of team abbreviations to their original logo filenames in src/logos
+TEAM_LOGO_FILES = {
+    'ATL': 'atlanta_hawks-primary-2021.png',
+    'BOS': 'boston_celtics_logo_primary_19977628.png',
+    'BKN': 'brooklyn_nets_logo_primary_2025_sportslogosnet-1501.png',
+    'CHA': 'charlotte__hornets_-primary-2015.png',
+    'CHI': 'chicago_bulls_logo_primary_19672598.png',
+    'CLE': 'cleveland_cavaliers_logo_primary_2023_sportslogosnet-5369.png',
+    'DAL': 'dallas_mavericks-primary-2018.png',
+    'DEN': 'denver_nuggets-primary-2019.png',
+    'DET': 'detroit_pistons_logo_primary_20185710.png',
+    'GSW': 'golden_state_warriors-primary-2020.png',
+    'HOU': 'houston_rockets-primary-2020.png',
+    'IND': 'indiana-pacers-logo-primary-2026-22496872026.png',
+    'LAC': 'los_angeles_clippers_logo_primary_2025_sportslogosnet-5542.png',
+    'LAL': 'los_angeles_lakers_logo_primary_2024_sportslogosnet-7324.png',
+    'MEM': 'memphis_grizzlies-primary-2019.png',
+    'MIA': 'burm5gh2wvjti3xhei5h16k8e.gif',  # Miami Heat logo
+    'MIL': 'milwaukee_bucks_logo_primary_20165763.png',
+    'MIN': 'minnesota_timberwolves-primary-2018.png',
+    'NOP': 'new_orleans_pelicans_logo_primary_2024_sportslogosnet-9292.png',
+    'NYK': 'new_york_knicks_logo_primary_2024_sportslogosnet-7170.png',
+    'OKC': 'oklahoma-city-thunder-logo-primary-2009-9699.png',
+    'ORL': 'orlando-magic-logo-primary-2026-21794952026.png',
+    'PHI': 'philadelphia_76ers-primary-2016.png',
+    'PHX': 'phoenix_suns_logo_primary_20143696.png',
+    'POR': 'portland_trail_blazers-primary-2018.png',
+    'SAC': 'sacramento_kings-primary-2017.png',
+    'SAS': 'san_antonio_spurs-primary-2018.png',
+    'TOR': 'toronto_raptors-primary-2021.png',
+    'UTA': 'utah-jazz-logo-primary-2026-1109.png',
+    'WAS': 'washington_wizards-primary-2016.png'
+}
+
+LOGOS_DIR = Path(__file__).resolve().parent.parent / "logos"
+# Written by build_logos.py: original filename -> content-hashed WebP/AVIF variants per size
+LOGO_MANIFEST_PATH = LOGOS_DIR / "manifest.json"
+DEFAULT_LOGO_SIZE = 256
+
+
+@lru_cache(maxsize=None)
+def load_logo_manifest() -> dict:
+    """
+    Return the logo variants manifest, or an empty dict if the build step has not run.
+    Read once per process (build_logos.py clears the cache after rewriting it).
+    """
+    try:
+        with open(LOGO_MANIFEST_PATH, encoding="utf-8") as manifest_file:
+            return json.load(manifest_file)
+    except FileNotFoundError:
+        return {}
+
+
+def get_team_logo_path(team_abbreviation: str, size: int = DEFAULT_LOGO_SIZE) -> str:
     """
     Get the logo file path for a team based on its abbreviation.
+
+    Prefers the content-hashed WebP variant of the given size generated by
+    build_logos.py, falling back to the original file.
     
     Args:
         team_abbreviation: Team abbreviation (e.g., 'LAL', 'BOS')
+        size: Logo variant size in pixels
     
     Returns:
         Relative path to the logo file from the src directory
     """
-    # Mapping of team abbreviations to their logo filenames
-    logo_mapping = {
-        'ATL': 'atlanta_hawks-primary-2021.png',
-        'BOS': 'boston_celtics_logo_primary_19977628.png',
-        'BKN': 'brooklyn_nets_logo_primary_2025_sportslogosnet-1501.png',
-        'CHA': 'charlotte__hornets_-primary-2015.png',
-        'CHI': 'chicago_bulls_logo_primary_19672598.png',
-        'CLE': 'cleveland_cavaliers_logo_primary_2023_sportslogosnet-5369.png',
-        'DAL': 'dallas_mavericks-primary-2018.png',
-        'DEN': 'denver_nuggets-primary-2019.png',
-        'DET': 'detroit_pistons_logo_primary_20185710.png',
-        'GSW': 'golden_state_warriors-primary-2020.png',
-        'HOU': 'houston_rockets-primary-2020.png',
-        'IND': 'indiana-pacers-logo-primary-2026-22496872026.png',
-        'LAC': 'los_angeles_clippers_logo_primary_2025_sportslogosnet-5542.png',
-        'LAL': 'los_angeles_lakers_logo_primary_2024_sportslogosnet-7324.png',
-        'MEM': 'memphis_grizzlies-primary-2019.png',
-        'MIA': 'burm5gh2wvjti3xhei5h16k8e.gif',  # Miami Heat logo
-        'MIL': 'milwaukee_bucks_logo_primary_20165763.png',
-        'MIN': 'minnesota_timberwolves-primary-2018.png',
-        'NOP': 'new_orleans_pelicans_logo_primary_2024_sportslogosnet-9292.png',
-        'NYK': 'new_york_knicks_logo_primary_2024_sportslogosnet-7170.png',
-        'OKC': 'oklahoma-city-thunder-logo-primary-2009-9699.png',
-        'ORL': 'orlando-magic-logo-primary-2026-21794952026.png',
-        'PHI': 'philadelphia_76ers-primary-2016.png',
-        'PHX': 'phoenix_suns_logo_primary_20143696.png',
-        'POR': 'portland_trail_blazers-primary-2018.png',
-        'SAC': 'sacramento_kings-primary-2017.png',
-        'SAS': 'san_antonio_spurs-primary-2018.png',
-        'TOR': 'toronto_raptors-primary-2021.png',
-        'UTA': 'utah-jazz-logo-primary-2026-1109.png',
-        'WAS': 'washington_wizards-primary-2016.png'
-    }
-    
     # Get the filename from the mapping
-    filename = logo_mapping.get(team_abbreviation.upper())
+    filename = TEAM_LOGO_FILES.get(team_abbreviation.upper())
     
     if filename:
+        variant = load_logo_manifest().get(filename, {}).get("variants", {}).get(str(size))
+        if variant:
+            return f"logos/{variant['webp']}"
         return f"logos/{filename}"
     else:
         # Return None if no logo found for this team
         return None
 
 
-async def populate_teams_table():
+TEAM_COLUMNS = (
+    'team_id', 'full_name', 'abbreviation', 'nickname', 'city',
+    'state', 'conference', 'year_founded', 'logo'
+)
+
+
+def build_team_records(teams_data: list) -> list:
+    """
+    Build one tuple per team, in TEAM_COLUMNS order, from the NBA API teams data.
+    """
+    records = []
+    for team_data in teams_data:
+        # Get additional team details including conference
+        team_details = get_team_details_by_abbreviation(team_data['abbreviation'])
+
+        records.append((
+            team_data['id'],
+            team_data['full_name'],
+            team_data['abbreviation'],
+            team_data['nickname'],
+            team_data['city'],
+            team_data['state'],
+            team_details['conference'],
+            team_data['year_founded'],
+            get_team_logo_path(team_data['abbreviation'])
+        ))
+    return records
+
+
+async def populate_teams_table(batch_size: int = DEFAULT_BATCH_SIZE):
     """
     Populate the teams table with all NBA teams data from the NBA API.
     
     This function fetches all teams data using the get_all_teams() function
-    and inserts them into the database if they don't already exist.
+    and bulk inserts the ones that don't already exist.
     """
     try:
         # Get all teams data from NBA API
@@ -93,45 +151,19 @@ async def populate_teams_table():
         teams_data = json.loads(teams_json)
         
         async with async_session() as session:
-            # Check existing teams to avoid duplicates
-            existing_teams_result = await session.execute(select(Teams.team_id))
-            existing_team_ids = {row[0] for row in existing_teams_result.fetchall()}
-            
-            teams_added = 0
-            teams_skipped = 0
-            
-            for team_data in teams_data:
-                team_id = team_data['id']
-                
-                # Skip if team already exists
-                if team_id in existing_team_ids:
-                    teams_skipped += 1
-                    continue
-                
-                # Get additional team details including conference
-                team_details = get_team_details_by_abbreviation(team_data['abbreviation'])
-                
-                # Get logo path for this team
-                logo_path = get_team_logo_path(team_data['abbreviation'])
-                
-                # Create new team record
-                new_team = Teams(
-                    team_id=team_id,
-                    full_name=team_data['full_name'],
-                    abbreviation=team_data['abbreviation'],
-                    nickname=team_data['nickname'],
-                    city=team_data['city'],
-                    state=team_data['state'],
-                    conference=team_details['conference'],
-                    year_founded=team_data['year_founded'],
-                    logo=logo_path
-                )
-                
-                session.add(new_team)
-                teams_added += 1
-            
-            # Commit all changes
+            load_result = await bulk_load(
+                session,
+                Teams.__tablename__,
+                TEAM_COLUMNS,
+                build_team_records(teams_data),
+                conflict_columns=('team_id',),
+                batch_size=batch_size
+            )
             await session.commit()
+            teams_cache.invalidate()
+
+            teams_added = load_result["rows_written"]
+            teams_skipped = load_result["rows_skipped"]
             
             print(f"Teams population completed:")
             print(f"- Teams added: {teams_added}")
@@ -189,6 +221,7 @@ async def clear_teams_table():
             # Delete all teams
             await session.execute(Teams.__table__.delete())
             await session.commit()
+            teams_cache.invalidate()
             
             print(f"Cleared {teams_count} teams from database")
             return {
@@ -218,35 +251,26 @@ async def update_teams_data():
         teams_data = json.loads(teams_json)
         
         async with async_session() as session:
-            updated_count = 0
-            
-            for team_data in teams_data:
-                team_id = team_data['id']
-                
-                # Find existing team
-                result = await session.execute(select(Teams).where(Teams.team_id == team_id))
-                existing_team = result.scalar_one_or_none()
-                
-                if existing_team:
-                    # Get additional team details including conference
-                    team_details = get_team_details_by_abbreviation(team_data['abbreviation'])
-                    
-                    # Get logo path for this team
-                    logo_path = get_team_logo_path(team_data['abbreviation'])
-                    
-                    # Update team data
-                    existing_team.full_name = team_data['full_name']
-                    existing_team.abbreviation = team_data['abbreviation']
-                    existing_team.nickname = team_data['nickname']
-                    existing_team.city = team_data['city']
-                    existing_team.state = team_data['state']
-                    existing_team.conference = team_details['conference']
-                    existing_team.year_founded = team_data['year_founded']
-                    existing_team.logo = logo_path
-                    
-                    updated_count += 1
-            
+            # Only refresh teams that already exist, like the populate step would add them
+            existing_result = await session.execute(select(Teams.team_id))
+            existing_team_ids = set(existing_result.scalars().all())
+            records = [
+                record for record in build_team_records(teams_data)
+                if record[0] in existing_team_ids
+            ]
+
+            load_result = await bulk_load(
+                session,
+                Teams.__tablename__,
+                TEAM_COLUMNS,
+                records,
+                conflict_columns=('team_id',),
+                update_columns=TEAM_COLUMNS[1:]
+            )
             await session.commit()
+            teams_cache.invalidate()
+
+            updated_count = load_result["rows_written"]
             
             print(f"Updated {updated_count} teams in database")
             return {
@@ -262,6 +286,43 @@ async def update_teams_data():
         }
 
 
+async def update_team_logos():
+    """
+    Point every team's logo column at its current logo path (the hashed
+    variant once build_logos.py has run).
+
+    Returns:
+        Dictionary with operation result
+    """
+    try:
+        async with async_session() as session:
+            result = await session.execute(select(Teams))
+            teams = result.scalars().all()
+
+            updated_count = 0
+            for team in teams:
+                logo_path = get_team_logo_path(team.abbreviation)
+                if logo_path and team.logo != logo_path:
+                    team.logo = logo_path
+                    updated_count += 1
+
+            await session.commit()
+            teams_cache.invalidate()
+
+            print(f"Updated logo for {updated_count} teams")
+            return {
+                "success": True,
+                "logos_updated": updated_count
+            }
+
+    except Exception as e:
+        print(f"Error updating team logos: {e}")
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
 def run_populate_teams():
     """
     Synchronous wrapper to run populate_teams_table().
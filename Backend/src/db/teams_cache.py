@@ -0,0 +1,86 @@
+"""
+In-process cache of the teams table.
+
+There are only 30 teams and they almost never change, so they are loaded once
+(at API startup or on first use), validated into TeamResponse objects and
+indexed by id, abbreviation and conference. The team routes are then served
+from memory without touching the database.
+
+The cache is invalidated by the static_data populate/update/clear helpers and
+also reloads after TEAMS_CACHE_MAX_AGE seconds, so changes made by a script
+running in another process are picked up as well.
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+from typing import Dict, List, Optional
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .database import async_session
+from .models import Teams
+from .schemas import TeamResponse
+
+TEAMS_CACHE_MAX_AGE = float(os.getenv("TEAMS_CACHE_MAX_AGE", 300))
+
+_teams_adapter = TypeAdapter(List[TeamResponse])
+
+
+class TeamsCache:
+    def __init__(self, max_age: float = TEAMS_CACHE_MAX_AGE):
+        self.max_age = max_age
+        self.all: List[TeamResponse] = []
+        self.all_json: bytes = b"[]"
+        self.version: str = ""
+        self.by_id: Dict[int, TeamResponse] = {}
+        self.by_abbreviation: Dict[str, TeamResponse] = {}
+        self.by_conference: Dict[str, List[TeamResponse]] = {}
+        self.loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def is_fresh(self) -> bool:
+        return self.loaded_at is not None and time.monotonic() - self.loaded_at < self.max_age
+
+    def invalidate(self):
+        """Mark the cache stale; the next read reloads it from the database."""
+        self.loaded_at = None
+
+    async def load(self, db: Optional[AsyncSession] = None):
+        """Load every team from the database and rebuild the indexes."""
+        if db is None:
+            async with async_session() as session:
+                result = await session.execute(select(Teams).order_by(Teams.team_id))
+                rows = result.scalars().all()
+        else:
+            result = await db.execute(select(Teams).order_by(Teams.team_id))
+            rows = result.scalars().all()
+
+        teams = _teams_adapter.validate_python(rows, from_attributes=True)
+
+        by_conference: Dict[str, List[TeamResponse]] = {}
+        for team in teams:
+            by_conference.setdefault(team.conference, []).append(team)
+
+        # Swap all indexes at once so readers never see a half-built cache
+        self.all = teams
+        self.all_json = _teams_adapter.dump_json(teams)
+        self.version = hashlib.sha1(self.all_json).hexdigest()[:16]
+        self.by_id = {team.team_id: team for team in teams}
+        self.by_abbreviation = {team.abbreviation: team for team in teams}
+        self.by_conference = by_conference
+        self.loaded_at = time.monotonic()
+
+    async def ensure_loaded(self, db: Optional[AsyncSession] = None):
+        if self.is_fresh():
+            return
+        async with self._lock:
+            # Another request may have reloaded while we waited for the lock
+            if not self.is_fresh():
+                await self.load(db)
+
+
+teams_cache = TeamsCache()
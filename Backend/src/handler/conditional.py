@@ -0,0 +1,69 @@
+"""
+Conditional GET support.
+
+Routes compute a strong ETag from the data version of the tables they read
+(plus the request URL) before doing any work. When the client's
+If-None-Match matches, a 304 is returned without querying the database or
+serializing anything. Otherwise the response is rendered and tagged with the
+ETag and the route's Cache-Control policy.
+
+This is also where rate limit tokens are charged: a 304 costs COST_CACHED,
+anything else the route's declared cost. Routes that must do upstream work
+before they can compute the ETag charge up front and pass charged=True.
+"""
+
+import hashlib
+import inspect
+from typing import Callable
+
+from fastapi import Request, Response
+
+from .rate_limiter import COST_CACHED, limiter
+
+# Cache-Control policies by how often the underlying data changes
+CACHE_STATIC = "public, max-age=300, must-revalidate"
+CACHE_DYNAMIC = "public, max-age=60, must-revalidate"
+CACHE_SEARCH = "public, max-age=30, must-revalidate"
+
+
+def make_etag(request: Request, *version_parts) -> str:
+    """Strong ETag for this URL at the given data version(s)."""
+    key = ":".join(str(part) for part in (request.url.path, request.url.query, *version_parts))
+    return '"' + hashlib.sha1(key.encode("utf-8")).hexdigest()[:20] + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so W/"x" matches "x"
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates
+
+
+async def conditional_response(request: Request, etag: str, cache_control: str, render: Callable,
+                               charged: bool = False) -> Response:
+    """
+    Return 304 if the client already has `etag`, otherwise the Response built by render().
+    render may be a regular or async callable. With charged=True the route has
+    already taken its tokens (limiter.charge) and nothing more is charged.
+
+    Raises:
+        HTTPException: 429 if the client's rate limit budget cannot cover the request
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request, etag):
+        if not charged:
+            await limiter.charge(request, COST_CACHED)
+        return Response(status_code=304, headers=headers)
+
+    if not charged:
+        await limiter.charge(request)
+
+    response = render()
+    if inspect.isawaitable(response):
+        response = await response
+    response.headers.update(headers)
+    return response
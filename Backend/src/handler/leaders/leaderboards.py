@@ -0,0 +1,252 @@
+"""
+Precomputed stat leaderboards.
+
+For every season, each (stat, mode) board keeps all qualified players in a
+sorted list of (-value, player_id) keys and the top MAX_K entries
+pre-serialized into one JSON buffer with per-rank offsets. Answering a
+top-k request is a slice of that buffer, whatever the league size.
+
+When a season's stats are refetched (new games played), boards are not
+rebuilt: the new stat arrays are diffed against the previous ones and only
+players whose value, qualification or team changed are moved in the sorted
+lists (bisect). A board's JSON is re-rendered only if its top MAX_K changed.
+"""
+
+import asyncio
+import bisect
+import json
+import os
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from ..players.season_stats import SeasonStats
+
+MAX_K = int(os.getenv("LEADERS_MAX_K", 50))
+
+# Counting stats: URL name -> (season total column, per-game column)
+COUNTING_STATS = {
+    'pts': ('pts', 'ppg'),
+    'reb': ('reb', 'rpg'),
+    'oreb': ('oreb', 'orpg'),
+    'dreb': ('dreb', 'drpg'),
+    'ast': ('ast', 'apg'),
+    'stl': ('stl', 'spg'),
+    'blk': ('blk', 'bpg'),
+    'tov': ('tov', 'topg'),
+    'min': ('min', 'mpg'),
+    'fgm': ('fgm', 'fgmpg'),
+    'fga': ('fga', 'fgapg'),
+    'fg3m': ('fg3m', 'fg3mpg'),
+    'ftm': ('ftm', 'ftmpg'),
+}
+
+# Rate stats: URL name -> (column, makes column, minimum makes over 82 games)
+RATE_STATS = {
+    'fg_pct': ('fg_pct', 'fgm', 300),
+    'fg3_pct': ('fg3_pct', 'fg3m', 82),
+    'ft_pct': ('ft_pct', 'ftm', 125),
+    'efg_pct': ('efg_pct', 'fgm', 300),
+    'ts_pct': ('ts_pct', 'fgm', 300),
+    'ast_to': ('ast_to', 'ast', 125),
+}
+
+MODES = ("per_game", "total")
+RATE_MODE = "rate"
+
+# Per-game leaders must have played 70% of the games (the NBA's pre-2023 rule)
+MIN_GAMES_SHARE = 0.7
+
+
+def board_keys() -> list:
+    """Every (stat, mode) board kept per season."""
+    keys = [(stat, mode) for stat in COUNTING_STATS for mode in MODES]
+    keys += [(stat, RATE_MODE) for stat in RATE_STATS]
+    return keys
+
+
+def board_values(stats: SeasonStats, stat: str, mode: str) -> np.ndarray:
+    """The board's value for every player in `stats` (float64), NaN where not qualified."""
+    columns = stats.columns
+    # Games played so far by the teams, estimated by the most games played by anyone
+    season_games = float(columns['gp'].max()) if stats.size else 0.0
+
+    if mode == RATE_MODE:
+        column, makes, minimum = RATE_STATS[stat]
+        values = columns[column].astype(np.float64)
+        qualified = columns[makes] >= np.ceil(minimum * season_games / 82)
+    elif mode == "per_game":
+        values = columns[COUNTING_STATS[stat][1]].astype(np.float64)
+        qualified = columns['gp'] >= np.ceil(MIN_GAMES_SHARE * season_games)
+    else:
+        values = columns[COUNTING_STATS[stat][0]].astype(np.float64)
+        qualified = columns['gp'] > 0
+    return np.where(qualified, values, np.nan)
+
+
+class Leaderboard:
+    def __init__(self, season: str, stat: str, mode: str):
+        self.season = season
+        self.stat = stat
+        self.mode = mode
+        self._values: Dict[int, float] = {}
+        self._keys: list = []
+        self._top: list = []
+        header = json.dumps({"season": season, "stat": stat, "mode": mode}, separators=(",", ":"))
+        self._prefix = header[:-1].encode() + b',"leaders":['
+        # (body, per-rank offsets), swapped as one so readers never mix two renders
+        self._rendered = (b"", [0])
+
+    def _set(self, player_id: int, value: Optional[float]):
+        old = self._values.pop(player_id, None)
+        if old is not None:
+            del self._keys[bisect.bisect_left(self._keys, (-old, player_id))]
+        if value is not None:
+            self._values[player_id] = value
+            bisect.insort(self._keys, (-value, player_id))
+
+    def update(self, values: Dict[int, Optional[float]], info_changed: Iterable[int],
+               stats: SeasonStats, names_json: Dict[int, str]) -> bool:
+        """
+        Move the given players (value None: no longer qualified) and re-render
+        the top entries if they changed.
+
+        Returns:
+            True if the top MAX_K changed
+        """
+        for player_id, value in values.items():
+            self._set(player_id, value)
+
+        top = self._keys[:MAX_K]
+        top_ids = {player_id for _, player_id in top}
+        if top == self._top and top_ids.isdisjoint(info_changed):
+            return False
+        self._top = top
+        self._render(stats, names_json)
+        return True
+
+    def _render(self, stats: SeasonStats, names_json: Dict[int, str]):
+        positions = np.searchsorted(stats.player_ids, [player_id for _, player_id in self._top])
+        gp = stats.columns['gp']
+        entries, offsets, length = [], [0], 0
+        for rank, ((negative_value, player_id), position) in enumerate(zip(self._top, positions), start=1):
+            entry = (
+                f'{"," if rank > 1 else ""}{{"rank":{rank},"player_id":{player_id},'
+                f'"player_name":{names_json[player_id]},"team_abbreviation":{json.dumps(stats.team[position])},'
+                f'"gp":{int(gp[position])},"value":{round(-negative_value, 3)!r}}}'
+            ).encode()
+            entries.append(entry)
+            length += len(entry)
+            offsets.append(length)
+        self._rendered = (b"".join(entries), offsets)
+
+    def top_json(self, k: int) -> bytes:
+        """Top k entries as JSON; a slice of the pre-rendered buffer."""
+        body, offsets = self._rendered
+        end = offsets[min(k, len(offsets) - 1)]
+        return self._prefix + body[:end] + b"]}"
+
+    def __len__(self):
+        return len(self._values)
+
+
+class SeasonLeaders:
+    """All boards of one season, kept in step with the season's SeasonStats."""
+
+    def __init__(self, stats: SeasonStats):
+        self.season = stats.season
+        self.version = None
+        self.boards: Dict[tuple, Leaderboard] = {
+            key: Leaderboard(stats.season, *key) for key in board_keys()
+        }
+        self._player_ids = np.array([], dtype=np.int64)
+        self._teams = np.array([], dtype=object)
+        self._gp = np.array([], dtype=np.int64)
+        self._values: Dict[tuple, np.ndarray] = {key: np.array([]) for key in self.boards}
+        # Player names never change; JSON-encoded once per player
+        self._names_json: Dict[int, str] = {}
+        self.apply(stats)
+
+    def _align(self, old: np.ndarray, new_ids: np.ndarray, fill) -> np.ndarray:
+        """Previous per-player array re-indexed to new_ids (fill for new players)."""
+        aligned = np.full(len(new_ids), fill, dtype=old.dtype if len(old) else object)
+        if len(self._player_ids):
+            positions = np.searchsorted(self._player_ids, new_ids).clip(max=len(self._player_ids) - 1)
+            present = self._player_ids[positions] == new_ids
+            aligned[present] = old[positions[present]]
+        return aligned
+
+    def apply(self, stats: SeasonStats) -> dict:
+        """
+        Bring every board up to date with `stats`, moving only the players that changed.
+
+        Returns:
+            Dictionary with the number of board entries moved and boards re-rendered
+        """
+        new_ids = stats.player_ids
+        removed = np.setdiff1d(self._player_ids, new_ids)
+        info_changed = (
+            (self._align(self._teams, new_ids, None) != stats.team)
+            | (self._align(self._gp, new_ids, -1) != stats.columns['gp'])
+        )
+        info_changed_ids = set(new_ids[info_changed].tolist())
+        for player_id, name in zip(new_ids.tolist(), stats.player_names):
+            if player_id not in self._names_json:
+                self._names_json[player_id] = json.dumps(name)
+        removed_ids = removed.tolist()
+
+        moved = rendered = 0
+        for key, board in self.boards.items():
+            values = board_values(stats, *key)
+            old_values = self._align(self._values[key], new_ids, np.nan).astype(np.float64)
+            changed = ~((values == old_values) | (np.isnan(values) & np.isnan(old_values)))
+
+            # NaN (not qualified) is the only value not equal to itself
+            updates = {
+                player_id: (value if value == value else None)
+                for player_id, value in zip(new_ids[changed].tolist(), values[changed].tolist())
+            }
+            updates.update(dict.fromkeys(removed_ids))
+            moved += len(updates)
+            if board.update(updates, info_changed_ids, stats, self._names_json):
+                rendered += 1
+            self._values[key] = values
+
+        self._player_ids = new_ids
+        self._teams = stats.team
+        self._gp = stats.columns['gp'].astype(np.int64)
+        self.version = stats.version
+        return {"entries_moved": moved, "boards_rendered": rendered}
+
+
+class LeadersCache:
+    def __init__(self):
+        self._seasons: Dict[str, SeasonLeaders] = {}
+        self._lock = asyncio.Lock()
+
+    def peek(self, stats: Optional[SeasonStats]) -> Optional[SeasonLeaders]:
+        """The season's boards if they are already up to date with `stats`, else None."""
+        if stats is None:
+            return None
+        leaders = self._seasons.get(stats.season)
+        return leaders if leaders is not None and leaders.version == stats.version else None
+
+    async def get(self, stats: SeasonStats) -> SeasonLeaders:
+        """
+        The season's boards, incrementally updated if `stats` is newer than what they were built from.
+        Building and updating run in a worker thread, one at a time.
+        """
+        leaders = self.peek(stats)
+        if leaders is not None:
+            return leaders
+        async with self._lock:
+            leaders = self._seasons.get(stats.season)
+            if leaders is None:
+                leaders = await asyncio.to_thread(SeasonLeaders, stats)
+                self._seasons[stats.season] = leaders
+            elif leaders.version != stats.version:
+                await asyncio.to_thread(leaders.apply, stats)
+        return leaders
+
+
+leaders_cache = LeadersCache()
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Query, Request
+from . import service
+from .leaderboards import MAX_K
+from db.schemas import LeadersResponse
+from ..rate_limiter import COST_CACHED, COST_LIST, limiter
+from ..players import service as players_service
+from ..serialization import JSONBytesResponse
+from ..conditional import CACHE_DYNAMIC, conditional_response, make_etag
+
+
+router = APIRouter(
+    prefix="/leaders",
+    tags=["leaders"],
+    responses={404: {"description": "Not found"}},
+)
+
+
+@router.get("/{season}/{stat}", response_model=LeadersResponse)
+@limiter.cost(COST_CACHED)
+async def get_stat_leaders(
+    request: Request,
+    season: str,
+    stat: str,
+    k: int = Query(10, ge=1, le=MAX_K),
+    mode: str = "per_game",
+):
+    players_service.check_stats_season(season)
+    # Boards not in memory cost a league stats fetch and a build: charged up front, as a list
+    charged = not service.is_season_leaders_cached(season)
+    if charged:
+        await limiter.charge(request, COST_LIST)
+    leaders = await service.get_season_leaders(season)
+    board = service.get_leaderboard(leaders, stat, mode)
+    etag = make_etag(request, leaders.version)
+    def render():
+        return JSONBytesResponse(content=board.top_json(k))
+    return await conditional_response(request, etag, CACHE_DYNAMIC, render, charged=charged)
@@ -0,0 +1,45 @@
+from fastapi import HTTPException
+
+from .leaderboards import COUNTING_STATS, MODES, RATE_MODE, RATE_STATS, Leaderboard, SeasonLeaders, leaders_cache
+from ..players import service as players_service
+from ..players.season_stats import season_stats_cache
+
+
+def is_season_leaders_cached(season: str) -> bool:
+    """True if the season's boards are up to date in memory (no upstream fetch or build needed)."""
+    return leaders_cache.peek(season_stats_cache.peek(season)) is not None
+
+
+async def get_season_leaders(season: str) -> SeasonLeaders:
+    """
+    Leaderboards of a season, kept in step with the season stats cache.
+
+    Raises:
+        HTTPException: 400 for a malformed or unavailable season, 404 if the season has no stats
+    """
+    stats = await players_service.get_season_stats(season)
+    try:
+        return await leaders_cache.get(stats)
+    except Exception as e:
+        print(f"Error building leaderboards for season {season}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def get_leaderboard(leaders: SeasonLeaders, stat: str, mode: str) -> Leaderboard:
+    """
+    The (stat, mode) board; rate stats have a single board whatever the mode.
+
+    Raises:
+        HTTPException: 400 for an unknown stat or mode
+    """
+    stat = stat.lower()
+    if stat in RATE_STATS:
+        return leaders.boards[(stat, RATE_MODE)]
+    if stat not in COUNTING_STATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid stat: {stat}. Expected one of {list(COUNTING_STATS) + list(RATE_STATS)}"
+        )
+    if mode not in MODES:
+        raise HTTPException(status_code=400, detail=f"Invalid mode: {mode}. Expected one of {list(MODES)}")
+    return leaders.boards[(stat, mode)]
@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+
+from fastapi import APIRouter
+from db.database import engine, ENGINE_PROFILE
+from db.pool_metrics import pool_metrics
+from ..upstream import single_flight
+
+# Add the Backend/src/Functions path
+src_functions_path = Path(__file__).resolve().parents[2] / "Functions"
+if str(src_functions_path) not in sys.path:
+    sys.path.insert(0, str(src_functions_path))
+
+from nba_governor import governor
+from jobs.refresh_jobs import scheduler
+
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["metrics"],
+)
+
+
+@router.get("/db-pool")
+async def get_db_pool_metrics():
+    """Connection pool state and checkout wait times for the active engine profile."""
+    return {
+        "profile": ENGINE_PROFILE,
+        **pool_metrics.snapshot(engine.sync_engine.pool)
+    }
+
+
+@router.get("/nba-api")
+async def get_nba_api_metrics():
+    """Current stats.nba.com request rate, queued callers and throttling counts for this process."""
+    return {
+        **governor.snapshot(),
+        "upstream_pool": single_flight.snapshot()
+    }
+
+
+
+@router.get("/scheduler")
+async def get_scheduler_metrics():
+    """Refresh jobs in this process: leadership, schedules, last run and in-flight runs."""
+    return scheduler.snapshot()
@@ -1,10 +1,16 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Request
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from . import service
 from db.database import async_session
 from db.models import Players
-from db.schemas import PlayerBase, PlayerResponse
-from ..rate_limiter import limiter
+from db.schemas import (
+    PLAYER_ID_MAX, PLAYERS_BATCH_MAX, PlayerBase, PlayerBatchRequest, PlayerBatchResponse, PlayerPage,
+    PlayerResponse, PlayerSeasonStatsResponse
+)
+from ..rate_limiter import COST_LIST, COST_LOOKUP, COST_SEARCH, limiter
+from ..serialization import JSONBytesResponse, model_response, models_response
+from ..conditional import CACHE_DYNAMIC, CACHE_SEARCH, CACHE_STATIC, conditional_response, make_etag
+from db.data_versions import data_versions
 from db.database import get_db
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,18 +20,81 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-@router.get("/all", response_model=List[PlayerResponse])
-@limiter.limit("10/minute")
-async def get_all_players(request: Request, db: AsyncSession = Depends(get_db), skip: int = 0, limit: int = 100):
-    players = await service.get_players_from_db(db=db, skip=skip, limit=limit)
-    return [PlayerResponse.model_validate(player) for player in players]
+@router.get("/all", response_model=PlayerPage)
+@limiter.cost(COST_LIST)
+async def get_all_players(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    sort: str = "player_id",
+):
+    etag = make_etag(request, *await data_versions.get(db, "players"))
+    async def render():
+        return model_response(await service.get_players_from_db(db=db, cursor=cursor, limit=limit, sort=sort))
+    return await conditional_response(request, etag, CACHE_DYNAMIC, render)
+
+# Batch lookups are one query, so they cost one bounded page whatever the number of ids
+@router.get("", response_model=PlayerBatchResponse)
+@limiter.cost(COST_LIST)
+async def get_players_by_ids(
+    request: Request,
+    ids: str = Query(..., description="Comma-separated player ids, e.g. 2544,201939",
+                     max_length=PLAYERS_BATCH_MAX * (len(str(PLAYER_ID_MAX)) + 1)),
+    db: AsyncSession = Depends(get_db),
+):
+    player_ids = service.parse_player_ids(ids)
+    etag = make_etag(request, *await data_versions.get(db, "players"))
+    async def render():
+        return model_response(await service.get_players_by_ids(db=db, player_ids=player_ids))
+    return await conditional_response(request, etag, CACHE_STATIC, render)
+
+@router.post("/batch", response_model=PlayerBatchResponse)
+@limiter.cost(COST_LIST)
+async def post_players_batch(request: Request, body: PlayerBatchRequest, db: AsyncSession = Depends(get_db)):
+    # Same lookup for id lists too long for a URL; POST responses are not conditional
+    await limiter.charge(request)
+    return model_response(await service.get_players_by_ids(db=db, player_ids=body.ids))
+
+@router.get("/stats/{season}", response_model=List[PlayerSeasonStatsResponse])
+@limiter.cost(COST_LIST)
+async def get_league_season_stats(
+    request: Request,
+    season: str,
+    sort: str = "ppg",
+    order: str = "desc",
+    team: Optional[str] = None,
+    min_games: int = Query(0, ge=0),
+    min_minutes: float = Query(0, ge=0),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+):
+    service.check_stats_season(season)
+    # A season not in memory costs an upstream fetch, so it is charged before fetching
+    charged = not service.is_season_stats_cached(season)
+    if charged:
+        await limiter.charge(request)
+    stats = await service.get_season_stats(season)
+    etag = make_etag(request, stats.version)
+    def render():
+        return JSONBytesResponse(content=service.get_season_stats_json(
+            stats, sort=sort, order=order, team=team, min_games=min_games,
+            min_minutes=min_minutes, offset=offset, limit=limit
+        ))
+    return await conditional_response(request, etag, CACHE_DYNAMIC, render, charged=charged)
 
-@router.get("/{player_id}")
-@limiter.limit("10/minute")
+@router.get("/{player_id}", response_model=PlayerResponse)
+@limiter.cost(COST_LOOKUP)
 async def get_player_by_id(request: Request, player_id: int, db: AsyncSession = Depends(get_db)):
-    return await service.get_player_by_id(db=db, player_id=player_id)
+    etag = make_etag(request, *await data_versions.get(db, "players"))
+    async def render():
+        return model_response(await service.get_player_by_id(db=db, player_id=player_id))
+    return await conditional_response(request, etag, CACHE_STATIC, render)
 
-@router.get("/search/{name}")
-@limiter.limit("10/minute")
-async def get_player_by_name(request: Request, name: str, db: AsyncSession = Depends(get_db)):
-    return await service.get_player_by_name(db=db, name=name)
\ No newline at end of file
+@router.get("/search/{name}", response_model=List[PlayerResponse])
+@limiter.cost(COST_SEARCH)
+async def get_player_by_name(request: Request, name: str, db: AsyncSession = Depends(get_db), limit: int = Query(10, ge=1, le=50)):
+    etag = make_etag(request, *await data_versions.get(db, "players"))
+    async def render():
+        return models_response(PlayerResponse, await service.get_player_by_name(db=db, name=name, limit=limit))
+    return await conditional_response(request, etag, CACHE_SEARCH, render)
\ No newline at end of file
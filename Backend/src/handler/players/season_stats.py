@@ -0,0 +1,134 @@
+"""
+In-process cache of league-wide season stats.
+
+A season's stats are fetched with one upstream call (league_stats.py) in the
+upstream thread pool, with concurrent misses sharing the fetch. Each player's
+row is serialized to JSON once, and stat columns are kept as NumPy arrays.
+Filtering is then a boolean mask, sorting a memoized argsort, and the
+response a join of pre-serialized rows.
+
+Completed seasons never change and stay cached; the current season is
+refetched after LEAGUE_STATS_TTL seconds (the previous copy keeps being
+served if the refetch fails).
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+from pydantic import TypeAdapter
+
+from db.schemas import PlayerSeasonStatsResponse
+from ..upstream import single_flight
+
+# Upstream helpers live in Backend/src/Functions
+src_functions_path = Path(__file__).resolve().parents[2] / "Functions"
+if str(src_functions_path) not in sys.path:
+    sys.path.insert(0, str(src_functions_path))
+
+from helpfuncs import get_current_season, lazy_module
+
+# Imported on first use, inside the upstream thread pool (pulls in pandas and nba_api)
+league_stats = lazy_module("league_stats")
+
+LEAGUE_STATS_TTL = int(os.getenv("LEAGUE_STATS_TTL", 15 * 60))
+
+_row_adapter = TypeAdapter(PlayerSeasonStatsResponse)
+
+
+class SeasonStats:
+    def __init__(self, season: str, frame):
+        self.season = season
+        self.fetched_at = time.time()
+        self.version = f"{season}:{self.fetched_at:.3f}"
+
+        # Rows in player id order, so ties keep a stable order when sorting
+        frame = frame.sort_values('PLAYER_ID', ignore_index=True)
+        self.size = len(frame)
+        self.columns: Dict[str, np.ndarray] = {
+            name.lower(): frame[name].to_numpy() for name in league_stats.STAT_COLUMNS
+        }
+        self.player_ids = frame['PLAYER_ID'].to_numpy()
+        self.player_names = frame['PLAYER_NAME'].to_numpy(dtype=object)
+        self.team = frame['TEAM_ABBREVIATION'].to_numpy(dtype=object)
+
+        # float32 values are widened and rounded so they serialize as 0.1, not 0.10000000149
+        float_columns = frame.select_dtypes('float32').columns
+        records = frame.astype({name: 'float64' for name in float_columns}).round(3)
+        records.columns = [name.lower() for name in records.columns]
+        self.rows_json = [
+            _row_adapter.dump_json(_row_adapter.validate_python(row))
+            for row in records.to_dict('records')
+        ]
+        self._orders: Dict[tuple, np.ndarray] = {}
+
+    def order(self, sort: str, descending: bool = True) -> np.ndarray:
+        """Row indexes sorted by `sort`, memoized per (column, direction)."""
+        key = (sort, descending)
+        order = self._orders.get(key)
+        if order is None:
+            values = self.columns[sort].astype(np.float64)
+            order = np.argsort(-values if descending else values, kind='stable')
+            self._orders[key] = order
+        return order
+
+    def select_json(self, sort: str, descending: bool, team: Optional[str], min_games: int,
+                    min_minutes: float, offset: int, limit: int) -> bytes:
+        """Filtered, sorted and paginated rows as a JSON array."""
+        mask = np.ones(self.size, dtype=bool)
+        if team:
+            mask &= self.team == team
+        if min_games:
+            mask &= self.columns['gp'] >= min_games
+        if min_minutes:
+            mask &= self.columns['mpg'] >= min_minutes
+
+        order = self.order(sort, descending)
+        selected = order[mask[order]][offset:offset + limit]
+        return b"[" + b",".join(self.rows_json[index] for index in selected) + b"]"
+
+
+def build_season_stats(season: str) -> SeasonStats:
+    """Blocking: fetch and index a season's league-wide stats."""
+    return SeasonStats(season, league_stats.fetch_league_stats(season))
+
+
+class SeasonStatsCache:
+    def __init__(self, ttl: int = LEAGUE_STATS_TTL):
+        self.ttl = ttl
+        self._seasons: Dict[str, SeasonStats] = {}
+
+    def _is_fresh(self, stats: SeasonStats) -> bool:
+        if stats.season != get_current_season():
+            return True
+        return time.time() - stats.fetched_at < self.ttl
+
+    def peek(self, season: str) -> Optional[SeasonStats]:
+        """The season's stats if they can be served without an upstream fetch, else None."""
+        cached = self._seasons.get(season)
+        return cached if cached is not None and self._is_fresh(cached) else None
+
+    async def get(self, season: str) -> SeasonStats:
+        cached = self._seasons.get(season)
+        if cached is not None and self._is_fresh(cached):
+            return cached
+        try:
+            stats = await single_flight.do(("league_stats", season), build_season_stats, season)
+        except Exception as e:
+            if cached is None:
+                raise
+            print(f"Could not refresh league stats for {season}, serving the cached copy: {e}")
+            return cached
+        # Seasons with no players are not kept, so client input can't grow the cache
+        if stats.size:
+            self._seasons[season] = stats
+        return stats
+
+    def invalidate(self):
+        self._seasons = {}
+
+
+season_stats_cache = SeasonStatsCache()
@@ -2,6 +2,9 @@ from fastapi import HTTPException, Request
 import sys
 from pathlib import Path
 import json
+import base64
+import unicodedata
+from typing import List, Optional
 
 # Add NBStats root to path
 nbstats_root = Path(__file__).resolve().parents[4]
@@ -9,41 +12,129 @@ datos_path = nbstats_root / "Datos" / "Functions"
 if str(datos_path) not in sys.path:
     sys.path.insert(0, str(datos_path))
 
-from sqlalchemy import select
+from sqlalchemy import Integer, any_, bindparam, func, literal, or_, select, text, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from db.database import async_session
 from db.models import Teams
 from db import models, schemas
+from ..serialization import validate_list
+from .season_stats import SeasonStats, season_stats_cache
+from ..seasons import check_season
 
 
 # ------------------ Players Overall information ------------------ #
-async def get_players_from_db(db: AsyncSession, skip: int = 0, limit: int = 100):
+# Sort keys allowed for keyset pagination; each one is backed by an index
+# ending in player_id so (key, player_id) is unique and seekable.
+PLAYER_SORT_KEYS = {
+    "player_id": models.Players.player_id,
+    "player_name": models.Players.player_name,
+}
+
+
+def encode_players_cursor(sort: str, last_player) -> str:
+    """Build the opaque cursor pointing right after last_player for the given sort key."""
+    payload = {"s": sort, "id": last_player.player_id}
+    if sort != "player_id":
+        payload["v"] = getattr(last_player, sort)
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_players_cursor(cursor: str, sort: str) -> dict:
+    """Decode a cursor produced by encode_players_cursor, validating it matches sort."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if payload["s"] != sort or not isinstance(payload["id"], int):
+            raise ValueError("cursor does not match the requested sort")
+        if sort != "player_id" and not isinstance(payload.get("v"), str):
+            raise ValueError("cursor is missing the sort key value")
+        return payload
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def get_approximate_row_count(db: AsyncSession, table_name: str):
     """
-    Retrieve all players from the database, with pagination.
-    
+    Estimated row count from the planner statistics in pg_class.
+    Constant cost regardless of table size; None if the table was never analyzed.
+    """
+    result = await db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+        {"table_name": table_name}
+    )
+    estimate = result.scalar_one_or_none()
+    if estimate is None or estimate < 0:
+        return None
+    return estimate
+
+
+def players_page_query(sort: str, position: Optional[dict], limit: int):
+    """Keyset page query: rows after `position` (a decoded cursor) in `sort` order."""
+    sort_column = PLAYER_SORT_KEYS[sort]
+    query = select(models.Players)
+    if sort == "player_id":
+        query = query.order_by(models.Players.player_id)
+    else:
+        query = query.order_by(sort_column, models.Players.player_id)
+
+    if position:
+        if sort == "player_id":
+            query = query.where(models.Players.player_id > position["id"])
+        else:
+            query = query.where(
+                tuple_(sort_column, models.Players.player_id) > tuple_(position.get("v"), position["id"])
+            )
+    return query.limit(limit)
+
+
+async def get_players_from_db(db: AsyncSession, cursor: Optional[str] = None, limit: int = 100, sort: str = "player_id"):
+    """
+    Retrieve players from the database using keyset (cursor) pagination.
+
+    Args:
+        cursor: Opaque cursor returned as next_cursor by the previous page
+        limit: Maximum number of players to return
+        sort: Sort key, one of PLAYER_SORT_KEYS
+
     Returns:
-        List of Players objects from the database
+        PlayerPage with the players, the next cursor and an approximate total
     """
     try:
-        db_players = await db.execute(
-            select(models.Players).offset(skip).limit(limit)
-        )
+        if sort not in PLAYER_SORT_KEYS:
+            raise HTTPException(status_code=400, detail=f"Invalid sort key. Expected one of {list(PLAYER_SORT_KEYS)}")
+
+        position = decode_players_cursor(cursor, sort) if cursor else None
+
+        # One extra row tells whether there is a next page
+        db_players = await db.execute(players_page_query(sort, position, limit + 1))
         players = db_players.scalars().all()
-        if players is None:
-            raise HTTPException(status_code=404, detail="No players found in the database")
-        return players
+
+        next_cursor = None
+        if len(players) > limit:
+            players = players[:limit]
+            next_cursor = encode_players_cursor(sort, players[-1])
+
+        return schemas.PlayerPage(
+            items=validate_list(schemas.PlayerResponse, players),
+            next_cursor=next_cursor,
+            approximate_total=await get_approximate_row_count(db, models.Players.__tablename__),
+            limit=limit
+        )
     except HTTPException:
         raise
     except Exception as e:
         print(f"Error retrieving players from database: {e}")
         raise e
     
+def player_by_id_query(player_id: int):
+    return select(models.Players).where(models.Players.player_id == player_id)
+
+
 async def get_player_by_id(db: AsyncSession, player_id: int):
     try:
-        db_player = await db.execute(
-            select(models.Players)
-            .where(models.Players.player_id == player_id)
-        )
+        db_player = await db.execute(player_by_id_query(player_id))
 
         player = db_player.scalar_one_or_none()
         if player is None:
@@ -55,19 +146,176 @@ async def get_player_by_id(db: AsyncSession, player_id: int):
         print(f"Error getting player by ID: {e}")
         raise HTTPException(status_code=500, detail=str(e))
     
-async def get_player_by_name(db: AsyncSession, name: str):
+# ------------------ Batch lookup by ID ------------------ #
+def parse_player_ids(raw: str) -> List[int]:
+    """
+    Parse a comma-separated id list (?ids=2544,201939) into integers, with the
+    same bounds as PlayerBatchRequest.
+
+    Raises:
+        HTTPException: 400 for a non-integer or out-of-range id, or too many ids
+    """
+    parts = [part for part in raw.split(",") if part.strip()]
+    if not parts:
+        raise HTTPException(status_code=400, detail="At least one player id is required")
+    if len(parts) > schemas.PLAYERS_BATCH_MAX:
+        raise HTTPException(status_code=400, detail=f"At most {schemas.PLAYERS_BATCH_MAX} player ids per request")
+    try:
+        player_ids = [int(part) for part in parts]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be a comma-separated list of integers")
+    if not all(1 <= player_id <= schemas.PLAYER_ID_MAX for player_id in player_ids):
+        raise HTTPException(status_code=400, detail=f"Player ids must be between 1 and {schemas.PLAYER_ID_MAX}")
+    return player_ids
+
+
+def players_by_ids_query(player_ids: List[int]):
+    # One array parameter, so the statement is the same (and cached) whatever the number of ids
+    return select(models.Players).where(
+        models.Players.player_id == any_(bindparam("player_ids", player_ids, type_=ARRAY(Integer)))
+    )
+
+
+async def get_players_by_ids(db: AsyncSession, player_ids: List[int]):
+    """
+    Resolve many players with a single WHERE player_id = ANY(:player_ids) query.
+
+    Args:
+        player_ids: Up to PLAYERS_BATCH_MAX ids (validated by the route); duplicates are resolved once
+
+    Returns:
+        PlayerBatchResponse with the found players in input order and the ids not found
+    """
     try:
-        db_player = await db.execute(
-            select(models.Players)
-            .where(models.Players.player_name.ilike(f"%{name}%"))
+        # dict.fromkeys drops duplicates and keeps the first-seen order
+        unique_ids = list(dict.fromkeys(player_ids))
+        if not unique_ids:
+            raise HTTPException(status_code=400, detail="At least one player id is required")
+        if len(unique_ids) > schemas.PLAYERS_BATCH_MAX:
+            raise HTTPException(status_code=400, detail=f"At most {schemas.PLAYERS_BATCH_MAX} player ids per request")
+
+        db_players = await db.execute(players_by_ids_query(unique_ids))
+        found = {player.player_id: player for player in db_players.scalars().all()}
+
+        return schemas.PlayerBatchResponse(
+            items=validate_list(schemas.PlayerResponse, [found[player_id] for player_id in unique_ids if player_id in found]),
+            missing=[player_id for player_id in unique_ids if player_id not in found]
         )
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Error getting players by IDs: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def normalize_search_text(value: str) -> str:
+    """Lowercase and strip accents (Jokić -> jokic) the same way f_unaccent(lower()) does in Postgres."""
+    decomposed = unicodedata.normalize("NFKD", value.strip().lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def player_search_query(query: str, limit: int):
+    """Top-`limit` players matching an already normalized query (see normalize_search_text)."""
+    normalized_name = func.f_unaccent(func.lower(models.Players.player_name))
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    return (
+        select(models.Players)
+        .where(or_(
+            normalized_name.like(f"%{escaped}%", escape="\\"),
+            literal(query).op("<%")(normalized_name)
+        ))
+        .order_by(
+            func.word_similarity(query, normalized_name).desc(),
+            func.similarity(query, normalized_name).desc(),
+            models.Players.player_id
+        )
+        .limit(limit)
+    )
+
+
+async def get_player_by_name(db: AsyncSession, name: str, limit: int = 10):
+    """
+    Search players by name, accent-insensitive, returning the top `limit` matches.
+
+    Candidates are players whose name contains the query or is similar to it
+    (pg_trgm word similarity), both served by the ix_players_player_name_trgm
+    GIN index. They are ranked by word similarity, then overall similarity.
+    """
+    try:
+        query = normalize_search_text(name)
+        if not query:
+            raise HTTPException(status_code=400, detail="Search query cannot be empty")
+
+        db_player = await db.execute(player_search_query(query, limit))
 
         player = db_player.scalars().all()
         if not player:
             raise HTTPException(status_code=404, detail="Player not found")
-        return player
+        return validate_list(schemas.PlayerResponse, player)
     except HTTPException:
         raise 
     except Exception as e:
         print(f"Error getting player by name: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# ------------------ League-wide season stats ------------------ #
+SORT_ORDERS = ("desc", "asc")
+# First season LeagueDashPlayerStats has data for
+FIRST_STATS_SEASON = "1996-97"
+
+
+def check_stats_season(season: str):
+    """
+    Raises:
+        HTTPException: 400 unless season is a 'YYYY-YY' season from FIRST_STATS_SEASON to the current one
+    """
+    check_season(season, FIRST_STATS_SEASON)
+
+
+def is_season_stats_cached(season: str) -> bool:
+    """True if the season's stats are served from memory, without an upstream fetch."""
+    return season_stats_cache.peek(season) is not None
+
+
+async def get_season_stats(season: str) -> SeasonStats:
+    """
+    Every player's stats for a season, from the in-process season stats cache.
+
+    Raises:
+        HTTPException: 400 for a malformed or unavailable season, 404 if the season has no stats
+    """
+    check_stats_season(season)
+    try:
+        stats = await season_stats_cache.get(season)
+        if not stats.size:
+            raise HTTPException(status_code=404, detail=f"No stats found for season {season}")
+        return stats
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Error getting league stats for season {season}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def get_season_stats_json(stats: SeasonStats, sort: str = "ppg", order: str = "desc", team: Optional[str] = None,
+                          min_games: int = 0, min_minutes: float = 0, offset: int = 0, limit: int = 100) -> bytes:
+    """
+    Filter, sort and paginate a season's stats into pre-serialized JSON bytes.
+
+    Args:
+        sort: Any stat column (totals, per-game or rate), case-insensitive
+        order: 'desc' or 'asc'
+        team: Team abbreviation to filter on
+        min_games: Minimum games played
+        min_minutes: Minimum minutes per game
+    """
+    sort = sort.lower()
+    if sort not in stats.columns:
+        raise HTTPException(status_code=400, detail=f"Invalid sort key. Expected one of {list(stats.columns)}")
+    if order not in SORT_ORDERS:
+        raise HTTPException(status_code=400, detail=f"Invalid order. Expected one of {list(SORT_ORDERS)}")
+    return stats.select_json(
+        sort, order == "desc", team.upper() if team else None, min_games, min_minutes, offset, limit
+    )
@@ -1,5 +1,121 @@
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+"""
+Cost-weighted rate limiting.
 
+Every client (by IP) gets one token budget per window, RATE_LIMIT_BUDGET
+(e.g. "100/minute"), shared by all routes. Each route declares what a request
+costs with @limiter.cost(...): an in-memory team lookup costs 1, a roster join
+or an unbounded name search costs 10. A conditional request answered with 304
+costs COST_CACHED whatever the route.
 
-limiter = Limiter(key_func=get_remote_address)
\ No newline at end of file
+Tokens are charged by conditional_response() once it knows whether the
+request is a cache hit, so there is no middleware and no wrapper around the
+endpoint: the decorator only tags the function. Counters live in the
+storage from RATE_LIMIT_STORAGE_URI (see rate_limit_storage.py) using the
+sliding window counter strategy.
+"""
+
+import os
+import time
+from typing import Optional
+
+import anyio
+from fastapi import HTTPException, Request
+from limits import parse
+from limits.storage import MemoryStorage, storage_from_string
+from limits.strategies import SlidingWindowCounterRateLimiter
+
+# Registers the postgresql:// storage scheme with limits
+from . import rate_limit_storage  # noqa: F401
+
+# memory:// counts per process; redis://... or postgresql://... share the
+# counters between all workers (see rate_limit_storage.py)
+RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")
+
+# Tokens per client per window, shared by all routes
+RATE_LIMIT_BUDGET = os.getenv("RATE_LIMIT_BUDGET", "100/minute")
+
+# Route cost tiers
+COST_CACHED = 1     # 304 Not Modified, or served from an in-process cache
+COST_LOOKUP = 2     # single row by primary key
+COST_LIST = 5       # one bounded page
+COST_JOIN = 10      # roster joins
+COST_SEARCH = 10    # fuzzy name search
+
+DEFAULT_COST = COST_LIST
+
+# Seconds to use the in-memory fallback after the shared storage fails
+STORAGE_RETRY_SECONDS = 30.0
+
+
+def client_key(request: Request) -> str:
+    return request.client.host if request.client else "127.0.0.1"
+
+
+class CostLimiter:
+    def __init__(self, budget: str = RATE_LIMIT_BUDGET, storage_uri: str = RATE_LIMIT_STORAGE_URI,
+                 key_prefix: str = "nbstats"):
+        self.budget = parse(budget)
+        self.key_prefix = key_prefix
+        self.storage = storage_from_string(storage_uri)
+        self.strategy = SlidingWindowCounterRateLimiter(self.storage)
+        # Network storages block, so they are called from a worker thread
+        self.storage_is_local = isinstance(self.storage, MemoryStorage)
+        self.fallback = self.strategy if self.storage_is_local else SlidingWindowCounterRateLimiter(MemoryStorage())
+        self._storage_down_until = 0.0
+
+    def cost(self, tokens: int):
+        """Declare what a request to the decorated route costs. The endpoint is returned unchanged."""
+        def decorator(endpoint):
+            endpoint.rate_limit_cost = tokens
+            return endpoint
+        return decorator
+
+    def route_cost(self, request: Request) -> int:
+        return getattr(request.scope.get("endpoint"), "rate_limit_cost", DEFAULT_COST)
+
+    def _hit(self, key: str, tokens: int) -> bool:
+        if time.monotonic() < self._storage_down_until:
+            return self.fallback.hit(self.budget, self.key_prefix, key, cost=tokens)
+        try:
+            return self.strategy.hit(self.budget, self.key_prefix, key, cost=tokens)
+        except Exception as e:
+            # Keep limiting per process rather than failing requests
+            print(f"Rate limit storage unavailable, using in-memory limits: {e}")
+            self._storage_down_until = time.monotonic() + STORAGE_RETRY_SECONDS
+            return self.fallback.hit(self.budget, self.key_prefix, key, cost=tokens)
+
+    def _retry_after(self, key: str) -> int:
+        try:
+            stats = self.strategy.get_window_stats(self.budget, self.key_prefix, key)
+            return max(1, int(stats.reset_time - time.time()))
+        except Exception:
+            return self.budget.get_expiry()
+
+    async def charge(self, request: Request, tokens: Optional[int] = None):
+        """
+        Take `tokens` (default: the route's declared cost) from the client's budget.
+
+        Raises:
+            HTTPException: 429 with Retry-After when the budget is spent
+        """
+        if tokens is None:
+            tokens = self.route_cost(request)
+        key = client_key(request)
+
+        if self.storage_is_local:
+            if self._hit(key, tokens):
+                return
+            retry_after = self._retry_after(key)
+        else:
+            if await anyio.to_thread.run_sync(self._hit, key, tokens):
+                return
+            retry_after = await anyio.to_thread.run_sync(self._retry_after, key)
+
+        raise HTTPException(
+            status_code=429,
+            detail=f"Rate limit exceeded: {self.budget} tokens, this request costs {tokens}",
+            headers={"Retry-After": str(retry_after)}
+        )
+
+
+limiter = CostLimiter()
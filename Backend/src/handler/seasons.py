@@ -0,0 +1,42 @@
+"""
+Validation of the {season} path parameter.
+
+Season-keyed routes (league stats, leaders, standings) reject anything that
+is not a real 'YYYY-YY' season inside the range they have data for with a
+400, before touching a cache, the database or stats.nba.com.
+"""
+
+import re
+import sys
+from pathlib import Path
+from typing import Optional
+
+from fastapi import HTTPException
+
+# Upstream helpers live in Backend/src/Functions
+src_functions_path = Path(__file__).resolve().parents[1] / "Functions"
+if str(src_functions_path) not in sys.path:
+    sys.path.insert(0, str(src_functions_path))
+
+from helpfuncs import get_current_season
+
+SEASON_PATTERN = re.compile(r"^\d{4}-\d{2}$")
+
+
+def check_season(season: str, first_season: Optional[str] = None):
+    """
+    Args:
+        season: Season from the request path
+        first_season: Earliest season with data ('YYYY-YY'); seasons after the current one are always rejected
+
+    Raises:
+        HTTPException: 400 for a malformed season (including non-consecutive years) or one out of range
+    """
+    if not SEASON_PATTERN.match(season) or int(season[5:]) != (int(season[:4]) + 1) % 100:
+        raise HTTPException(status_code=400, detail=f"Invalid season format: {season}. Expected 'YYYY-YY'.")
+    current_season = get_current_season()
+    if season > current_season or (first_season and season < first_season):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid season: {season}. Available seasons are {first_season or 'up'} to {current_season}."
+        )
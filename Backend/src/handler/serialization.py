@@ -0,0 +1,53 @@
+"""
+Single-pass JSON responses.
+
+Routes return these Responses directly, so FastAPI skips its own
+response_model validation and jsonable_encoder pass: rows are validated once
+with a cached TypeAdapter and serialized straight to bytes by pydantic-core.
+response_model is still declared on the routes for the OpenAPI schema.
+"""
+
+from functools import lru_cache
+from typing import Iterable, List, Type
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+class JSONBytesResponse(Response):
+    """Response whose content is already-encoded JSON bytes."""
+    media_type = "application/json"
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+def validate_list(model: Type[BaseModel], rows: Iterable) -> list:
+    """Validate ORM rows (or model instances) into a list of `model` in one call."""
+    return list_adapter(model).validate_python(rows, from_attributes=True)
+
+
+def dump_list_json(model: Type[BaseModel], rows: Iterable) -> bytes:
+    adapter = list_adapter(model)
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+
+def dump_models_json(model: Type[BaseModel], items: List[BaseModel]) -> bytes:
+    """Serialize already-validated `model` instances without validating them again."""
+    return list_adapter(model).dump_json(items)
+
+
+def list_response(model: Type[BaseModel], rows: Iterable) -> JSONBytesResponse:
+    """Response for ORM rows: validated and serialized in one pass."""
+    return JSONBytesResponse(content=dump_list_json(model, rows))
+
+
+def models_response(model: Type[BaseModel], items: List[BaseModel]) -> JSONBytesResponse:
+    """Response for instances a service (or cache) already validated."""
+    return JSONBytesResponse(content=dump_models_json(model, items))
+
+
+def model_response(instance: BaseModel) -> JSONBytesResponse:
+    return JSONBytesResponse(content=instance.__pydantic_serializer__.to_json(instance))
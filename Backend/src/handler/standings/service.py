@@ -0,0 +1,65 @@
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.standings_cache import SeasonStandings, standings_cache
+from db.teams_cache import teams_cache
+from ..seasons import check_season
+
+CONFERENCES = ("East", "West")
+# First season refresh_standings accepts (games.check_valid_season)
+FIRST_STANDINGS_SEASON = "1980-81"
+
+
+async def get_season_standings(db: AsyncSession, season: str) -> SeasonStandings:
+    """
+    Standings for a season from the in-process standings cache.
+
+    Raises:
+        HTTPException: 400 for a malformed or out-of-range season, 404 if the season
+            has not been refreshed into the standings table
+    """
+    check_season(season, FIRST_STANDINGS_SEASON)
+    try:
+        standings = await standings_cache.get(db, season)
+        if not standings.league:
+            raise HTTPException(status_code=404, detail=f"No standings found for season {season}")
+        return standings
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Error retrieving standings for season {season}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def get_league_standings_json(db: AsyncSession, season: str) -> bytes:
+    """Whole league ordered by league rank, as pre-serialized JSON bytes."""
+    standings = await get_season_standings(db, season)
+    return standings.league_json
+
+
+async def get_conference_standings_json(db: AsyncSession, season: str, conference: str) -> bytes:
+    """One conference ordered by conference rank, as pre-serialized JSON bytes."""
+    if conference not in CONFERENCES:
+        raise HTTPException(status_code=400, detail=f"Invalid conference: {conference}. Expected one of {list(CONFERENCES)}")
+    standings = await get_season_standings(db, season)
+    return standings.conference_json.get(conference, b"[]")
+
+
+async def get_team_standing(db: AsyncSession, season: str, abbrev: str):
+    """A single team's standing (and ranks), looked up by id in the season's map."""
+    try:
+        await teams_cache.ensure_loaded(db)
+        team = teams_cache.by_abbreviation.get(abbrev)
+        if team is None:
+            raise HTTPException(status_code=404, detail="Team not found")
+
+        standings = await get_season_standings(db, season)
+        standing = standings.by_team.get(team.team_id)
+        if standing is None:
+            raise HTTPException(status_code=404, detail=f"No standing found for {abbrev} in season {season}")
+        return standing
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Error retrieving standing for team {abbrev} in season {season}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,44 @@
+from typing import List
+from fastapi import APIRouter, Depends, Request
+from . import service
+from db.schemas import StandingResponse
+from ..rate_limiter import COST_CACHED, limiter
+from ..serialization import JSONBytesResponse, model_response
+from ..conditional import CACHE_DYNAMIC, conditional_response, make_etag
+from db.data_versions import data_versions
+from db.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+router = APIRouter(
+    prefix="/standings",
+    tags=["standings"],
+    responses={404: {"description": "Not found"}},
+)
+
+
+@router.get("/{season}", response_model=List[StandingResponse])
+@limiter.cost(COST_CACHED)
+async def get_league_standings(request: Request, season: str, db: AsyncSession = Depends(get_db)):
+    etag = make_etag(request, *await data_versions.get(db, "standings"))
+    async def render():
+        return JSONBytesResponse(content=await service.get_league_standings_json(db=db, season=season))
+    return await conditional_response(request, etag, CACHE_DYNAMIC, render)
+
+
+@router.get("/{season}/conference/{conference}", response_model=List[StandingResponse])
+@limiter.cost(COST_CACHED)
+async def get_conference_standings(request: Request, season: str, conference: str, db: AsyncSession = Depends(get_db)):
+    etag = make_etag(request, *await data_versions.get(db, "standings"))
+    async def render():
+        return JSONBytesResponse(content=await service.get_conference_standings_json(db=db, season=season, conference=conference))
+    return await conditional_response(request, etag, CACHE_DYNAMIC, render)
+
+
+@router.get("/{season}/team/{abbrev}", response_model=StandingResponse)
+@limiter.cost(COST_CACHED)
+async def get_team_standing(request: Request, season: str, abbrev: str, db: AsyncSession = Depends(get_db)):
+    etag = make_etag(request, *await data_versions.get(db, "teams", "standings"))
+    async def render():
+        return model_response(await service.get_team_standing(db=db, season=season, abbrev=abbrev))
+    return await conditional_response(request, etag, CACHE_DYNAMIC, render)
@@ -0,0 +1,48 @@
+"""
+Static logo assets.
+
+Logo variants generated by build_logos.py carry a content hash in their name
+(<abbr>-<size>.<hash>.webp), so a given URL never changes content and is
+served with a one-year immutable Cache-Control. Requests for a WebP variant
+get the AVIF sibling instead when the client accepts image/avif and it was
+built. Original, unhashed files keep the default revalidation behaviour.
+"""
+
+import mimetypes
+import re
+import stat
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+
+# build_logos.py only emits hashed WebP and AVIF variants
+HASHED_ASSET = re.compile(r"\.[0-9a-f]{10}\.(webp|avif)$")
+
+# Older mimetypes tables do not know these
+mimetypes.add_type("image/webp", ".webp")
+mimetypes.add_type("image/avif", ".avif")
+
+
+class LogoStaticFiles(StaticFiles):
+    async def get_response(self, path: str, scope: Scope):
+        response = None
+        negotiable = path.endswith(".webp")
+
+        if negotiable and "image/avif" in Headers(scope=scope).get("accept", ""):
+            avif_path = path[:-len(".webp")] + ".avif"
+            full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, avif_path)
+            if stat_result and stat.S_ISREG(stat_result.st_mode):
+                response = self.file_response(full_path, stat_result, scope)
+
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        if negotiable:
+            response.headers["Vary"] = "Accept"
+        if response.status_code in (200, 304) and HASHED_ASSET.search(path):
+            response.headers["Cache-Control"] = CACHE_IMMUTABLE
+        return response
@@ -13,42 +13,57 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from db.database import async_session
 from db.models import Teams
-from db import models, schemas
+from db import models
+from db.teams_cache import teams_cache
+from ..upstream import single_flight
+
+# Upstream helpers live in Backend/src/Functions
+src_functions_path = Path(__file__).resolve().parents[2] / "Functions"
+if str(src_functions_path) not in sys.path:
+    sys.path.insert(0, str(src_functions_path))
+
+from helpfuncs import lazy_module
+
+# Imported on first use, inside the upstream thread pool (pulls in pandas and nba_api)
+team_functions = lazy_module("teams")
 
 # ------------------ Teams Overall information ------------------ #
 
 async def get_teams_from_db(db: AsyncSession):
     """
-    Retrieve all teams from the database.
+    Retrieve all teams, served from the in-process teams cache.
     
     Returns:
-        List of Teams objects from the database
+        List of TeamResponse objects
     """
     try:
-        db_teams = await db.execute(
-            select(models.Teams)
-        )
-        teams = db_teams.scalars().all()
-        if teams is None:
+        await teams_cache.ensure_loaded(db)
+        if not teams_cache.all:
             raise HTTPException(status_code=404, detail="No teams found in the database")
-        return teams
+        return teams_cache.all
     except HTTPException:
         raise
     except Exception as e:
         print(f"Error retrieving teams from database: {e}")
         raise e
     
+async def get_teams_version(db: AsyncSession) -> str:
+    """Content hash of the cached teams, used to build the team routes' ETags."""
+    await teams_cache.ensure_loaded(db)
+    return teams_cache.version
+    
+async def get_teams_json(db: AsyncSession) -> bytes:
+    """All teams as pre-serialized JSON bytes from the teams cache."""
+    await get_teams_from_db(db)
+    return teams_cache.all_json
+    
 async def get_team_by_abbreviation(db: AsyncSession, abbrev: str):
     try:
-        db_team = await db.execute(
-            select(models.Teams)
-            .where(models.Teams.abbreviation == abbrev)
-        )
-
-        team = db_team.scalar_one_or_none()
+        await teams_cache.ensure_loaded(db)
+        team = teams_cache.by_abbreviation.get(abbrev)
         if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
-        return schemas.TeamResponse.model_validate(team)
+        return team
     except HTTPException:
         raise 
     except Exception as e:
@@ -57,15 +72,8 @@ async def get_team_by_abbreviation(db: AsyncSession, abbrev: str):
     
 async def get_teams_by_conference(db: AsyncSession, conference: str):
     try:
-        db_teams = await db.execute(
-            select(models.Teams)
-            .where(models.Teams.conference == conference)
-        )
-
-        teams = db_teams.scalars().all()
-        return [schemas.TeamResponse.model_validate(team) for team in teams]
-        if teams is None:
-            raise HTTPException(status_code=404, detail="No teams found for this conference")
+        await teams_cache.ensure_loaded(db)
+        return teams_cache.by_conference.get(conference, [])
     except HTTPException:
         raise
     except Exception as e:
@@ -73,9 +81,16 @@ async def get_teams_by_conference(db: AsyncSession, conference: str):
         raise HTTPException(status_code=500, detail=str(e))
     
 # ------------------ Teams Roster Information ------------------ #
+def fetch_team_roster(team_id: int, season: str) -> list:
+    """Blocking upstream roster fetch; run through single_flight, never on the event loop."""
+    return json.loads(team_functions.get_team_roster_per_season(season=season, team_id=team_id))
+
+
 async def get_team_roster_by_abbrev(db: AsyncSession,season: str, abbrev: str):
     """
     Retrieve the roster for a specific team by its abbreviation for a given season.
+    The upstream fetch runs in the upstream thread pool, and concurrent requests
+    for the same team and season share a single fetch.
     
     Args:
         season (str): The season year (e.g., "2023-24")
@@ -85,34 +100,29 @@ async def get_team_roster_by_abbrev(db: AsyncSession,season: str, abbrev: str):
         List of player dictionaries representing the team's roster
     """
     try:
-        import sys
-        from pathlib import Path
-        
-        # Add the Backend/src/Functions path
-        src_functions_path = Path(__file__).resolve().parents[2] / "Functions"
-        if str(src_functions_path) not in sys.path:
-            sys.path.insert(0, str(src_functions_path))
-            
-        from teams import get_team_roster_per_season
-        
-        team_id_query = await db.execute(
-            select(models.Teams.team_id)
-            .where(models.Teams.abbreviation == abbrev)
-        )
-
-        team_id_result = team_id_query.scalar_one_or_none()
-        if team_id_result is None:
+        await teams_cache.ensure_loaded(db)
+        team = teams_cache.by_abbreviation.get(abbrev)
+        if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
     
-        roster_json = get_team_roster_per_season(season=season, team_id=team_id_result)
-        roster = json.loads(roster_json)
-        return roster
+        return await single_flight.do(
+            ("team_roster", team.team_id, season), fetch_team_roster, team.team_id, season
+        )
     except HTTPException:
         raise
     except Exception as e:
         print(f"Error retrieving roster for team {abbrev} in season {season}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
     
+def team_roster_query(team_id: int, season: str):
+    return (
+        select(models.Players)
+        .join(models.PlayerTeamsAssociation, models.Players.player_id == models.PlayerTeamsAssociation.player_id)
+        .where(models.PlayerTeamsAssociation.team_id == team_id)
+        .where(models.PlayerTeamsAssociation.season == season)
+    )
+
+
 async def get_team_roster_by_id_in_db(db: AsyncSession, season: str, abbrev: str):
     """
     Retrieve the roster for a specific team by its ID for a given season.
@@ -123,21 +133,14 @@ async def get_team_roster_by_id_in_db(db: AsyncSession, season: str, abbrev: str
     Returns:
         List of player dictionaries representing the team's roster
     """
+    team_id_query = None
     try:
-        team_id_query = await db.execute(
-            select(models.Teams.team_id)
-            .where(models.Teams.abbreviation == abbrev)
-        )
-
-        team_id_query = team_id_query.scalar_one_or_none()
-        if team_id_query is None:
+        await teams_cache.ensure_loaded(db)
+        team = teams_cache.by_abbreviation.get(abbrev)
+        if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
-        players = await db.execute(
-            select(models.Players)
-            .join(models.PlayerTeamsAssociation, models.Players.player_id == models.PlayerTeamsAssociation.player_id)
-            .where(models.PlayerTeamsAssociation.team_id == team_id_query)
-            .where(models.PlayerTeamsAssociation.season == season)
-        ) 
+        team_id_query = team.team_id
+        players = await db.execute(team_roster_query(team_id_query, season))
         
         players = players.scalars().all()
         if not players:
@@ -3,8 +3,11 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from . import service
 from db.database import async_session
 from db.models import Teams
-from db.schemas import TeamResponse
-from ..rate_limiter import limiter
+from db.schemas import PlayerResponse, TeamResponse
+from ..rate_limiter import COST_CACHED, COST_JOIN, limiter
+from ..serialization import JSONBytesResponse, list_response, model_response, models_response
+from ..conditional import CACHE_DYNAMIC, CACHE_STATIC, conditional_response, make_etag
+from db.data_versions import data_versions
 from db.database import get_db
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,24 +21,36 @@ router = APIRouter(
 
 
 @router.get("/all", response_model=List[TeamResponse])
-@limiter.limit("10/minute")
+@limiter.cost(COST_CACHED)
 async def get_all_teams(request: Request, db: AsyncSession = Depends(get_db)):
-    teams = await service.get_teams_from_db(db=db)
-    return [TeamResponse.model_validate(team) for team in teams]
+    etag = make_etag(request, await service.get_teams_version(db=db))
+    async def render():
+        return JSONBytesResponse(content=await service.get_teams_json(db=db))
+    return await conditional_response(request, etag, CACHE_STATIC, render)
 
 
-@router.get("/{abbrev}")
-@limiter.limit("10/minute")
+@router.get("/{abbrev}", response_model=TeamResponse)
+@limiter.cost(COST_CACHED)
 async def get_team_by_abbreviation(request: Request, abbrev: str, db: AsyncSession = Depends(get_db)):
-    return await service.get_team_by_abbreviation(db=db, abbrev=abbrev)
+    etag = make_etag(request, await service.get_teams_version(db=db))
+    async def render():
+        return model_response(await service.get_team_by_abbreviation(db=db, abbrev=abbrev))
+    return await conditional_response(request, etag, CACHE_STATIC, render)
 
-@router.get("/conference/{conference}")
-@limiter.limit("10/minute")
+@router.get("/conference/{conference}", response_model=List[TeamResponse])
+@limiter.cost(COST_CACHED)
 async def get_teams_by_conference(request: Request, conference: str, db: AsyncSession = Depends(get_db)):
-    return await service.get_teams_by_conference(db=db, conference=conference)
+    etag = make_etag(request, await service.get_teams_version(db=db))
+    async def render():
+        return models_response(TeamResponse, await service.get_teams_by_conference(db=db, conference=conference))
+    return await conditional_response(request, etag, CACHE_STATIC, render)
 
-@router.get("/{abbrev}/roster/{season}")
-@limiter.limit("10/minute")
+@router.get("/{abbrev}/roster/{season}", response_model=List[PlayerResponse])
+@limiter.cost(COST_JOIN)
 async def get_team_roster(request: Request,abbrev, season, db: AsyncSession = Depends(get_db)):
-    return await service.get_team_roster_by_id_in_db(db=db, abbrev=abbrev, season=season)
+    versions = await data_versions.get(db, "teams", "players", "player_teams_association")
+    etag = make_etag(request, *versions)
+    async def render():
+        return list_response(PlayerResponse, await service.get_team_roster_by_id_in_db(db=db, abbrev=abbrev, season=season))
+    return await conditional_response(request, etag, CACHE_DYNAMIC, render)
 
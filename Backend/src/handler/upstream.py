@@ -0,0 +1,57 @@
+"""
+Running blocking upstream calls from async routes.
+
+The Functions helpers are synchronous (requests + pandas). Called directly
+from an `async def` they stall the event loop, and every other request with
+it, until stats.nba.com answers. single_flight runs them in a bounded thread
+pool and coalesces identical calls: while a fetch for a key is in flight,
+later callers await the same result instead of starting another upstream
+request.
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable
+
+UPSTREAM_MAX_WORKERS = int(os.getenv("UPSTREAM_MAX_WORKERS", 8))
+
+_executor = ThreadPoolExecutor(max_workers=UPSTREAM_MAX_WORKERS, thread_name_prefix="upstream")
+
+
+class SingleFlight:
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable, *args, **kwargs):
+        """
+        Run fn(*args, **kwargs) in the upstream pool, or join the run already in flight for `key`.
+        Every caller gets the same result (or exception).
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            self.calls += 1
+            future = asyncio.get_running_loop().run_in_executor(
+                _executor, functools.partial(fn, *args, **kwargs)
+            )
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.coalesced += 1
+        # A cancelled caller must not cancel the fetch the others are waiting on
+        return await asyncio.shield(future)
+
+    def snapshot(self) -> dict:
+        return {
+            "max_workers": UPSTREAM_MAX_WORKERS,
+            "in_flight": len(self._in_flight),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+        }
+
+
+single_flight = SingleFlight()
+
@@ -0,0 +1,44 @@
+"""
+Scheduled refresh of upstream-derived data.
+
+Each job is incremental: it fetches only the current season and upserts (or
+inserts-if-missing) rows, so it replaces re-running the populate scripts by
+hand. Schedules can be tuned per deployment through environment variables.
+"""
+
+import asyncio
+import importlib
+import os
+import sys
+from pathlib import Path
+
+from db.games_data import refresh_games
+from db.standings_data import refresh_standings
+from .scheduler import Job, Scheduler
+
+# Add the Backend/src/Functions path
+src_functions_path = Path(__file__).resolve().parent.parent / "Functions"
+if str(src_functions_path) not in sys.path:
+    sys.path.insert(0, str(src_functions_path))
+
+STANDINGS_REFRESH_INTERVAL = float(os.getenv("STANDINGS_REFRESH_INTERVAL", 900))
+# Hourly through the US night and morning, when the day's games finish (UTC)
+GAMES_REFRESH_CRON = os.getenv("GAMES_REFRESH_CRON", "30 2-12 * * *")
+# Once a day, after the overnight transactions are published (UTC)
+ROSTERS_REFRESH_CRON = os.getenv("ROSTERS_REFRESH_CRON", "0 10 * * *")
+
+
+async def refresh_rosters():
+    """New players and (player, team, season) associations for the current season."""
+    # First import pulls in pandas and nba_api; keep it off the event loop
+    rosters = await asyncio.to_thread(importlib.import_module, "add_players_to_db")
+    return await rosters.refresh_league_rosters()
+
+
+REFRESH_JOBS = [
+    Job("standings", refresh_standings, interval=STANDINGS_REFRESH_INTERVAL, jitter=60, run_at_start=True),
+    Job("games", refresh_games, cron=GAMES_REFRESH_CRON, jitter=300),
+    Job("rosters", refresh_rosters, cron=ROSTERS_REFRESH_CRON, jitter=600),
+]
+
+scheduler = Scheduler(REFRESH_JOBS)
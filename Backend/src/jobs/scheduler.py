@@ -0,0 +1,318 @@
+"""
+In-process scheduler for background refresh jobs.
+
+Every job runs on an interval or a cron schedule (UTC), with random jitter
+added to each run so replicas and jobs do not all hit stats.nba.com on the
+same second. A job never has more than `max_concurrency` runs in flight; a
+run that comes due while the job is full is skipped, not queued.
+
+Only one process does the work: the scheduler takes a Postgres session-level
+advisory lock (pg_try_advisory_lock) on a dedicated connection and runs jobs
+only while it holds it; runs still in flight when it loses the lock are
+cancelled. The others keep serving requests and retry the lock
+every LEADER_CHECK_INTERVAL, so if the leader dies (and Postgres drops its
+connection and lock) another replica takes over.
+"""
+
+import asyncio
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+from sqlalchemy import text
+
+from db.database import engine
+
+# Advisory lock key shared by every replica that should elect a single leader
+SCHEDULER_LOCK_KEY = int(os.getenv("SCHEDULER_LOCK_KEY", 4801107))
+LEADER_CHECK_INTERVAL = float(os.getenv("SCHEDULER_LEADER_CHECK_INTERVAL", 15))
+
+
+class CronSchedule:
+    """
+    Five-field cron expression (minute hour day-of-month month day-of-week),
+    evaluated in UTC. Fields accept *, */n, a-b, a-b/n and comma lists;
+    day-of-week is 0-6 from Sunday (7 is also Sunday). As in cron, when both
+    day fields are restricted a day matches if either one does.
+    """
+
+    FIELDS = (("minute", 0, 59), ("hour", 0, 23), ("day", 1, 31), ("month", 1, 12), ("weekday", 0, 7))
+
+    def __init__(self, expression: str):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Invalid cron expression: {expression!r}. Expected 5 fields.")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            self._parse_field(part, low, high, name)
+            for part, (name, low, high) in zip(parts, self.FIELDS)
+        )
+        self.weekdays = {weekday % 7 for weekday in weekdays}
+        self.any_day = parts[2] == "*"
+        self.any_weekday = parts[4] == "*"
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int, name: str) -> Set[int]:
+        values = set()
+        for item in field.split(","):
+            base, _, step = item.partition("/")
+            step = int(step) if step else 1
+            if base == "*":
+                start, end = low, high
+            elif "-" in base:
+                start, end = (int(value) for value in base.split("-", 1))
+            else:
+                start = end = int(base)
+            if start < low or end > high or start > end or step < 1:
+                raise ValueError(f"Invalid cron {name} field: {field!r}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day = moment.day in self.days
+        weekday = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.any_day or self.any_weekday:
+            return day and weekday
+        return day or weekday
+
+    def next_after(self, moment: datetime) -> datetime:
+        """First matching minute strictly after `moment` (an aware UTC datetime)."""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # Bounded search: every valid expression matches within a few years
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                candidate = (candidate.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron expression {self.expression!r} never matches")
+
+
+class Job:
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Awaitable],
+        interval: Optional[float] = None,
+        cron: Optional[str] = None,
+        jitter: float = 0,
+        max_concurrency: int = 1,
+        run_at_start: bool = False,
+    ):
+        """
+        Args:
+            name: Unique job name (used in logs and metrics)
+            func: Coroutine function run with no arguments
+            interval: Seconds between runs (exclusive with cron)
+            cron: Five-field UTC cron expression (exclusive with interval)
+            jitter: Up to this many seconds of random delay added to every run
+            max_concurrency: Runs of this job allowed in flight at once
+            run_at_start: Run once as soon as this process becomes leader
+        """
+        if (interval is None) == (cron is None):
+            raise ValueError(f"Job {name} needs exactly one of interval or cron")
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.cron = CronSchedule(cron) if cron else None
+        self.jitter = jitter
+        self.max_concurrency = max_concurrency
+        self.run_at_start = run_at_start
+
+        self.running = 0
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0
+        self.last_started: Optional[datetime] = None
+        self.last_duration: Optional[float] = None
+        self.last_status: Optional[str] = None
+        self.next_run: Optional[datetime] = None
+
+    def next_after(self, moment: datetime) -> datetime:
+        if self.cron is not None:
+            return self.cron.next_after(moment)
+        return moment + timedelta(seconds=self.interval)
+
+    def snapshot(self) -> dict:
+        return {
+            "schedule": self.cron.expression if self.cron else f"every {self.interval:g}s",
+            "running": self.running,
+            "max_concurrency": self.max_concurrency,
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "last_started": self.last_started.isoformat() if self.last_started else None,
+            "last_duration": round(self.last_duration, 3) if self.last_duration is not None else None,
+            "last_status": self.last_status,
+            "next_run": self.next_run.isoformat() if self.next_run else None,
+        }
+
+
+class Scheduler:
+    def __init__(self, jobs: list):
+        self.jobs: Dict[str, Job] = {job.name: job for job in jobs}
+        self.is_leader = False
+        self._leader_event = asyncio.Event()
+        self._tasks: list = []
+        self._runs: Set[asyncio.Task] = set()
+        self._lock_connection = None
+
+    async def start(self):
+        """Start leader election and one loop per job (jobs run only while leader)."""
+        if self._tasks:
+            return
+        self._tasks.append(asyncio.create_task(self._leader_loop(), name="scheduler-leader"))
+        for job in self.jobs.values():
+            self._tasks.append(asyncio.create_task(self._job_loop(job), name=f"scheduler-{job.name}"))
+        print(f"Scheduler started with jobs: {', '.join(self.jobs)}")
+
+    async def stop(self):
+        """Cancel job loops and in-flight runs, then release the leader lock."""
+        for task in [*self._tasks, *self._runs]:
+            task.cancel()
+        await asyncio.gather(*self._tasks, *self._runs, return_exceptions=True)
+        self._tasks = []
+        self._runs = set()
+        await self._release_leadership()
+
+    # Leader election
+
+    async def _try_acquire(self) -> bool:
+        if self._lock_connection is None:
+            # Dedicated connection: the advisory lock lives as long as this session
+            connection = await engine.connect()
+            self._lock_connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        result = await self._lock_connection.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": SCHEDULER_LOCK_KEY}
+        )
+        return bool(result.scalar())
+
+    async def _check_connection(self):
+        """Raises if the connection holding the lock is gone (and with it, the lock)."""
+        await self._lock_connection.execute(text("SELECT 1"))
+
+    def _set_leader(self, is_leader: bool):
+        if is_leader != self.is_leader:
+            print("Scheduler: became leader" if is_leader else "Scheduler: lost leadership")
+            if not is_leader:
+                self._cancel_runs()
+        self.is_leader = is_leader
+        if is_leader:
+            self._leader_event.set()
+        else:
+            self._leader_event.clear()
+
+    def _cancel_runs(self):
+        """
+        Cancel in-flight runs once demoted: the replica that takes the lock will
+        start the same jobs. Their pending database work is rolled back; a
+        blocking upstream call already running in a thread finishes on its own.
+        """
+        for task in self._runs:
+            task.cancel()
+
+    async def _drop_connection(self):
+        connection, self._lock_connection = self._lock_connection, None
+        if connection is not None:
+            try:
+                await connection.invalidate()
+                await connection.close()
+            except Exception:
+                pass
+
+    async def _release_leadership(self):
+        if self._lock_connection is not None and self.is_leader:
+            try:
+                await self._lock_connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": SCHEDULER_LOCK_KEY}
+                )
+            except Exception as e:
+                print(f"Scheduler: could not release leader lock: {e}")
+        self._set_leader(False)
+        if self._lock_connection is not None:
+            try:
+                await self._lock_connection.close()
+            except Exception:
+                pass
+            self._lock_connection = None
+
+    async def _leader_loop(self):
+        while True:
+            try:
+                if self.is_leader:
+                    await self._check_connection()
+                else:
+                    self._set_leader(await self._try_acquire())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Scheduler: leader check failed: {e}")
+                self._set_leader(False)
+                await self._drop_connection()
+            await asyncio.sleep(LEADER_CHECK_INTERVAL)
+
+    # Job execution
+
+    async def _job_loop(self, job: Job):
+        await self._leader_event.wait()
+        if job.run_at_start:
+            self._launch(job)
+
+        while True:
+            now = datetime.now(timezone.utc)
+            job.next_run = job.next_after(now) + timedelta(seconds=random.uniform(0, job.jitter))
+            await asyncio.sleep((job.next_run - now).total_seconds())
+
+            if not self.is_leader:
+                # Wait out the follower period, then resume on the regular schedule
+                await self._leader_event.wait()
+                continue
+            self._launch(job)
+
+    def _launch(self, job: Job):
+        if job.running >= job.max_concurrency:
+            job.skipped += 1
+            print(f"Scheduler: skipping {job.name}, {job.running} run(s) still in flight")
+            return
+        job.running += 1
+        task = asyncio.create_task(self._run(job), name=f"job-{job.name}")
+        self._runs.add(task)
+        task.add_done_callback(self._runs.discard)
+
+    async def _run(self, job: Job):
+        job.last_started = datetime.now(timezone.utc)
+        started = time.monotonic()
+        try:
+            result = await job.func()
+            # Job functions follow the service convention of returning {"success": ...}
+            failed = isinstance(result, dict) and result.get("success") is False
+            job.last_status = "failed" if failed else "ok"
+            if failed:
+                job.failures += 1
+        except asyncio.CancelledError:
+            job.last_status = "cancelled"
+            raise
+        except Exception as e:
+            print(f"Scheduler: job {job.name} failed: {e}")
+            job.failures += 1
+            job.last_status = "failed"
+        finally:
+            job.runs += 1
+            job.running -= 1
+            job.last_duration = time.monotonic() - started
+
+    def snapshot(self) -> dict:
+        return {
+            "running": bool(self._tasks),
+            "is_leader": self.is_leader,
+            "lock_key": SCHEDULER_LOCK_KEY,
+            "jobs": {name: job.snapshot() for name, job in self.jobs.items()},
+        }
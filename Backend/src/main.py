@@ -1,23 +1,43 @@
 from fastapi import FastAPI
-from slowapi import _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Annotated
 from pathlib import Path
-from fastapi.staticfiles import StaticFiles
+from contextlib import asynccontextmanager
+import os
 
 
 from handler.teams import teams
 from handler.players import players
-from handler.rate_limiter import limiter
+from handler.metrics import metrics
+from handler.standings import standings
+from handler.leaders import leaders
+from handler.static_assets import LogoStaticFiles
+from db.teams_cache import teams_cache
+from jobs.refresh_jobs import scheduler
 
+# Run the refresh scheduler in the API process (otherwise use run_scheduler.py)
+SCHEDULER_ENABLED = os.getenv("SCHEDULER_ENABLED", "0").lower() in ("1", "true", "yes")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the teams cache so team routes never wait on the database
+    try:
+        await teams_cache.load()
+    except Exception as e:
+        print(f"Could not preload teams cache, it will load on first request: {e}")
+    if SCHEDULER_ENABLED:
+        await scheduler.start()
+    yield
+    if SCHEDULER_ENABLED:
+        await scheduler.stop()
 
 
 app = FastAPI(
     title="NBStats",
     description="NBA app for getting high valuable stats",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -29,22 +49,22 @@ app.add_middleware(
 )
 
 
-# Rate limiter: 
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-app.add_middleware(SlowAPIMiddleware)
+# Rate limiting is cost-based and charged per route in handler/conditional.py (no middleware)
 
-# Add logo root endpoint:
+# Add logo root endpoint (hashed variants from build_logos.py are cached as immutable):
 logos_path = Path(__file__).parent / "logos"
 logos_path.mkdir(exist_ok=True) 
 
-app.mount("/logos", StaticFiles(directory=str(logos_path)), name="logos")
+app.mount("/logos", LogoStaticFiles(directory=str(logos_path)), name="logos")
 
 # Include routers
 api_route = "/api/v1"
 
 app.include_router(teams.router, prefix=api_route, tags=["teams"])
 app.include_router(players.router, prefix=api_route, tags=["players"])
+app.include_router(standings.router, prefix=api_route, tags=["standings"])
+app.include_router(leaders.router, prefix=api_route, tags=["leaders"])
+app.include_router(metrics.router, prefix=api_route, tags=["metrics"])
 
 
 @app.get("/")